@@ -0,0 +1,73 @@
+"""Benchmark requests per second per worker for the sync and async database paths.
+
+Runs N concurrent searches on a single event loop (one uvicorn worker) against
+the replica configured in .env and compares:
+
+- sync: the previous route behaviour, GetPatientPostgress.get called inline
+  from the coroutine, which blocks the event loop for every query
+- async: GetPatientPostgressAsync.get_async awaited on the asyncpg engine
+
+Usage (from the backend directory, with a local Postgres running):
+
+    python -m benchmarks.bench_async_db_path --requests 2000 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import time
+
+from src.app.shared.domain.criteria.criteria import CriteriaParser
+from src.app.get_patient_registation.infra.persistence.slave_db.get_patient_postgress import GetPatientPostgress
+from src.app.get_patient_registation.infra.persistence.slave_db.get_patient_postgress_async import GetPatientPostgressAsync
+
+
+QUERY_PARAMS = {"orderBy": "last_name", "order": "ASC", "page": "1", "per_page": "10"}
+
+
+async def run_sync(total_requests: int, concurrency: int) -> float:
+    """Run the blocking repository from coroutines, as the route did before."""
+    repo = GetPatientPostgress()
+    criteria = CriteriaParser().dict_to_criteria(QUERY_PARAMS)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one_request():
+        async with semaphore:
+            repo.get(criteria)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one_request() for _ in range(total_requests)))
+    return time.perf_counter() - start
+
+
+async def run_async(total_requests: int, concurrency: int) -> float:
+    """Run the asyncpg-backed repository."""
+    repo = GetPatientPostgressAsync()
+    criteria = CriteriaParser().dict_to_criteria(QUERY_PARAMS)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one_request():
+        async with semaphore:
+            await repo.get_async(criteria)
+
+    # warm up the pool so connection setup is not measured
+    await asyncio.gather(*(repo.get_async(criteria) for _ in range(concurrency)))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one_request() for _ in range(total_requests)))
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+
+    for name, runner in (("sync", run_sync), ("async", run_async)):
+        elapsed = asyncio.run(runner(args.requests, args.concurrency))
+        print(f"{name:>5}: {args.requests} requests, concurrency {args.concurrency} "
+              f"-> {args.requests / elapsed:.1f} req/s per worker")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+"""Micro-benchmarks of the domain and application hot paths.
+
+Times, without a database:
+
+- patient_register: PatientRegister construction (validation) and to_primitives
+- validate_many: PatientRegister.validate_many of 1000 records, one invalid
+- criteria_parser: CriteriaParser.dict_to_criteria of a filtered, ordered page
+- criteria_to_sql: CriteriaToSQL build of the parametrized SELECT
+- domain_event: PatientRegisterCreatedEvent construction and to_primitives
+- custom_response: CustomResponse.to_JSON_response rendered by FastJSONResponse
+- create_use_case: CreatePatientRegisterUseCase.execute end to end, the sync
+  event bus persisting through an in-memory repository
+
+Each case is calibrated to run for about --min-time per sample and reports the
+best and median time per call over --repeat samples. --save stores the results
+as JSON; --compare checks them against a saved run and exits with status 1 when
+a case's best time regressed by more than --threshold. Usage (from the backend
+directory):
+
+    python -m benchmarks.bench_hot_paths --save baseline.json
+    python -m benchmarks.bench_hot_paths --compare baseline.json --threshold 0.15
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Callable
+
+from src.app.create_patient_register.application.create_patient_register import (
+    CreatePatientRegisterProps,
+    CreatePatientRegisterUseCase
+)
+from src.app.create_patient_register.application.domain_handlers.persist_on_db_master import PersistOnDbMasterHandler
+from src.app.create_patient_register.domain.events.event_bus import EventBus
+from src.app.create_patient_register.domain.events.patient_register_created_event import PatientRegisterCreatedEvent
+from src.app.create_patient_register.domain.models.patient_register import PatientRegister
+from src.app.create_patient_register.domain.repos.create_patient_repo import CreatePatientRepo
+from src.app.shared.domain.criteria.criteria import CriteriaParser
+from src.app.shared.domain.criteria.criteria_to_sql import CriteriaToSQL
+from src.app.shared.domain.models.custom_response import CustomResponse
+from src.presentation.responses import FastJSONResponse
+
+
+BODY = {
+    "uuid": "dbd13f36-c8a6-4398-8056-9560dbe0a917",
+    "first_name": "Ada",
+    "last_name": "Lovelace",
+    "date_of_birth": "1990-05-15",
+    "email": "ada.lovelace@example.com",
+    "phone_number": "1234567890",
+    "address": "123 Main St, Springfield",
+    "emergency_contact": "Charles Babbage",
+    "allergies": ["penicillin", "latex"],
+    "medical_history": ["hypertension", "asthma"],
+    "current_medications": ["lisinopril", "albuterol"],
+}
+
+QUERY_PARAMS = {
+    "0_field": "last_name", "0_operator": "EQUAL", "0_value": "Lovelace",
+    "1_field": "first_name", "1_operator": "EQUAL", "1_value": "Ada",
+    "orderBy": "date_of_birth", "order": "DESC", "page": "2", "per_page": "20",
+}
+
+
+class InMemoryCreatePatientRepo(CreatePatientRepo):
+    """Repository keeping only the number of created registers."""
+
+    def __init__(self):
+        self.created = 0
+
+    def create(self, patient_register) -> bool:
+        self.created += 1
+        return True
+
+    def create_many(self, patient_registers) -> bool:
+        self.created += len(patient_registers)
+        return True
+
+
+def bench_patient_register() -> Callable[[], object]:
+    return lambda: PatientRegister(BODY).to_primitives()
+
+
+def bench_validate_many() -> Callable[[], object]:
+    records = [{**BODY, "uuid": str(uuid.uuid4())} for _ in range(1000)]
+    records[500] = {**records[500], "email": "not-an-email"}
+    return lambda: PatientRegister.validate_many(records)
+
+
+def bench_criteria_parser() -> Callable[[], object]:
+    parser = CriteriaParser()
+    return lambda: parser.dict_to_criteria(QUERY_PARAMS)
+
+
+def bench_criteria_to_sql() -> Callable[[], object]:
+    criteria = CriteriaParser().dict_to_criteria(QUERY_PARAMS)
+
+    def build():
+        criteria_to_sql = CriteriaToSQL()
+        criteria_to_sql.set_table_name("patientregister")
+        criteria_to_sql.set_where_by_criteria(criteria)
+        criteria_to_sql.set_order_by_criteria(criteria)
+        criteria_to_sql.set_pagination_by_criteria(criteria)
+        return criteria_to_sql.get_select_query_parametrized()
+    return build
+
+
+def bench_domain_event() -> Callable[[], object]:
+    data = PatientRegister(BODY).to_primitives()
+    return lambda: PatientRegisterCreatedEvent(data=data).to_primitives()
+
+
+def bench_custom_response() -> Callable[[], object]:
+    data = PatientRegister(BODY).to_primitives()
+
+    def render():
+        response = CustomResponse.success(msg="Patient register created successfully", data=data)
+        return FastJSONResponse.from_custom_response(response).body
+    return render
+
+
+def bench_create_use_case() -> Callable[[], object]:
+    event_bus = EventBus()
+    event_bus.subscribe(PersistOnDbMasterHandler(
+        susbscribed_to=PatientRegisterCreatedEvent.event_name(),
+        create_patient_repo=InMemoryCreatePatientRepo()
+    ))
+    use_case = CreatePatientRegisterUseCase(event_bus)
+    props = CreatePatientRegisterProps(body=BODY)
+
+    def execute():
+        response = use_case.execute(props)
+        assert response.is_success, response.data
+        return response
+    return execute
+
+
+CASES: dict[str, Callable[[], Callable[[], object]]] = {
+    "patient_register": bench_patient_register,
+    "validate_many": bench_validate_many,
+    "criteria_parser": bench_criteria_parser,
+    "criteria_to_sql": bench_criteria_to_sql,
+    "domain_event": bench_domain_event,
+    "custom_response": bench_custom_response,
+    "create_use_case": bench_create_use_case,
+}
+
+
+def measure(function: Callable[[], object], repeat: int, min_time: float) -> dict:
+    """Get the best and median seconds per call over ``repeat`` calibrated samples."""
+    # calibrate -> double the loop count until one sample takes min_time
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        if time.perf_counter() - start >= min_time:
+            break
+        number *= 2
+
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        samples.append((time.perf_counter() - start) / number)
+    return {"best": min(samples), "median": statistics.median(samples), "number": number}
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """Get the cases whose best time regressed by more than ``threshold`` against the baseline."""
+    regressions = []
+    for name, result in results.items():
+        previous = baseline.get("cases", {}).get(name)
+        if previous is None:
+            continue
+        change = result["best"] / previous["best"] - 1
+        print(f"{name:>16}: {change:+.1%} vs baseline")
+        if change > threshold:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("cases", nargs="*", metavar="case", help=f"cases to run (default all): {', '.join(CASES)}")
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--min-time", type=float, default=0.2, help="seconds per sample")
+    parser.add_argument("--save", help="store the results as JSON")
+    parser.add_argument("--compare", help="JSON results of a previous run to check against")
+    parser.add_argument("--threshold", type=float, default=0.15, help="allowed slowdown, 0.15 = 15%%")
+    args = parser.parse_args()
+    unknown = set(args.cases) - set(CASES)
+    if unknown:
+        parser.error(f"unknown cases: {', '.join(sorted(unknown))}")
+
+    results = {}
+    for name in args.cases or CASES:
+        result = measure(CASES[name](), args.repeat, args.min_time)
+        results[name] = result
+        print(f"{name:>16}: best {result['best'] * 1e6:9.2f} us, median {result['median'] * 1e6:9.2f} us "
+              f"({result['number']} calls x {args.repeat})")
+
+    if args.save:
+        with open(args.save, "w") as file:
+            json.dump({
+                "created_at": datetime.now(timezone.utc).isoformat(),
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "cases": results,
+            }, file, indent=2)
+        print(f"Results saved to {args.save}")
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"Regressed by more than {args.threshold:.0%}: {', '.join(regressions)}")
+            sys.exit(1)
+        print(f"No regression beyond {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
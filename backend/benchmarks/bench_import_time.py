@@ -0,0 +1,77 @@
+"""Benchmark the time to import the app, as uvicorn reload and every worker do.
+
+Imports main in --runs fresh interpreters under python -X importtime and
+prints the median cumulative import time, whether the import built an engine
+or loaded a database driver (it must not: the engines are created in the
+lifespan), and the --top slowest modules by their own import time. Usage
+(from the backend directory, no database needed):
+
+    python -m benchmarks.bench_import_time --runs 10 --top 15
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+# run in the child after the import, prints what the import left behind
+PROBE = """
+import gc, json, sys
+import main
+from sqlalchemy import Engine
+print(json.dumps({
+    "engines": sum(isinstance(obj, Engine) for obj in gc.get_objects()),
+    "drivers": [name for name in ("psycopg2", "asyncpg") if name in sys.modules],
+}))
+"""
+
+
+def parse_importtime(stderr: str) -> dict[str, tuple[int, int]]:
+    """Get the (self, cumulative) microseconds of every module in -X importtime output."""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        modules.setdefault(name.strip(), (int(self_us), int(cumulative_us)))
+    return modules
+
+
+def import_main() -> tuple[dict[str, tuple[int, int]], dict]:
+    """Import main in a fresh interpreter and get the module times and the probe result."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROBE],
+        cwd=BACKEND_DIR, capture_output=True, text=True, check=True,
+    )
+    return parse_importtime(result.stderr), json.loads(result.stdout.splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--top", type=int, default=15, help="slowest modules to print")
+    args = parser.parse_args()
+
+    totals = []
+    self_times: dict[str, list[int]] = {}
+    for _ in range(args.runs):
+        modules, probe = import_main()
+        totals.append(modules["main"][1])
+        for name, (self_us, _) in modules.items():
+            self_times.setdefault(name, []).append(self_us)
+
+    print(f"import main: median {statistics.median(totals) / 1000:7.1f} ms, "
+          f"min {min(totals) / 1000:7.1f} ms over {args.runs} runs")
+    print(f"engines built: {probe['engines']}, drivers loaded: {probe['drivers'] or 'none'}")
+    slowest = sorted(self_times.items(), key=lambda item: statistics.median(item[1]), reverse=True)
+    for name, samples in slowest[:args.top]:
+        print(f"{statistics.median(samples) / 1000:9.2f} ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
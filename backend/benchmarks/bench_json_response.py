@@ -0,0 +1,80 @@
+"""Benchmark the rendering of search responses.
+
+Renders a successful search page (read model primitives wrapped by
+CustomResponse.to_JSON_response) with:
+
+- stdlib: the stock fastapi JSONResponse (stdlib json encoder)
+- pydantic-core: pydantic_core.to_json, the fallback encoder
+- fast: FastJSONResponse, orjson when installed
+
+No database is needed. Usage (from the backend directory):
+
+    python -m benchmarks.bench_json_response --records 100 1000 --repeat 200
+"""
+
+import argparse
+import time
+import uuid
+
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+from src.app.shared.domain.models.custom_response import CustomResponse
+from src.presentation import responses
+from src.presentation.responses import FastJSONResponse
+
+
+class PydanticCoreJSONResponse(JSONResponse):
+    """JSONResponse rendered by pydantic-core, to compare the fallback."""
+
+    def render(self, content) -> bytes:
+        return to_json(content)
+
+
+def build_response(total_records: int) -> CustomResponse:
+    """Build the use case result of a search page."""
+    data = [
+        {
+            "uuid": str(uuid.uuid4()), "first_name": "Ada", "last_name": f"Lovelace{index}",
+            "date_of_birth": "1990-01-01", "email": f"ada{index}@example.com", "phone_number": "5551234567",
+            "address": "12 Main Street", "emergency_contact": "Charles Babbage", "allergies": ["pollen"],
+            "medical_history": ["asthma"], "current_medications": ["inhaler", "albuterol"],
+        }
+        for index in range(total_records)
+    ]
+    return CustomResponse.success(msg="Patient registers found", data=data)
+
+
+def run(response_class, response: CustomResponse, repeat: int) -> float:
+    """Get the best time to render the response."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        response_json = response.to_JSON_response()
+        response_class(status_code=response_json["status_code"], content=response_json["content"])
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    fast_name = "fast (orjson)" if responses.orjson is not None else "fast (pydantic-core)"
+    for total_records in args.records:
+        response = build_response(total_records)
+        baseline = run(JSONResponse, response, args.repeat)
+        print(f"{total_records} records:")
+        for name, response_class in (
+            ("stdlib", JSONResponse),
+            ("pydantic-core", PydanticCoreJSONResponse),
+            (fast_name, FastJSONResponse),
+        ):
+            elapsed = baseline if response_class is JSONResponse else run(response_class, response, args.repeat)
+            print(f"  {name:>20}: {elapsed * 1e6:9.1f} us ({baseline / elapsed:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Benchmark the request latency overhead of logging.
+
+Sends GET /patient-register requests through the real route, criteria parser,
+use case and repository (on an in-memory SQLite table, so no database server is
+needed) with the logging pipeline configured at:
+
+- off: LOG_LEVEL=WARNING, hot-path DEBUG records are never built
+- info: LOG_LEVEL=INFO, the production default
+- debug: LOG_LEVEL=DEBUG, every hot-path record goes through the queue
+
+Records are written to os.devnull by the listener thread. Usage (from the
+backend directory):
+
+    python -m benchmarks.bench_logging_overhead --requests 2000
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import time
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+
+from src.app.shared.domain.criteria.criteria import CriteriaParser
+from src.app.shared.infra.observability.structured_logging import LoggingConfig, configure_logging
+from src.app.get_patient_registation.application.get_patient_registation_use_case import GetPatientRegistationUseCase
+from src.app.get_patient_registation.infra.persistence.slave_db.get_patient_postgress import GetPatientPostgress
+from src.presentation.dependencies import get_criteria_parser, get_get_patient_registation_use_case
+from src.presentation.routes.get_patient_registation_routes import get_patient_registation_route
+
+
+PATH = "/patient-register?0_field=last_name&0_operator=EQUAL&0_value=Lovelace&page=1&per_page=10"
+
+
+def build_app() -> FastAPI:
+    """Build the search route over a seeded in-memory table."""
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    with engine.begin() as connection:
+        connection.execute(text(
+            "CREATE TABLE patientregister (uuid TEXT, first_name TEXT, last_name TEXT, date_of_birth TEXT)"
+        ))
+        connection.execute(
+            text("INSERT INTO patientregister VALUES (:uuid, 'Ada', 'Lovelace', '1990-01-01')"),
+            [{"uuid": f"00000000-0000-4000-8000-{index:012d}"} for index in range(10)]
+        )
+
+    use_case = GetPatientRegistationUseCase(GetPatientPostgress(engine))
+    app = FastAPI()
+    app.include_router(get_patient_registation_route)
+    app.dependency_overrides[get_criteria_parser] = CriteriaParser
+    app.dependency_overrides[get_get_patient_registation_use_case] = lambda: use_case
+    return app
+
+
+async def run(app: FastAPI, total_requests: int) -> list[float]:
+    """Send the requests one at a time and collect their latencies."""
+    latencies = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for _ in range(50):
+            await client.get(PATH)
+        for _ in range(total_requests):
+            start = time.perf_counter()
+            await client.get(PATH)
+            latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    app = build_app()
+    # the benchmark client logs every request at INFO, it is not part of the server cost
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    modes = (("off", "WARNING"), ("info", "INFO"), ("debug", "DEBUG"))
+    results: dict[str, list[float]] = {name: [] for name, _ in modes}
+    with open(os.devnull, "w") as devnull:
+        # interleave the modes so warm-up and noise are spread evenly
+        for _ in range(args.rounds):
+            for name, level in modes:
+                config = LoggingConfig()
+                config.level = level
+                listener = configure_logging(config, stream=devnull)
+                results[name].extend(asyncio.run(run(app, args.requests)))
+                listener.stop()
+
+    for name, latencies in results.items():
+        latencies.sort()
+        p99 = latencies[int(len(latencies) * 0.99) - 1]
+        print(f"{name:>5}: median {statistics.median(latencies) * 1000:.3f} ms, "
+              f"p99 {p99 * 1000:.3f} ms over {len(latencies)} requests")
+
+    logging.getLogger().setLevel(logging.WARNING)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""Benchmark insert throughput and uuid lookups on a plain and a hash-partitioned table.
+
+Creates, in a scratch schema on the primary configured in .env, the patient
+register table twice:
+
+- plain: one table, as before migration 07
+- partitioned: PARTITION BY HASH (uuid) in --partitions partitions
+
+both with the primary key and the (last_name, uuid) list index, then inserts
+--rows rows into each, --batch-size rows per transaction (one multi-row
+INSERT, as CreatePatientRegisterPostgress.create_many), and times --lookups
+point lookups by uuid written as CriteriaToSQL writes them (CAST(... AS UUID)).
+The plan of one lookup is printed to show the partitions scanned. The scratch
+schema is dropped at the end. Usage (from the backend directory, with a local
+Postgres running):
+
+    python -m benchmarks.bench_partitioning --rows 1000000 --partitions 16
+"""
+
+import argparse
+import random
+import statistics
+import time
+import uuid
+from datetime import date
+
+from sqlalchemy import Engine, create_engine, text
+
+from src.app.shared.infra.persistence.main_postgres_sql.utils.connection import DatabaseConfig
+
+
+SCHEMA = "bench_partitioning"
+
+INSERT_QUERY = """
+INSERT INTO {table} (uuid, first_name, last_name, date_of_birth, email, phone_number, address, emergency_contact)
+VALUES (:uuid, :first_name, :last_name, :date_of_birth, :email, :phone_number, :address, :emergency_contact)
+"""
+
+LOOKUP_QUERY = "SELECT * FROM {table} WHERE uuid = CAST(:uuid AS UUID)"
+
+
+def build_engine() -> Engine:
+    """Build an engine on the primary whose unqualified tables resolve to the scratch schema."""
+    return create_engine(
+        DatabaseConfig().get_database_url(),
+        connect_args={"options": f"-c search_path={SCHEMA},public"},
+    )
+
+
+def create_tables(engine: Engine, partitions: int) -> None:
+    """Create the plain and the partitioned table with the same indexes."""
+    columns = "LIKE public.patientregister INCLUDING DEFAULTS INCLUDING CONSTRAINTS, PRIMARY KEY (uuid)"
+    with engine.begin() as connection:
+        connection.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        connection.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+        connection.execute(text(f"CREATE TABLE plain ({columns})"))
+        connection.execute(text(f"CREATE TABLE partitioned ({columns}) PARTITION BY HASH (uuid)"))
+        for remainder in range(partitions):
+            connection.execute(text(
+                f"CREATE TABLE partitioned_p{remainder:02d} PARTITION OF partitioned "
+                f"FOR VALUES WITH (MODULUS {partitions}, REMAINDER {remainder})"))
+        for table in ("plain", "partitioned"):
+            connection.execute(text(
+                f"CREATE INDEX {table}_last_name_uuid ON {table} (last_name, uuid) INCLUDE (first_name, date_of_birth)"))
+
+
+def build_rows(count: int) -> list[dict]:
+    """Build the rows to insert, the same for both tables."""
+    return [
+        {
+            "uuid": str(uuid.uuid4()), "first_name": "Ada", "last_name": f"Lovelace{index % 1000}",
+            "date_of_birth": date(1990, 1, 1), "email": f"ada.{index}@example.com", "phone_number": "5551234567",
+            "address": "12 Main Street", "emergency_contact": "Charles Babbage",
+        }
+        for index in range(count)
+    ]
+
+
+def insert(engine: Engine, table: str, rows: list[dict], batch_size: int) -> float:
+    """Insert the rows one batch per transaction and get the rows per second."""
+    statement = text(INSERT_QUERY.format(table=table))
+    start = time.perf_counter()
+    for offset in range(0, len(rows), batch_size):
+        with engine.begin() as connection:
+            connection.execute(statement, rows[offset:offset + batch_size])
+    elapsed = time.perf_counter() - start
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        connection.execute(text(f"VACUUM ANALYZE {table}"))
+    return len(rows) / elapsed
+
+
+def lookup(engine: Engine, table: str, uuids: list[str]) -> tuple[list[float], list[str]]:
+    """Time one lookup per uuid and get the plan of the first one."""
+    statement = LOOKUP_QUERY.format(table=table)
+    latencies = []
+    with engine.connect() as connection:
+        for value in uuids:
+            start = time.perf_counter()
+            connection.execute(text(statement), {"uuid": value}).fetchall()
+            latencies.append(time.perf_counter() - start)
+        plan = connection.execute(text(f"EXPLAIN {statement}"), {"uuid": uuids[0]}).scalars().all()
+    return latencies, plan
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--partitions", type=int, default=16)
+    parser.add_argument("--batch-size", type=int, default=1000, help="rows per insert transaction")
+    parser.add_argument("--lookups", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    rows = build_rows(args.rows)
+    uuids = [row["uuid"] for row in random.sample(rows, min(args.lookups, len(rows)))]
+
+    engine = build_engine()
+    try:
+        create_tables(engine, args.partitions)
+        for table in ("plain", "partitioned"):
+            rows_per_second = insert(engine, table, rows, args.batch_size)
+            latencies, plan = lookup(engine, table, uuids)
+            latencies.sort()
+            p50 = latencies[len(latencies) // 2]
+            p99 = latencies[int(len(latencies) * 0.99) - 1]
+            scans = [line.strip() for line in plan if "Scan" in line]
+            print(f"{table:>12}: insert {rows_per_second:9,.0f} rows/s, lookup mean "
+                  f"{statistics.mean(latencies) * 1000:6.3f} ms, p50 {p50 * 1000:6.3f} ms, p99 {p99 * 1000:6.3f} ms")
+            print(f"{'':>12}  {len(scans)} partition(s) scanned: {scans[0] if scans else plan[0]}")
+    finally:
+        with engine.begin() as connection:
+            connection.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Benchmark rows per second of the read-side row mapping.
+
+Maps synthetic replica rows (uuid and date as the driver returns them) through
+GetPatientPostgress._to_patient_registers and serializes them as the use case
+does, comparing:
+
+- validated: every row runs through PatientRegister (full Pydantic validation)
+- trusted: every row is mapped to PatientRegisterReadModel
+
+No database is needed. Usage (from the backend directory):
+
+    python -m benchmarks.bench_read_row_mapping --rows 10000 --repeat 5
+"""
+
+import argparse
+import time
+import uuid
+from datetime import date
+
+from src.app.get_patient_registation.infra.persistence.slave_db.get_patient_postgress import GetPatientPostgress
+
+
+COLUMNS = [
+    "uuid", "first_name", "last_name", "date_of_birth", "email", "phone_number",
+    "address", "emergency_contact", "allergies", "medical_history", "current_medications",
+]
+
+
+def build_rows(total_rows: int) -> list[tuple]:
+    """Build rows shaped like the psycopg2 result of SELECT * FROM patientregister."""
+    return [
+        (
+            uuid.uuid4(), "Ada", f"Lovelace{index}", date(1990, 1, 1), f"ada{index}@example.com",
+            "5551234567", "12 Main Street", "Charles Babbage", ["pollen"], ["asthma"], ["inhaler"],
+        )
+        for index in range(total_rows)
+    ]
+
+
+def run(repo: GetPatientPostgress, rows: list[tuple], repeat: int) -> float:
+    """Get the best time to map and serialize one page of rows."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        registrations = repo._to_patient_registers(COLUMNS, rows)
+        [registration.to_primitives() for registration in registrations]
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = build_rows(args.rows)
+    # the engine is never used, only the row mapping is measured
+    for name, trusted in (("validated", False), ("trusted", True)):
+        elapsed = run(GetPatientPostgress(engine=object(), trusted=trusted), rows, args.repeat)
+        print(f"{name:>9}: {args.rows} rows -> {args.rows / elapsed:,.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""Benchmark the fuzzy patient search with and without the pg_trgm indexes.
+
+Seeds --rows patient registers (1M by default) into a scratch schema on the
+primary configured in .env, then times the queries of
+GET /patient-register/search (SearchPatientPostgress) and of the CONTAINS /
+SIMILAR criteria filters:
+
+- before: the table with its primary key only (sequential scans)
+- after: with the indexes of database-main/migrations/2026-10-18/04.trigram_search_indexes.sql
+
+and prints the median time and the top plan node of every query. The scratch
+schema is dropped at the end unless --keep is given (later runs with --keep
+reuse the seeded rows). Usage (from the backend directory, with a local
+Postgres running):
+
+    python -m benchmarks.bench_trigram_search --rows 1000000 --repeat 5
+"""
+
+import argparse
+import statistics
+import time
+from pathlib import Path
+
+from sqlalchemy import Engine, create_engine, text
+
+from src.app.get_patient_registation.infra.persistence.slave_db.search_patient_postgress import (
+    SEARCH_QUERY,
+    SearchPatientPostgress
+)
+from src.app.shared.infra.persistence.main_postgres_sql.utils.connection import DatabaseConfig
+
+
+SCHEMA = "bench_trigram"
+MIGRATION = Path(__file__).resolve().parents[2] / "database-main/migrations/2026-10-18/04.trigram_search_indexes.sql"
+
+# deterministic rows: names cycle through the lists, email and phone number embed the row number
+SEED_QUERY = """
+INSERT INTO patientregister (first_name, last_name, date_of_birth, email, phone_number, address, emergency_contact)
+SELECT
+    first_names[1 + i % array_length(first_names, 1)],
+    last_names[1 + (i / 7) % array_length(last_names, 1)],
+    DATE '1940-01-01' + (i % 25000),
+    lower(first_names[1 + i % array_length(first_names, 1)]) || '.' || i || '@example.com',
+    lpad(((i::bigint * 7919) % 10000000000)::text, 10, '0'),
+    i || ' Main Street',
+    'Emergency Contact'
+FROM generate_series(1, :rows) AS i,
+    (SELECT
+        ARRAY['Ada', 'Alan', 'Grace', 'Linus', 'Margaret', 'Dennis', 'Barbara', 'Edsger', 'Frances', 'Donald',
+              'Radia', 'Ken', 'Katherine', 'John', 'Sophie', 'Niklaus'] AS first_names,
+        ARRAY['Lovelace', 'Turing', 'Hopper', 'Torvalds', 'Hamilton', 'Ritchie', 'Liskov', 'Dijkstra', 'Allen',
+              'Knuth', 'Perlman', 'Thompson', 'Johnson', 'Backus', 'Wilson', 'Wirth', 'Lee', 'Torres'] AS last_names
+    ) AS names
+"""
+
+SEARCHES = {
+    "search name typo": "ada lovlace",
+    "search email": "ada.123456@exam",
+    "search phone": "7919000",
+}
+
+FILTERS = {
+    "CONTAINS email": ("SELECT * FROM patientregister WHERE email ILIKE :value LIMIT 10", "%.424242@%"),
+    "SIMILAR last_name": ("SELECT * FROM patientregister WHERE last_name % :value LIMIT 10", "Dijkstar"),
+}
+
+
+def build_engine() -> Engine:
+    """Build an engine on the primary whose unqualified tables resolve to the scratch schema."""
+    return create_engine(
+        DatabaseConfig().get_database_url(),
+        connect_args={"options": f"-c search_path={SCHEMA},public"},
+    )
+
+
+def seed(engine: Engine, rows: int) -> None:
+    """Create the scratch table and insert the rows, unless a kept run already did."""
+    with engine.begin() as connection:
+        connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        connection.execute(text(f"CREATE SCHEMA IF NOT EXISTS {SCHEMA}"))
+        # no INCLUDING INDEXES -> the trigram indexes are only the ones set_indexes creates
+        connection.execute(text(
+            "CREATE TABLE IF NOT EXISTS patientregister"
+            " (LIKE public.patientregister INCLUDING DEFAULTS INCLUDING CONSTRAINTS, PRIMARY KEY (uuid))"))
+        existing = connection.execute(text("SELECT count(*) FROM patientregister")).scalar_one()
+        if existing != rows:
+            connection.execute(text("TRUNCATE patientregister"))
+            start = time.perf_counter()
+            connection.execute(text(SEED_QUERY), {"rows": rows})
+            print(f"seeded {rows:,} rows in {time.perf_counter() - start:.1f} s")
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        connection.execute(text("VACUUM ANALYZE patientregister"))
+
+
+def set_indexes(engine: Engine, enabled: bool) -> None:
+    """Create the trigram indexes of the migration, or drop them."""
+    statements = [
+        statement.strip() for statement in MIGRATION.read_text().split(";")
+        if "CREATE INDEX" in statement
+    ]
+    with engine.begin() as connection:
+        for statement in statements:
+            # strip the banner comments before the statement
+            statement = statement[statement.index("CREATE INDEX"):]
+            index_name = statement.split()[2]
+            connection.execute(text(f"DROP INDEX IF EXISTS {index_name}"))
+            if enabled:
+                start = time.perf_counter()
+                connection.execute(text(statement))
+                print(f"  {index_name}: built in {time.perf_counter() - start:.1f} s")
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        connection.execute(text("ANALYZE patientregister"))
+
+
+def time_query(engine: Engine, sql_query: str, params: dict, repeat: int) -> tuple[float, str]:
+    """Get the median seconds of the query and the top node of its plan."""
+    samples = []
+    with engine.connect() as connection:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            connection.execute(text(sql_query), params).fetchall()
+            samples.append(time.perf_counter() - start)
+        plan = connection.execute(text(f"EXPLAIN {sql_query}"), params).fetchall()
+    # first node below Limit / Sort, the one that shows whether an index is used
+    nodes = [row[0].strip().lstrip("-> ") for row in plan]
+    scan = next((node for node in nodes if "Scan" in node), nodes[0])
+    return statistics.median(samples), scan.split("  (")[0]
+
+
+def run(engine: Engine, repeat: int, limit: int) -> dict[str, float]:
+    """Time every search and filter query."""
+    results = {}
+    for name, query in SEARCHES.items():
+        params = SearchPatientPostgress._build_params(query, limit)
+        results[name], scan = time_query(engine, SEARCH_QUERY, params, repeat)
+        print(f"{name:>20}: {results[name] * 1000:9.2f} ms  {scan}")
+    for name, (sql_query, value) in FILTERS.items():
+        results[name], scan = time_query(engine, sql_query, {"value": value}, repeat)
+        print(f"{name:>20}: {results[name] * 1000:9.2f} ms  {scan}")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--keep", action="store_true", help="keep the scratch schema for the next run")
+    args = parser.parse_args()
+
+    engine = build_engine()
+    try:
+        seed(engine, args.rows)
+
+        print("without trigram indexes")
+        set_indexes(engine, enabled=False)
+        before = run(engine, args.repeat, args.limit)
+
+        print("with trigram indexes")
+        set_indexes(engine, enabled=True)
+        after = run(engine, args.repeat, args.limit)
+
+        for name in before:
+            print(f"{name:>20}: {before[name] / after[name]:7.1f}x faster")
+    finally:
+        if not args.keep:
+            with engine.begin() as connection:
+                connection.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Benchmark create throughput and latency with and without write coalescing.
+
+Runs --concurrency callers issuing single-record creates back to back, for
+--requests creates in total, and compares the direct insert (one transaction per
+record) with CoalescingCreatePatientRepo at several max_delay/max_batch_size
+settings:
+
+- against the primary configured in .env (CreatePatientRegisterPostgressAsync)
+- or, with --simulated-commit-ms, against an in-memory repository whose commits
+  are serialized and take that long, standing in for the WAL flush
+
+Usage (from the backend directory):
+
+    python -m benchmarks.bench_write_coalescing --requests 5000 --concurrency 100
+    python -m benchmarks.bench_write_coalescing --simulated-commit-ms 2 --settings 1:50 2:100 5:200
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+from typing import Optional
+
+from src.app.create_patient_register.domain.repos.create_patient_repo import CreatePatientRepo
+from src.app.create_patient_register.infra.persistence.main_db.coalescing_create_patient_repo import (
+    CoalescingCreatePatientRepo
+)
+
+
+def build_record() -> dict:
+    """Build the primitives of a valid patient register."""
+    return {
+        "uuid": str(uuid.uuid4()), "first_name": "Ada", "last_name": "Lovelace", "date_of_birth": "1990-01-01",
+        "email": "ada@example.com", "phone_number": "5551234567", "address": "12 Main Street",
+        "emergency_contact": "Charles Babbage", "allergies": ["pollen"], "medical_history": ["asthma"],
+        "current_medications": ["inhaler"],
+    }
+
+
+class SimulatedCreatePatientRepo(CreatePatientRepo):
+    """Repository whose commits are serialized and take a fixed time, plus a per-row cost."""
+
+    def __init__(self, commit_seconds: float, row_seconds: float = 0.00002):
+        self._commit_seconds = commit_seconds
+        self._row_seconds = row_seconds
+        self._lock: Optional[asyncio.Lock] = None
+
+    def create(self, patient_register) -> bool:
+        raise NotImplementedError()
+
+    def create_many(self, patient_registers) -> bool:
+        raise NotImplementedError()
+
+    async def create_async(self, patient_register) -> bool:
+        return (await self.create_each_async([patient_register]))[0]
+
+    async def create_each_async(self, patient_registers) -> list[bool]:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            await asyncio.sleep(self._commit_seconds + self._row_seconds * len(patient_registers))
+        return [True] * len(patient_registers)
+
+
+async def run(repo: CreatePatientRepo, total_requests: int, concurrency: int) -> tuple[float, list[float]]:
+    """Run the callers and get the elapsed time and every create latency."""
+    records = [build_record() for _ in range(total_requests)]
+    latencies = []
+
+    async def caller():
+        while records:
+            record = records.pop()
+            start = time.perf_counter()
+            if not await repo.create_async(record):
+                raise RuntimeError("create failed")
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(caller() for _ in range(concurrency)))
+    return time.perf_counter() - start, latencies
+
+
+def parse_setting(value: str) -> tuple[float, int]:
+    """Parse 'max_delay_ms:max_batch_size'."""
+    max_delay_ms, _, max_batch_size = value.partition(":")
+    return float(max_delay_ms) / 1000, int(max_batch_size or 100)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--settings", type=parse_setting, nargs="+",
+                        default=[parse_setting(value) for value in ("1:50", "2:100", "5:200")],
+                        help="max_delay_ms:max_batch_size pairs")
+    parser.add_argument("--simulated-commit-ms", type=float, help="use an in-memory repository instead of Postgres")
+    args = parser.parse_args()
+
+    async def bench():
+        if args.simulated_commit_ms is not None:
+            create_patient_repo = SimulatedCreatePatientRepo(args.simulated_commit_ms / 1000)
+        else:
+            from src.app.create_patient_register.infra.persistence.main_db.create_patient_register_postgress_async import (
+                CreatePatientRegisterPostgressAsync
+            )
+            create_patient_repo = CreatePatientRegisterPostgressAsync()
+            # warm up the pool so connection setup is not measured
+            await run(create_patient_repo, args.concurrency, args.concurrency)
+
+        runs = [("direct", create_patient_repo)] + [
+            (f"coalesce {max_delay * 1000:g}ms/{max_batch_size}",
+             CoalescingCreatePatientRepo(create_patient_repo, max_delay=max_delay, max_batch_size=max_batch_size))
+            for max_delay, max_batch_size in args.settings
+        ]
+        for name, repo in runs:
+            elapsed, latencies = await run(repo, args.requests, args.concurrency)
+            latencies.sort()
+            p50 = latencies[len(latencies) // 2]
+            p99 = latencies[int(len(latencies) * 0.99) - 1]
+            print(f"{name:>20}: {args.requests / elapsed:9,.0f} creates/s, "
+                  f"p50 {p50 * 1000:7.2f} ms, p99 {p99 * 1000:7.2f} ms")
+
+    asyncio.run(bench())
+
+
+if __name__ == "__main__":
+    main()
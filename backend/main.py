@@ -1,12 +1,42 @@
 """API v2 main module."""
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
+from src.app.shared.infra.environment import load_environment
+from src.app.shared.infra.observability.structured_logging import configure_logging
+from src.presentation.container import Container
+from src.presentation.metrics_middleware import MetricsMiddleware
+from src.presentation.responses import FastJSONResponse
 from src.presentation.routes.create_patient_register import create_patient_register_route
 from src.presentation.routes.get_patient_registation_routes import get_patient_registation_route
+from src.presentation.routes.metrics_routes import metrics_route
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Wire the container on startup, drain and dispose it on graceful shutdown.
+
+    Runs in every worker after it is forked: the configuration, the engines
+    and their warmed-up connections belong to the worker, none is created
+    when the app is imported.
+    """
+    load_environment()
+    log_listener = configure_logging()
+    container = Container()
+    app.state.container = container
+    # the worker accepts connections once startup completes -> warm pools first
+    await container.warm_up()
+    container.start()
+    yield
+    await container.shutdown()
+    # flush the records queued during shutdown
+    log_listener.stop()
 
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan, default_response_class=FastJSONResponse)
+app.add_middleware(MetricsMiddleware)
 
 
 @app.get("/")
@@ -17,3 +47,4 @@ def read_root():
 
 app.include_router(create_patient_register_route)
 app.include_router(get_patient_registation_route)
+app.include_router(metrics_route)
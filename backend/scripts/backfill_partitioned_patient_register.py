@@ -0,0 +1,156 @@
+"""Copy PatientRegister into the hash-partitioned table online, then swap them.
+
+Migration 07 creates PatientRegisterPartitioned and a trigger mirroring every
+write to PatientRegister, so rows written while this runs are already in the
+new table. This tool copies the existing rows in uuid order, one short
+transaction of --batch-size rows at a time (ON CONFLICT DO NOTHING keeps the
+mirrored rows), sleeping --sleep seconds between batches to bound the load on
+the primary and the WAL the replicas must replay. An interrupted run resumes
+with the --after uuid it printed last.
+
+With --swap, once the copy is complete, both tables are compared by count in
+one snapshot without blocking writes; the trigger keeps them in sync from then
+on, so the lock taken for the rename (waiting at most --lock-timeout) only
+checks the trigger is still enabled. PatientRegisterPartitioned is renamed to
+PatientRegister in one transaction; the previous table stays as
+PatientRegisterUnpartitioned until dropped by hand.
+
+Runs against the primary configured in .env, or --replica for a standalone
+replica/DR database (streaming replicas follow the primary on their own).
+Usage (from the backend directory):
+
+    python -m scripts.backfill_partitioned_patient_register --batch-size 5000 --sleep 0.05
+    python -m scripts.backfill_partitioned_patient_register --after 7f3c... --swap
+"""
+
+import argparse
+import time
+
+from sqlalchemy import Engine, create_engine, text
+
+from src.app.shared.infra.persistence.main_postgres_sql.utils.connection import DatabaseConfig
+from src.app.shared.infra.persistence.slave_postgres_sql.utils.slave_connection import SlaveDatabaseConfig
+
+
+COLUMNS = (
+    "uuid, first_name, last_name, date_of_birth, email, phone_number, address, "
+    "emergency_contact, allergies, medical_history, current_medications"
+)
+
+# keyset batch: the next --batch-size rows after the last copied uuid
+COPY_BATCH_QUERY = f"""
+WITH batch AS (
+    SELECT {COLUMNS} FROM PatientRegister
+    WHERE uuid > CAST(:after AS UUID)
+    ORDER BY uuid
+    LIMIT :batch_size
+), copied AS (
+    INSERT INTO PatientRegisterPartitioned ({COLUMNS})
+    SELECT {COLUMNS} FROM batch
+    ON CONFLICT (uuid) DO NOTHING
+    RETURNING 1
+)
+SELECT
+    (SELECT CAST(uuid AS TEXT) FROM batch ORDER BY uuid DESC LIMIT 1),
+    (SELECT count(*) FROM batch),
+    (SELECT count(*) FROM copied)
+"""
+
+FIRST_UUID = "00000000-0000-0000-0000-000000000000"
+
+
+def build_engine(replica: bool) -> Engine:
+    """Build a single connection engine on the primary or the replica."""
+    config = SlaveDatabaseConfig() if replica else DatabaseConfig()
+    return create_engine(config.get_database_url(), pool_size=1)
+
+
+def is_swapped(engine: Engine) -> bool:
+    """Tell whether PatientRegister is already the partitioned table."""
+    with engine.connect() as connection:
+        relkind = connection.execute(text(
+            "SELECT relkind FROM pg_class WHERE oid = CAST('patientregister' AS regclass)")).scalar_one()
+    return relkind == "p"
+
+
+def backfill(engine: Engine, after: str, batch_size: int, sleep: float) -> str:
+    """Copy the rows after the given uuid in batches and get the last uuid copied."""
+    total_read = total_copied = 0
+    start = time.perf_counter()
+    while True:
+        with engine.begin() as connection:
+            last_uuid, read, copied = connection.execute(
+                text(COPY_BATCH_QUERY), {"after": after, "batch_size": batch_size}).one()
+        if not read:
+            break
+        after = last_uuid
+        total_read += read
+        total_copied += copied
+        elapsed = time.perf_counter() - start
+        print(f"{total_read:>12,} rows read, {total_copied:>12,} copied, "
+              f"{total_read / elapsed:9,.0f} rows/s, after {after}")
+        if sleep:
+            time.sleep(sleep)
+    print(f"backfill complete: {total_read:,} rows read, {total_copied:,} copied "
+          f"in {time.perf_counter() - start:.1f} s")
+    return after
+
+
+def verify(engine: Engine) -> int:
+    """Check both tables hold the same number of rows and get it, without blocking writes."""
+    # one snapshot for both counts: every write it sees was mirrored in the same transaction
+    with engine.connect().execution_options(isolation_level="REPEATABLE READ") as connection:
+        source = connection.execute(text("SELECT count(*) FROM PatientRegister")).scalar_one()
+        target = connection.execute(text("SELECT count(*) FROM PatientRegisterPartitioned")).scalar_one()
+    if source != target:
+        raise SystemExit(f"not swapped: {source:,} rows in PatientRegister, {target:,} partitioned")
+    return target
+
+
+def swap(engine: Engine, lock_timeout: str) -> None:
+    """Check both tables hold the same rows and swap them."""
+    rows = verify(engine)
+    with engine.begin() as connection:
+        # writes queue behind the lock -> give up instead of waiting on a long transaction
+        connection.execute(text("SELECT set_config('lock_timeout', :lock_timeout, true)"),
+                           {"lock_timeout": lock_timeout})
+        connection.execute(text("LOCK TABLE PatientRegister IN ACCESS EXCLUSIVE MODE"))
+        # writes since the verified snapshot were mirrored as long as the trigger is enabled
+        mirrored = connection.execute(text(
+            "SELECT tgenabled <> 'D' FROM pg_trigger "
+            "WHERE tgrelid = CAST('patientregister' AS regclass) AND tgname = 'mirror_patient_register'"
+        )).scalar_one_or_none()
+        if not mirrored:
+            raise SystemExit("not swapped: the mirror_patient_register trigger is missing or disabled")
+        connection.execute(text("CALL swap_partitioned_patient_register()"))
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        connection.execute(text("ANALYZE PatientRegister"))
+    print(f"swapped: PatientRegister is partitioned ({rows:,} rows when verified), "
+          "the previous table is PatientRegisterUnpartitioned")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--sleep", type=float, default=0.05, help="seconds between batches")
+    parser.add_argument("--after", default=FIRST_UUID, help="resume after this uuid")
+    parser.add_argument("--swap", action="store_true", help="swap the tables once the copy is complete")
+    parser.add_argument("--lock-timeout", default="5s",
+                        help="longest wait for the swap lock, writes queue behind it meanwhile")
+    parser.add_argument("--replica", action="store_true", help="run against the SLAVE_POSTGRES_* database")
+    args = parser.parse_args()
+
+    engine = build_engine(args.replica)
+    try:
+        if is_swapped(engine):
+            print("PatientRegister is already partitioned")
+            return
+        backfill(engine, args.after, args.batch_size, args.sleep)
+        if args.swap:
+            swap(engine, args.lock_timeout)
+    finally:
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,7 @@ from typing import TypedDict, Any
 from src.app.create_patient_register.domain.events.event_bus import EventBus
 from src.app.create_patient_register.domain.events.patient_register_created_event import PatientRegisterCreatedEvent
 from src.app.create_patient_register.domain.models.patient_register import PatientRegister
+from src.app.create_patient_register.domain.repos.create_patient_repo import CreateResult
 # domain shared
 from src.app.shared.domain.models.model_error_exeption import ModelErrorException
 from src.app.shared.domain.models.custom_response import CustomResponse
@@ -28,28 +29,8 @@ class CreatePatientRegisterUseCase:
         """Execute the use case to create a patient register."""
         try:
 
-            # create necessary data
-            # aggregate UUID -> unique identifier for the event related to the patient register
-            aggregate_uuid: uuid.UUID = uuid.uuid4()
-
-            # 1. User enters patient demographic information (name, date of birth (DOB), identification number, contact details)
-            # 2. User enters initial medical information (allergies, medical history, current medications)
-            # 3. System validates the input data
-            body = props['body']
-            patient_register_data = PatientRegister(body)
-            patient_register_primitives = patient_register_data.to_primitives()
-
-            # 4. System creates the record in the primary database
-            #   - check the file -> persist_on_db_master.py
-            # 5. System replicates the record to master-slave replicas for high availability
-            #   - check the file -> persist_on_db_master.py
-            # 6. System asynchronously replicates to DR replica in geographically separated region
-
-            # create domain event && publish to event bus
-            patient_register_created_event = PatientRegisterCreatedEvent(
-                data=patient_register_primitives,
-                aggregate_uuid=aggregate_uuid
-            )
+            patient_register_created_event = self._build_patient_register_created_event(props)
+
             # publish event to event bus
             self._event_bus.publish(
                 event_name=PatientRegisterCreatedEvent.event_name(),
@@ -57,14 +38,86 @@ class CreatePatientRegisterUseCase:
             )
 
             # 7. System confirms successful creation and returns patient ID
-            return CustomResponse.success(
-                msg="Patient register created successfully",
-                data=patient_register_primitives
+            return self._build_response(patient_register_created_event)
+
+        except ModelErrorException as e:
+            primitives = e.primitives()
+            return CustomResponse.error(msg="Data validation error", data=primitives)
+        except Exception as e:
+            # Log the unexpected error for debugging purposes
+            return CustomResponse.error(msg="Internal server error", data={})
+
+    async def execute_async(self, props: CreatePatientRegisterProps) -> CustomResponse:
+        """Execute the use case to create a patient register without blocking the event loop."""
+        try:
+
+            patient_register_created_event = self._build_patient_register_created_event(props)
+
+            # publish event to event bus -> synchronous handlers are awaited
+            await self._event_bus.publish_async(
+                event_name=PatientRegisterCreatedEvent.event_name(),
+                domain_event=patient_register_created_event
             )
 
+            # 7. System confirms successful creation and returns patient ID
+            return self._build_response(patient_register_created_event)
+
         except ModelErrorException as e:
             primitives = e.primitives()
             return CustomResponse.error(msg="Data validation error", data=primitives)
         except Exception as e:
             # Log the unexpected error for debugging purposes
             return CustomResponse.error(msg="Internal server error", data={})
+
+    @staticmethod
+    def _build_response(patient_register_created_event: PatientRegisterCreatedEvent) -> CustomResponse:
+        """Build the response from the outcome of the master insert."""
+        create_result = patient_register_created_event.create_result
+        if create_result is CreateResult.FAILED:
+            return CustomResponse.error(msg="Internal server error", data={})
+        if create_result is CreateResult.CONFLICT:
+            # another record under the same uuid -> not a retry, the stored record is not echoed
+            return CustomResponse.conflict(
+                msg="Patient register already exists with other data",
+                data={"uuid": patient_register_created_event.data["uuid"]}
+            )
+        if create_result is CreateResult.ALREADY_EXISTS:
+            # a retried request -> the stored record holds this same data and was left untouched
+            return CustomResponse.success(
+                msg="Patient register already created",
+                data=patient_register_created_event.data,
+                replayed=True
+            )
+        return CustomResponse.success(
+            msg="Patient register created successfully",
+            data=patient_register_created_event.data
+        )
+
+    @staticmethod
+    def _build_patient_register_created_event(props: CreatePatientRegisterProps) -> PatientRegisterCreatedEvent:
+        """Validate the input data and build the domain event to publish."""
+
+        # create necessary data
+        # aggregate UUID -> unique identifier for the event related to the patient register
+        aggregate_uuid: uuid.UUID = uuid.uuid4()
+
+        # 1. User enters patient demographic information (name, date of birth (DOB), identification number, contact details)
+        # 2. User enters initial medical information (allergies, medical history, current medications)
+        # 3. System validates the input data
+        body = props['body']
+        patient_register_data = PatientRegister(body)
+        patient_register_primitives = patient_register_data.to_primitives()
+
+        # 4. System creates the record in the primary database
+        #   - check the file -> persist_on_db_master.py
+        # 5. System replicates the record to master-slave replicas for high availability
+        #   - check the file -> persist_on_db_master.py
+        # 6. System asynchronously replicates to DR replica in geographically separated region
+        #   - with the outbox relay enabled the primary insert also writes an outbox row in the same transaction
+        #   - check the file -> patient_register_outbox_relay.py
+
+        # create domain event
+        return PatientRegisterCreatedEvent(
+            data=patient_register_primitives,
+            aggregate_uuid=aggregate_uuid
+        )
@@ -0,0 +1,70 @@
+"""Use case for creating many patient registers in a single request."""
+
+from typing import TypedDict, Any
+
+# domain
+from src.app.create_patient_register.domain.models.patient_register import PatientRegister
+from src.app.create_patient_register.domain.repos.create_patient_repo import CreatePatientRepo, CreateResult
+# domain shared
+from src.app.shared.domain.models.model_error_exeption import ModelErrorException
+from src.app.shared.domain.models.custom_response import CustomResponse
+
+
+class CreatePatientRegisterBatchProps(TypedDict):
+    """TypedDict for batch patient register creation properties."""
+    body: list[dict[str, Any]]
+
+
+class CreatePatientRegisterBatchUseCase:
+    """Use case for creating many patient registers with one write to the primary database."""
+
+    MAX_BATCH_SIZE = 5000
+
+    def __init__(self, create_patient_repo: CreatePatientRepo, max_batch_size: int = MAX_BATCH_SIZE):
+        self._create_patient_repo = create_patient_repo
+        self._max_batch_size = max_batch_size
+
+    def execute(self, props: CreatePatientRegisterBatchProps) -> CustomResponse:
+        """Validate every record, persist the valid ones at once and report the outcome of each one."""
+        try:
+
+            body = props['body']
+            if not isinstance(body, list):
+                raise ModelErrorException(
+                    property_name="body",
+                    developer_message="Expected a list of patient registers"
+                )
+            if len(body) > self._max_batch_size:
+                raise ModelErrorException(
+                    property_name="body",
+                    developer_message=f"Batch size must not exceed {self._max_batch_size} records"
+                )
+
+            # 1. validate every record in one call, keeping track of the failing ones by index
+            valid_primitives, errors = PatientRegister.validate_many(body)
+
+            # 2. persist all the valid records in one round trip, uuids already stored are left untouched
+            results = [CreateResult.of(result) for result in self._create_patient_repo.create_each(valid_primitives)]
+            if valid_primitives and all(result is CreateResult.FAILED for result in results):
+                return CustomResponse.error(msg="Internal server error", data={})
+
+            # 3. confirm which records were created, already stored (same or other data), not stored or rejected
+            uuids_by_result = {result: [] for result in CreateResult}
+            for primitives, result in zip(valid_primitives, results):
+                uuids_by_result[result].append(primitives["uuid"])
+            return CustomResponse.success(
+                msg="Patient registers batch processed successfully",
+                data={
+                    "created": uuids_by_result[CreateResult.CREATED],
+                    "already_exists": uuids_by_result[CreateResult.ALREADY_EXISTS],
+                    "conflicts": uuids_by_result[CreateResult.CONFLICT],
+                    "failed": uuids_by_result[CreateResult.FAILED],
+                    "errors": errors
+                }
+            )
+
+        except ModelErrorException as e:
+            primitives = e.primitives()
+            return CustomResponse.error(msg="Data validation error", data=primitives)
+        except Exception as e:
+            return CustomResponse.error(msg="Internal server error", data={})
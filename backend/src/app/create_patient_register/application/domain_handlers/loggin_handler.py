@@ -1,7 +1,11 @@
 """"Logging handler for domain events in patient register creation."""
 
+import logging
+
 from src.app.shared.domain.events.domain_event_handler import DomainEventHandler
 
+logger = logging.getLogger(__name__)
+
 
 class LogginHandler(DomainEventHandler):
     """Handler for logging domain events."""
@@ -11,8 +15,11 @@ class LogginHandler(DomainEventHandler):
         super().__init__(susbscribed_to)
 
     def handle(self, event) -> None:
-        """Handle the given domain event by logging its details."""
-        print("\n\n--------- LogginHandler - BEGIN --------- ")
-        print(
-            f"Logging Event - Name: {event.domain_name}, Aggregate UUID: {event.aggregate_id if hasattr(event, 'aggregate_id') else 'N/A'}")
-        print(" --------- LogginHandler - END --------- \n\n")
+        """Handle the given domain event by logging its name and aggregate (never its data)."""
+        logger.info(
+            "domain event published",
+            extra={
+                "event_name": event.domain_name,
+                "aggregate_uuid": str(getattr(event, "aggregate_id", "N/A")),
+            }
+        )
@@ -1,12 +1,19 @@
 """Handler to persist patient register on DB master."""
 
-from src.app.create_patient_register.domain.repos.create_patient_repo import CreatePatientRepo
+import logging
+
+from src.app.create_patient_register.domain.repos.create_patient_repo import CreatePatientRepo, CreateResult
 from src.app.shared.domain.events.domain_event_handler import DomainEventHandler
 
+logger = logging.getLogger(__name__)
+
 
 class PersistOnDbMasterHandler(DomainEventHandler):
     """Handler to persist patient register on DB master."""
 
+    # the record must be on the primary before the creation is acknowledged
+    is_synchronous = True
+
     def __init__(
             self,
             susbscribed_to: str,
@@ -19,12 +26,19 @@ class PersistOnDbMasterHandler(DomainEventHandler):
     def handle(self, event) -> None:
         """Handle the given domain event by persisting the patient register on DB master."""
         try:
-            print("\n\n--------- PersistOnDbMasterHandler - BEGIN --------- ")
             patient_data = event.data
-            # self._create_patient_repo.create_patient_register(patient_data)
-            self._create_patient_repo.create(patient_data)
-            print("[successfully]: persisted patient register on DB master.")
+            event.create_result = CreateResult.of(self._create_patient_repo.create(patient_data))
+            logger.debug("persisted patient register on DB master: %s", event.create_result.value)
+        except RuntimeError as e:
+            event.create_result = CreateResult.FAILED
+            logger.error("persisting patient register on DB master failed: %r", e)
+
+    async def handle_async(self, event) -> None:
+        """Handle the given domain event by persisting the patient register on DB master without blocking."""
+        try:
+            patient_data = event.data
+            event.create_result = CreateResult.of(await self._create_patient_repo.create_async(patient_data))
+            logger.debug("persisted patient register on DB master: %s", event.create_result.value)
         except RuntimeError as e:
-            print(f"[Error]: persisting patient register on DB master: {e}")
-        finally:
-            print(" --------- PersistOnDbMasterHandler - END --------- \n\n")
+            event.create_result = CreateResult.FAILED
+            logger.error("persisting patient register on DB master failed: %r", e)
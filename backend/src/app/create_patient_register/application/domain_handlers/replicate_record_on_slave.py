@@ -1,8 +1,12 @@
 """"Domain handler to replicate patient register on DB slave."""
 
+import logging
+
 from src.app.create_patient_register.domain.repos.create_patient_repo import CreatePatientRepo
 from src.app.shared.domain.events.domain_event_handler import DomainEventHandler
 
+logger = logging.getLogger(__name__)
+
 
 class ReplicateRecordOnSlaveHandler(DomainEventHandler):
     """Handler to replicate patient register on DB slave."""
@@ -19,11 +23,8 @@ class ReplicateRecordOnSlaveHandler(DomainEventHandler):
     def handle(self, event) -> None:
         """Handle the given domain event by replicating the patient register on DB slave."""
         try:
-            print("\n\n--------- ReplicateRecordOnSlaveHandler - BEGIN --------- ")
             registe_data = event.data
             self._replicate_patient_repo.create(registe_data)
-            print("[successfully]: replicated patient register on DB slave.")
+            logger.debug("replicated patient register on DB slave")
         except RuntimeError as e:
-            print(f"[Error]: replicating patient register on DB slave: {e}")
-        finally:
-            print(" --------- ReplicateRecordOnSlaveHandler - END --------- \n\n")
+            logger.error("replicating patient register on DB slave failed: %r", e)
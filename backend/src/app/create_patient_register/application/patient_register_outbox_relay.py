@@ -0,0 +1,119 @@
+"""Background relay that drains the patient register outbox to the replica/DR targets."""
+
+import logging
+import os
+import threading
+from typing import Any, Optional
+
+# domain
+from src.app.create_patient_register.domain.repos.create_patient_repo import CreatePatientRepo
+from src.app.create_patient_register.domain.repos.patient_register_outbox_repo import PatientRegisterOutboxRepo
+
+logger = logging.getLogger(__name__)
+
+
+class PatientRegisterOutboxRelayConfig:
+    """Outbox relay configuration with environment-based defaults."""
+
+    def __init__(self):
+        self.enabled = self._get_env_var(
+            'OUTBOX_RELAY_ENABLED', 'false').lower() == 'true'
+        self.batch_size = int(self._get_env_var('OUTBOX_RELAY_BATCH_SIZE', '500'))
+        self.poll_interval = float(
+            self._get_env_var('OUTBOX_RELAY_POLL_INTERVAL', '1'))
+        # rejections after which a message is dead-lettered (kept, no longer delivered)
+        self.max_attempts = int(self._get_env_var('OUTBOX_RELAY_MAX_ATTEMPTS', '5'))
+
+    @staticmethod
+    def _get_env_var(key: str, default: str) -> str:
+        """Get environment variable with fallback to default value."""
+        value = os.getenv(key)
+        if value is None:
+            return default
+        return value
+
+
+class PatientRegisterOutboxRelay:
+    """Drain the outbox in batches and deliver every batch to all the targets.
+
+    Delivery is at-least-once: a message is removed from the outbox only when
+    every target accepted it, so targets must apply it as an idempotent upsert.
+    A rejected batch is retried message by message, so one bad payload cannot
+    hold back the rest.
+    """
+
+    def __init__(
+        self,
+        outbox_repo: PatientRegisterOutboxRepo,
+        targets: list[CreatePatientRepo],
+        batch_size: int = 500,
+        poll_interval: float = 1.0,
+        max_attempts: int = 5,
+    ):
+        self._outbox_repo = outbox_repo
+        self._targets = targets
+        self._batch_size = batch_size
+        self._poll_interval = poll_interval
+        self._max_attempts = max_attempts
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def drain_once(self) -> int:
+        """Deliver a single batch, returning the number of delivered messages."""
+        return self._outbox_repo.drain(self._batch_size, self._deliver, self._max_attempts)
+
+    def start(self) -> None:
+        """Start draining the outbox on a background thread."""
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name="patient-register-outbox-relay",
+            daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the background thread once the batch in flight is finished."""
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join(timeout=timeout)
+        self._thread = None
+
+    def _run(self) -> None:
+        """Drain full batches back to back and poll when the outbox runs dry."""
+        while not self._stop_event.is_set():
+            try:
+                delivered = self.drain_once()
+            except Exception as e:
+                logger.error("draining patient register outbox failed: %r", e)
+                delivered = 0
+            if delivered < self._batch_size:
+                self._stop_event.wait(self._poll_interval)
+
+    def _deliver(self, payloads: list[dict[str, Any]]) -> list[Optional[str]]:
+        """Deliver the batch to every target with one write each, message by message to a target rejecting it."""
+        errors: list[Optional[str]] = [None] * len(payloads)
+        for target in self._targets:
+            error = self._write(target, payloads)
+            if error is None:
+                continue
+            if len(payloads) == 1:
+                target_errors = [error]
+            else:
+                logger.warning("delivering %d outbox messages failed, retrying one by one: %s", len(payloads), error)
+                target_errors = [self._write(target, [payload]) for payload in payloads]
+            errors = [previous or current for previous, current in zip(errors, target_errors)]
+        return errors
+
+    @staticmethod
+    def _write(target: CreatePatientRepo, payloads: list[dict[str, Any]]) -> Optional[str]:
+        """Write the payloads to the target, None when it accepted them, else the error."""
+        try:
+            if target.create_many(payloads):
+                return None
+            return f"delivery rejected by {type(target).__name__}"
+        except Exception as e:
+            return repr(e)
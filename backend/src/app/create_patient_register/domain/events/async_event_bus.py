@@ -0,0 +1,226 @@
+"""Queue-backed event bus that runs domain handlers off the request path."""
+
+import asyncio
+import logging
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Optional
+
+from src.app.create_patient_register.domain.events.event_bus import EventBus
+from src.app.shared.domain.events.domain_event_handler import DomainEventHandler
+from src.app.shared.domain.events.domain_event import DomainEvent
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncEventBusConfig:
+    """Async event bus configuration with environment-based defaults."""
+
+    def __init__(self):
+        self.mode = self._get_env_var('EVENT_BUS_MODE', 'async')
+        self.workers = int(self._get_env_var('EVENT_BUS_WORKERS', '4'))
+        self.max_queue_size = int(
+            self._get_env_var('EVENT_BUS_MAX_QUEUE_SIZE', '1000'))
+        self.handler_timeout = float(
+            self._get_env_var('EVENT_BUS_HANDLER_TIMEOUT', '5'))
+        self.max_retries = int(self._get_env_var('EVENT_BUS_MAX_RETRIES', '3'))
+        self.retry_backoff = float(
+            self._get_env_var('EVENT_BUS_RETRY_BACKOFF', '0.1'))
+        # bound on draining the queue when the worker stops, the rest is dropped
+        self.shutdown_timeout = float(
+            self._get_env_var('EVENT_BUS_SHUTDOWN_TIMEOUT', '10'))
+
+    @staticmethod
+    def _get_env_var(key: str, default: str) -> str:
+        """Get environment variable with fallback to default value."""
+        value = os.getenv(key)
+        if value is None:
+            return default
+        return value
+
+
+class _HandlerStillRunning(TimeoutError):
+    """The handler timed out and keeps running on its executor thread."""
+
+
+class AsyncEventBus(EventBus):
+    """Event bus that dispatches handlers to a pool of worker threads through a bounded queue.
+
+    Handlers flagged with ``is_synchronous`` still run inline on publish, so the
+    caller only gets a response once they are done. Every other handler is queued
+    and executed by a worker with a timeout and retries with exponential backoff;
+    a handler still running after its timeout is not retried, the thread cannot
+    be stopped and a retry would run it twice at once. When the queue is full the handler runs inline, applying backpressure to the
+    publisher instead of dropping the event.
+    """
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        workers: int = 4,
+        max_queue_size: int = 1000,
+        handler_timeout: Optional[float] = 5.0,
+        max_retries: int = 3,
+        retry_backoff: float = 0.1,
+    ):
+        super().__init__()
+        self._workers_count = workers
+        self._handler_timeout = handler_timeout
+        self._max_retries = max_retries
+        self._retry_backoff = retry_backoff
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self._workers: list[threading.Thread] = []
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._running = False
+
+    @staticmethod
+    def from_config(config: Optional[AsyncEventBusConfig] = None) -> "AsyncEventBus":
+        """Create an async event bus from configuration (env vars by default)."""
+        if config is None:
+            config = AsyncEventBusConfig()
+        return AsyncEventBus(
+            workers=config.workers,
+            max_queue_size=config.max_queue_size,
+            handler_timeout=config.handler_timeout,
+            max_retries=config.max_retries,
+            retry_backoff=config.retry_backoff,
+        )
+
+    @property
+    def pending(self) -> int:
+        """Approximate number of queued handler executions."""
+        return self._queue.qsize()
+
+    def start(self) -> None:
+        """Start the worker threads."""
+        if self._running:
+            return
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._workers_count,
+            thread_name_prefix="event-bus-handler"
+        )
+        self._workers = [
+            threading.Thread(
+                target=self._worker_loop,
+                name=f"event-bus-worker-{index}",
+                daemon=True
+            )
+            for index in range(self._workers_count)
+        ]
+        for worker in self._workers:
+            worker.start()
+        self._running = True
+
+    def shutdown(self, drain: bool = True, timeout: Optional[float] = None) -> None:
+        """Stop the workers, by default after every queued handler has been executed.
+
+        timeout bounds the whole shutdown; the queued handlers left when it
+        expires are dropped with the daemon worker threads. Blocking: call it
+        from a thread, not from the event loop.
+        """
+        if not self._running:
+            return
+        self._running = False
+
+        if not drain:
+            try:
+                while True:
+                    self._queue.get_nowait()
+                    self._queue.task_done()
+            except queue.Empty:
+                pass
+
+        # the stop markers are queued behind the pending events, so workers drain first
+        for _ in self._workers:
+            self._queue.put(self._STOP)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for worker in self._workers:
+            worker.join(timeout=None if deadline is None else max(0.0, deadline - time.monotonic()))
+        if any(worker.is_alive() for worker in self._workers):
+            logger.warning("event bus shutdown timed out after %ss, the handler executions left are dropped", timeout)
+        self._workers = []
+
+        self._executor.shutdown(wait=False)
+        self._executor = None
+
+    def publish(self, event_name: str, domain_event: DomainEvent):
+        """Run synchronous handlers inline and queue the rest for the workers."""
+        event_name = domain_event.domain_name
+        for event_handler in self._subscribers.get(event_name, []):
+            if event_handler.is_synchronous or not self._running:
+                self._handle(event_handler, domain_event)
+                continue
+            try:
+                self._queue.put_nowait((event_handler, domain_event))
+            except queue.Full:
+                self._dispatch(event_handler, domain_event)
+
+    async def publish_async(self, event_name: str, domain_event: DomainEvent):
+        """Await synchronous handlers on the event loop and queue the rest for the workers."""
+        event_name = domain_event.domain_name
+        for event_handler in self._subscribers.get(event_name, []):
+            if event_handler.is_synchronous or not self._running:
+                await self._handle_async(event_handler, domain_event)
+                continue
+            try:
+                self._queue.put_nowait((event_handler, domain_event))
+            except queue.Full:
+                await asyncio.to_thread(self._dispatch, event_handler, domain_event)
+
+    def _worker_loop(self) -> None:
+        """Consume queued handler executions until a stop marker is received."""
+        while True:
+            item = self._queue.get()
+            try:
+                if item is self._STOP:
+                    return
+                event_handler, domain_event = item
+                self._dispatch(event_handler, domain_event)
+            finally:
+                self._queue.task_done()
+
+    def _dispatch(self, event_handler: DomainEventHandler, domain_event: DomainEvent) -> None:
+        """Execute a handler with timeout and retry with exponential backoff."""
+        max_retries = self._max_retries if event_handler.max_retries is None else event_handler.max_retries
+        timeout = self._handler_timeout if event_handler.timeout_seconds is None else event_handler.timeout_seconds
+
+        for attempt in range(max_retries + 1):
+            start = time.perf_counter()
+            try:
+                self._run_with_timeout(event_handler, domain_event, timeout)
+                self._notify(event_handler, time.perf_counter() - start, False)
+                return
+            except _HandlerStillRunning as e:
+                # a retry would run it twice at once and hold one more executor thread
+                self._notify(event_handler, time.perf_counter() - start, True)
+                logger.error("%s not retried: %s", type(event_handler).__name__, e)
+                return
+            except Exception as e:
+                self._notify(event_handler, time.perf_counter() - start, True)
+                if attempt == max_retries:
+                    logger.error("%s failed after %d attempts: %r", type(event_handler).__name__, attempt + 1, e)
+                    return
+                time.sleep(self._retry_backoff * (2 ** attempt))
+
+    def _run_with_timeout(
+        self,
+        event_handler: DomainEventHandler,
+        domain_event: DomainEvent,
+        timeout: Optional[float]
+    ) -> None:
+        """Run the handler, giving up on waiting for it after ``timeout`` seconds."""
+        if timeout is None or self._executor is None:
+            event_handler.handle(domain_event)
+            return
+        future = self._executor.submit(event_handler.handle, domain_event)
+        try:
+            future.result(timeout=timeout)
+        except FutureTimeoutError as e:
+            if future.cancel():
+                # still waiting for an executor thread -> it never ran, a retry is safe
+                raise TimeoutError(f"handler not started after {timeout}s") from e
+            raise _HandlerStillRunning(f"handler timed out after {timeout}s and is still running") from e
@@ -1,18 +1,28 @@
 """Event bus implementation for domain events."""
 
 
+import logging
+import time
+from typing import Callable, Optional
+
 # from src.app.shared.domain.events.domain_event_handler import DomainEventHandler
 # from src.app.shared.domain.events.domain_event import DomainEvent
 
 from src.app.shared.domain.events.domain_event_handler import DomainEventHandler
 from src.app.shared.domain.events.domain_event import DomainEvent
 
+logger = logging.getLogger(__name__)
+
+# (handler, execution time in seconds, failed) -> None
+HandlerObserver = Callable[[DomainEventHandler, float, bool], None]
+
 
 class EventBus:
     """A simple event bus to handle domain events."""
 
     def __init__(self):
         self._subscribers: dict[str, list] = {}
+        self._observers: list[HandlerObserver] = []
 
     def subscribe(self, handler: DomainEventHandler):
         """Subscribe a handler to an event."""
@@ -26,4 +36,55 @@ class EventBus:
         event_name = domain_event.domain_name
         if event_name in self._subscribers:
             for event_handler in self._subscribers[event_name]:
-                event_handler.handle(domain_event)
+                self._handle(event_handler, domain_event)
+
+    async def publish_async(self, event_name: str, domain_event: DomainEvent):
+        """Publish an event to all subscribed handlers, awaiting their async handling."""
+        event_name = domain_event.domain_name
+        if event_name in self._subscribers:
+            for event_handler in self._subscribers[event_name]:
+                await self._handle_async(event_handler, domain_event)
+
+    def observe_handlers(self, observer: HandlerObserver) -> None:
+        """Call the observer after every handler execution (metrics)."""
+        self._observers.append(observer)
+
+    def _handle(self, event_handler: DomainEventHandler, domain_event: DomainEvent) -> None:
+        """Run a handler, reporting its execution time to the observers."""
+        if not self._observers:
+            event_handler.handle(domain_event)
+            return
+        start = time.perf_counter()
+        failed = True
+        try:
+            event_handler.handle(domain_event)
+            failed = False
+        finally:
+            self._notify(event_handler, time.perf_counter() - start, failed)
+
+    async def _handle_async(self, event_handler: DomainEventHandler, domain_event: DomainEvent) -> None:
+        """Await a handler, reporting its execution time to the observers."""
+        if not self._observers:
+            await event_handler.handle_async(domain_event)
+            return
+        start = time.perf_counter()
+        failed = True
+        try:
+            await event_handler.handle_async(domain_event)
+            failed = False
+        finally:
+            self._notify(event_handler, time.perf_counter() - start, failed)
+
+    def _notify(self, event_handler: DomainEventHandler, duration: float, failed: bool) -> None:
+        """Report a handler execution, an observer error never reaches the publisher."""
+        for observer in self._observers:
+            try:
+                observer(event_handler, duration, failed)
+            except Exception as e:
+                logger.warning("event bus observer failed: %r", e)
+
+    def start(self) -> None:
+        """Start the event bus (handlers run inline, nothing to start)."""
+
+    def shutdown(self, drain: bool = True, timeout: Optional[float] = None) -> None:
+        """Shut down the event bus (handlers run inline, nothing to drain)."""
@@ -4,6 +4,7 @@
 import uuid
 from typing import Optional
 
+from src.app.create_patient_register.domain.repos.create_patient_repo import CreateResult
 from src.app.shared.domain.events.domain_event import DomainEvent
 
 
@@ -25,3 +26,5 @@ class PatientRegisterCreatedEvent(DomainEvent):
             data=data,
             aggregate_uuid=aggregate_uuid
         )
+        # set by the master insert handler, read by the use case once the synchronous handlers are done
+        self.create_result: Optional[CreateResult] = None
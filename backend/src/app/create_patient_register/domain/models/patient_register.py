@@ -1,11 +1,32 @@
-from typing import Any
-from pydantic import BaseModel, UUID4, Field, ValidationError, field_validator
+from functools import lru_cache
+from typing import Annotated, Any, NamedTuple
+from pydantic import (
+    BaseModel,
+    TypeAdapter,
+    UUID4,
+    Field,
+    ValidationError,
+    ValidatorFunctionWrapHandler,
+    WrapValidator,
+    create_model,
+    field_validator
+)
 from datetime import date
 
 # domain
 from src.app.shared.domain.models.model_error_exeption import ModelErrorException
 
 
+def _check_date_of_birth(value: date) -> date:
+    """Check that date_of_birth is a valid past date."""
+    min_date = date(1900, 1, 1)
+    max_date = date.today()
+    if not (min_date <= value <= max_date):
+        raise ValueError(
+            f"date_of_birth must be between {min_date} and {max_date}")
+    return value
+
+
 class PatientInformationData(BaseModel):
 
     uuid: UUID4 = Field(..., description="Unique identifier for the patient")
@@ -25,12 +46,7 @@ class PatientInformationData(BaseModel):
     @field_validator('date_of_birth')
     def validate_date_of_birth(cls, value):
         """Validate that date_of_birth is a valid past date."""
-        min_date = date(1900, 1, 1)
-        max_date = date.today()
-        if not (min_date <= value <= max_date):
-            raise ValueError(
-                f"date_of_birth must be between {min_date} and {max_date}")
-        return value
+        return _check_date_of_birth(value)
     date_of_birth: date = Field(...,
                                 description="Date of birth in YYYY-MM-DD format"
                                 )
@@ -63,6 +79,58 @@ class PatientInformationData(BaseModel):
         description="Current medications patient is taking")
 
 
+def _keep_item_error(value: Any, handler: ValidatorFunctionWrapHandler) -> Any:
+    """Validate one record of a list, returning its ValidationError instead of failing the list."""
+    try:
+        return handler(value)
+    except ValidationError as e:
+        return e
+
+
+# compiled once -> shared by the single record and the bulk validation
+_patient_registers_adapter: TypeAdapter[list[PatientInformationData]] = TypeAdapter(list[PatientInformationData])
+# every record validated once: the list holds the model, or the error, of each one
+_patient_register_items_adapter: TypeAdapter[list[PatientInformationData | ValidationError]] = TypeAdapter(
+    list[Annotated[PatientInformationData, WrapValidator(_keep_item_error)]])
+
+
+@lru_cache(maxsize=128)
+def get_partial_patient_information_model(fields: tuple[str, ...]) -> type[BaseModel]:
+    """Get the PatientInformationData schema of a projection: the given fields with the same constraints."""
+    field_definitions = {
+        name: (PatientInformationData.model_fields[name].annotation, PatientInformationData.model_fields[name])
+        for name in fields
+    }
+    validators = {}
+    if "date_of_birth" in fields:
+        validators["validate_date_of_birth"] = field_validator("date_of_birth")(
+            lambda cls, value: _check_date_of_birth(value))
+    return create_model("PartialPatientInformationData", __validators__=validators, **field_definitions)
+
+
+class PatientRegisterValidationResult(NamedTuple):
+    """Outcome of validating many records at once."""
+
+    # primitives of the valid records, in input order, ready for create_many
+    valid: list[dict[str, Any]]
+    # one entry per invalid record: index, first error (property, messages) and every field error
+    errors: list[dict[str, Any]]
+
+
+def _errors_by_index(error: ValidationError) -> dict[int, list[dict[str, Any]]]:
+    """Group the errors of a list validation by record index."""
+    errors: dict[int, list[dict[str, Any]]] = {}
+    for detail in error.errors(include_url=False, include_input=False):
+        index, *field = detail["loc"]
+        errors.setdefault(index, []).append(_field_error(field, detail["msg"]))
+    return errors
+
+
+def _field_error(field: list, message: str) -> dict[str, Any]:
+    """Build the error of one field, the record itself is not an object -> reported on the body."""
+    return {"property": str(field[0]) if field else "body", "developer_message": message}
+
+
 class PatientRegister:
     """Patient Register Domain Model"""
 
@@ -70,17 +138,69 @@ class PatientRegister:
         try:
 
             # validate data using Pydantic model
-            self._data: PatientInformationData = PatientInformationData(**data)
+            self._data: PatientInformationData = _patient_registers_adapter.validate_python([data])[0]
 
         except ValidationError as e:
-            property_name = e.errors()[0]['loc'][0]
-            developer_message = e.errors()[0]['msg']
+            first_error = _errors_by_index(e)[0][0]
             raise ModelErrorException(
-                developer_message=developer_message,
-                property_name=property_name
+                developer_message=first_error["developer_message"],
+                property_name=first_error["property"]
             ) from e
 
     def to_primitives(self) -> dict[str, Any]:
         """Convert the model to primitive dictionary format."""
         model_dump = self._data.model_dump(mode="json")
         return model_dump
+
+    @staticmethod
+    def validate_many(records: list[Any]) -> PatientRegisterValidationResult:
+        """Validate many records in one call, collecting every error by record index.
+
+        The whole list goes through the compiled validator once; an invalid
+        record leaves its error in place of the model and does not stop the
+        others.
+        """
+        models = []
+        errors = []
+        for index, item in enumerate(_patient_register_items_adapter.validate_python(records)):
+            if not isinstance(item, ValidationError):
+                models.append(item)
+                continue
+            field_errors = [
+                _field_error(detail["loc"], detail["msg"])
+                for detail in item.errors(include_url=False, include_input=False)
+            ]
+            errors.append({
+                "index": index,
+                **ModelErrorException(
+                    property_name=field_errors[0]["property"],
+                    developer_message=field_errors[0]["developer_message"]
+                ).primitives(),
+                "fields": field_errors,
+            })
+
+        return PatientRegisterValidationResult(
+            valid=_patient_registers_adapter.dump_python(models, mode="json"),
+            errors=errors
+        )
+
+
+class PartialPatientRegister:
+    """Projection of a patient register: the selected fields only, validated like PatientRegister."""
+
+    def __init__(self, data: dict[str, Any], fields: tuple[str, ...]):
+        try:
+
+            # validate data using the Pydantic model of the projection
+            self._data: BaseModel = get_partial_patient_information_model(fields).model_validate(data)
+
+        except ValidationError as e:
+            detail = e.errors(include_url=False, include_input=False)[0]
+            raise ModelErrorException(
+                developer_message=detail["msg"],
+                property_name=str(detail["loc"][0]) if detail["loc"] else "body"
+            ) from e
+
+    def to_primitives(self) -> dict[str, Any]:
+        """Convert the model to primitive dictionary format."""
+        return self._data.model_dump(mode="json")
@@ -0,0 +1,34 @@
+"""Patient Register Read Model"""
+
+import uuid
+from datetime import date
+from typing import Any, Iterable
+
+
+class PatientRegisterReadModel:
+    """Read-side representation of a patient register built from trusted rows.
+
+    Rows read back from our own database were validated by PatientRegister when
+    they were written, so the read path maps the columns straight to the same
+    primitives PatientRegister.to_primitives returns instead of validating again.
+    Rows of a projection (fields=) map to the primitives of the selected
+    columns only, as PartialPatientRegister.to_primitives returns them.
+    """
+
+    __slots__ = ("_primitives",)
+
+    def __init__(self, primitives: dict[str, Any]):
+        self._primitives = primitives
+
+    @classmethod
+    def from_row(cls, columns: Iterable[str], row: Iterable[Any]) -> "PatientRegisterReadModel":
+        """Build the read model from a database row, serializing uuid and date columns."""
+        primitives = dict(zip(columns, row))
+        for key, value in primitives.items():
+            if isinstance(value, (uuid.UUID, date)):
+                primitives[key] = str(value)
+        return cls(primitives)
+
+    def to_primitives(self) -> dict[str, Any]:
+        """Get the primitive dictionary format (shared, do not mutate)."""
+        return self._primitives
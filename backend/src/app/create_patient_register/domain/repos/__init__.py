@@ -0,0 +1,5 @@
+"""Repository interfaces of the patient register.
+
+Every *_async method defaults to running its blocking counterpart in a worker
+thread; repositories backed by an async driver override it.
+"""
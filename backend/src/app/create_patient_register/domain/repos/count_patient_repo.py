@@ -0,0 +1,30 @@
+"""Repository interface for counting the patient registers matching a criteria."""
+
+import asyncio
+from abc import ABC, abstractmethod
+from typing import NamedTuple, Optional
+
+from src.app.shared.domain.criteria.criteria import Criteria
+
+
+class PatientRegisterCount(NamedTuple):
+    """Number of patient registers matching a criteria, exact or estimated."""
+
+    total: int
+    is_estimate: bool
+
+
+class CountPatientRepo(ABC):
+    """Repository interface for counting the patient registers matching a criteria."""
+
+    @abstractmethod
+    def count(self, criteria: Criteria) -> Optional[PatientRegisterCount]:
+        """Count the patient registers matching the criteria filters, None when it fails.
+
+        Order and pagination are ignored.
+        """
+        raise NotImplementedError()
+
+    async def count_async(self, criteria: Criteria) -> Optional[PatientRegisterCount]:
+        """Count without blocking the event loop."""
+        return await asyncio.to_thread(self.count, criteria)
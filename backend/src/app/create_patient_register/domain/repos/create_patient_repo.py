@@ -2,13 +2,66 @@
 Docstring for app.create_patient_register.domain.repos.create_patient_repo
 """
 
+import asyncio
 from abc import ABC, abstractmethod
+from enum import Enum
+from typing import Any
+
+
+class CreateResult(Enum):
+    """Outcome of creating a single patient register.
+
+    Truthy when the record is stored, so callers only interested in success can
+    keep testing the result as a bool.
+    """
+
+    CREATED = "created"
+    # the uuid was already stored with the same data (a retried request), nothing was written
+    ALREADY_EXISTS = "already_exists"
+    # the uuid was already stored with other data, nothing was written
+    CONFLICT = "conflict"
+    FAILED = "failed"
+
+    def __bool__(self) -> bool:
+        return self in (CreateResult.CREATED, CreateResult.ALREADY_EXISTS)
+
+    @staticmethod
+    def of(result: "bool | CreateResult") -> "CreateResult":
+        """Normalize the result of a repository that only reports success as a bool."""
+        if isinstance(result, CreateResult):
+            return result
+        return CreateResult.CREATED if result else CreateResult.FAILED
 
 
 class CreatePatientRepo(ABC):
     """Repository interface for creating patient registers."""
 
     @abstractmethod
-    def create(self, patient_register) -> bool:
+    def create(self, patient_register) -> bool | CreateResult:
         """Create a new patient register in the data store."""
         raise NotImplementedError()
+
+    @abstractmethod
+    def create_many(self, patient_registers: list[dict[str, Any]]) -> bool:
+        """Create many patient registers in the data store in a single round trip."""
+        raise NotImplementedError()
+
+    def create_each(self, patient_registers: list[dict[str, Any]]) -> list[bool | CreateResult]:
+        """Create many patient registers, reporting the result of each one.
+
+        Repositories able to write them in a single round trip override this,
+        the default creates them one by one.
+        """
+        return [self.create(patient_register) for patient_register in patient_registers]
+
+    async def create_async(self, patient_register) -> bool | CreateResult:
+        """Create a new patient register without blocking the event loop."""
+        return await asyncio.to_thread(self.create, patient_register)
+
+    async def create_each_async(self, patient_registers: list[dict[str, Any]]) -> list[bool | CreateResult]:
+        """Create many patient registers without blocking, reporting the result of each one.
+
+        Repositories able to write them in a single transaction override this,
+        the default creates them one by one.
+        """
+        return [await self.create_async(patient_register) for patient_register in patient_registers]
@@ -0,0 +1,18 @@
+"""Repository interface for exporting patient registration data."""
+
+from abc import ABC, abstractmethod
+from typing import Any, Iterator
+
+from src.app.shared.domain.criteria.criteria import Criteria
+
+
+class ExportPatientRepo(ABC):
+    """Repository interface for exporting patient registration data."""
+
+    @abstractmethod
+    def stream(self, criteria: Criteria) -> Iterator[dict[str, Any]]:
+        """Yield every patient register matching the criteria filters as primitives.
+
+        Pagination is ignored; implementations must not hold the whole result in memory.
+        """
+        raise NotImplementedError()
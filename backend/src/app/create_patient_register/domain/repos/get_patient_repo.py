@@ -1,5 +1,6 @@
 """Repository interface for getting patient registration data."""
 
+import asyncio
 from abc import ABC, abstractmethod
 
 from src.app.shared.domain.criteria.criteria import Criteria
@@ -10,5 +11,13 @@ class GetPatientRepo(ABC):
 
     @abstractmethod
     def get(self, criteria: Criteria) -> list:
-        """Get patient registration data from the data store based on criteria."""
+        """Get patient registration data from the data store based on criteria.
+
+        Implementations may return one row past the page (per_page + 1), telling
+        the caller a next page exists.
+        """
         raise NotImplementedError()
+
+    async def get_async(self, criteria: Criteria) -> list:
+        """Get patient registration data without blocking the event loop."""
+        return await asyncio.to_thread(self.get, criteria)
@@ -0,0 +1,28 @@
+"""Repository interface for the patient register transactional outbox."""
+
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Optional
+
+
+class PatientRegisterOutboxRepo(ABC):
+    """Repository interface for draining the patient register outbox."""
+
+    @abstractmethod
+    def drain(
+        self,
+        batch_size: int,
+        deliver: Callable[[list[dict[str, Any]]], list[Optional[str]]],
+        max_attempts: int = 5
+    ) -> int:
+        """Claim up to ``batch_size`` pending messages and hand their payloads to ``deliver``.
+
+        ``deliver`` returns one entry per payload: None when it was delivered,
+        the error otherwise. Delivered messages are removed, the others stay
+        pending for the next drain (at-least-once delivery). When some message
+        of the batch went through, every failed one counts an attempt; a
+        message rejected ``max_attempts`` times is dead-lettered: kept with its
+        last error but no longer claimed. When none went through the target is
+        taken as unavailable and no attempt is counted. Returns the number of
+        delivered messages.
+        """
+        raise NotImplementedError()
@@ -0,0 +1,17 @@
+"""Repository interface for the fuzzy patient register search."""
+
+import asyncio
+from abc import ABC, abstractmethod
+
+
+class SearchPatientRepo(ABC):
+    """Repository interface for the fuzzy patient register search."""
+
+    @abstractmethod
+    def search(self, query: str, limit: int) -> list:
+        """Get up to limit patient registers whose name, email or phone number match the query, best first."""
+        raise NotImplementedError()
+
+    async def search_async(self, query: str, limit: int) -> list:
+        """Search without blocking the event loop."""
+        return await asyncio.to_thread(self.search, query, limit)
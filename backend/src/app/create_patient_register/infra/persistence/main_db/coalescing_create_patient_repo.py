@@ -0,0 +1,120 @@
+"""Group commit of the single-record creates issued by concurrent requests."""
+
+import asyncio
+import logging
+import os
+from typing import Any, Optional
+
+from src.app.create_patient_register.domain.repos.create_patient_repo import CreatePatientRepo, CreateResult
+from src.app.shared.infra.observability.metrics import write_coalescing_batch_size
+
+logger = logging.getLogger(__name__)
+
+
+class WriteCoalescingConfig:
+    """Write coalescing configuration with environment-based defaults."""
+
+    def __init__(self):
+        self.enabled = self._get_env_var(
+            'WRITE_COALESCING_ENABLED', 'false').lower() == 'true'
+        self.max_delay = float(
+            self._get_env_var('WRITE_COALESCING_MAX_DELAY_MS', '2')) / 1000
+        self.max_batch_size = int(
+            self._get_env_var('WRITE_COALESCING_MAX_BATCH_SIZE', '100'))
+
+    @staticmethod
+    def _get_env_var(key: str, default: str) -> str:
+        """Get environment variable with fallback to default value."""
+        value = os.getenv(key)
+        if value is None:
+            return default
+        return value
+
+
+class CoalescingCreatePatientRepo(CreatePatientRepo):
+    """Collect concurrent creates and write them as one transaction.
+
+    The first create of a batch arms a ``max_delay`` timer; the batch is written
+    when the timer fires or ``max_batch_size`` records are waiting, whichever
+    comes first, through ``create_each_async`` of the wrapped repository (one
+    commit, so one WAL flush). Each caller gets its own record's result.
+
+    Batches are collected on the event loop of the request path. Blocking
+    creates and callers on another loop while a batch is pending go straight to
+    the wrapped repository.
+    """
+
+    def __init__(
+        self,
+        create_patient_repo: CreatePatientRepo,
+        max_delay: float = 0.002,
+        max_batch_size: int = 100
+    ):
+        self._create_patient_repo = create_patient_repo
+        self._max_delay = max_delay
+        self._max_batch_size = max_batch_size
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pending: list[tuple[dict[str, Any], asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._writes: set[asyncio.Task] = set()
+
+    def create(self, patient_register: dict[str, Any]) -> bool | CreateResult:
+        return self._create_patient_repo.create(patient_register)
+
+    def create_many(self, patient_registers: list[dict[str, Any]]) -> bool:
+        return self._create_patient_repo.create_many(patient_registers)
+
+    def create_each(self, patient_registers: list[dict[str, Any]]) -> list[bool | CreateResult]:
+        return self._create_patient_repo.create_each(patient_registers)
+
+    async def create_each_async(self, patient_registers: list[dict[str, Any]]) -> list[bool | CreateResult]:
+        return await self._create_patient_repo.create_each_async(patient_registers)
+
+    async def create_async(self, patient_register: dict[str, Any]) -> bool | CreateResult:
+        """Queue the record for the next group commit and wait for its result."""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            if self._pending or self._writes:
+                return await self._create_patient_repo.create_async(patient_register)
+            self._loop = loop
+
+        future = loop.create_future()
+        self._pending.append((patient_register, future))
+        if len(self._pending) >= self._max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._max_delay, self._flush)
+        return await future
+
+    async def close(self) -> None:
+        """Write the pending records and wait for the writes in flight."""
+        self._flush()
+        if self._writes:
+            await asyncio.gather(*self._writes, return_exceptions=True)
+
+    def _flush(self) -> None:
+        """Start writing the pending records as one batch."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        write = self._loop.create_task(self._write(batch))
+        self._writes.add(write)
+        write.add_done_callback(self._writes.discard)
+
+    async def _write(self, batch: list[tuple[dict[str, Any], asyncio.Future]]) -> None:
+        """Write a batch and resolve every caller with its own result."""
+        write_coalescing_batch_size.observe(len(batch))
+        try:
+            results = await self._create_patient_repo.create_each_async([record for record, _ in batch])
+        except Exception as e:
+            logger.error("coalesced write of %d patient registers failed: %r", len(batch), e)
+            results = [CreateResult.FAILED] * len(batch)
+        logger.debug("coalesced write of %d patient registers", len(batch))
+
+        for (_, future), result in zip(batch, results):
+            # a caller cancelled while waiting (client disconnect) has nothing to resolve
+            if not future.done():
+                future.set_result(result)
@@ -1,33 +1,186 @@
 """"Module to create patient register in Postgres database."""
 
+import logging
+from typing import Optional
+
+from sqlalchemy import Engine, Result, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
 # # domain - repos
-from src.app.create_patient_register.domain.repos.create_patient_repo import CreatePatientRepo
+from src.app.create_patient_register.domain.events.patient_register_created_event import PatientRegisterCreatedEvent
+from src.app.create_patient_register.domain.models.patient_register_read_model import PatientRegisterReadModel
+from src.app.create_patient_register.domain.repos.create_patient_repo import CreatePatientRepo, CreateResult
 
 # # infra - aux
-from src.app.shared.infra.persistence.main_postgres_sql.utils.connection import connection_engine
+from src.app.shared.infra.persistence.main_postgres_sql.utils.connection import get_connection_engine
 from src.app.shared.infra.persistence.main_postgres_sql.utils.patient_register_model import PatientRegisterModel
+from src.app.shared.infra.persistence.main_postgres_sql.utils.patient_register_outbox_model import PatientRegisterOutboxModel
+
+logger = logging.getLogger(__name__)
+
+
+def to_outbox_row(patient_register: dict[str, any]) -> dict[str, any]:
+    """Build the outbox row that carries a patient register to the replica/DR targets."""
+    return {
+        "aggregate_uuid": patient_register["uuid"],
+        "event_name": PatientRegisterCreatedEvent.event_name(),
+        "payload": patient_register,
+    }
+
+
+def build_insert_if_new_statement():
+    """Build an INSERT ... ON CONFLICT (uuid) DO NOTHING RETURNING uuid statement.
+
+    A retried create finds its uuid already stored: no row comes back and the
+    existing record is left untouched.
+    """
+    return (
+        pg_insert(PatientRegisterModel)
+        .on_conflict_do_nothing(index_elements=["uuid"])
+        .returning(PatientRegisterModel.uuid)
+    )
+
+
+def build_select_stored_statement(uuids: list):
+    """Build the SELECT of the stored records of the uuids a create found already there."""
+    return select(PatientRegisterModel.__table__).where(PatientRegisterModel.uuid.in_(uuids))
+
+
+def stored_by_uuid(result: Result) -> dict[str, dict[str, any]]:
+    """Map the uuid of every row of a build_select_stored_statement result to its primitives."""
+    columns = list(result.keys())
+    stored = (PatientRegisterReadModel.from_row(columns, row).to_primitives() for row in result)
+    return {primitives["uuid"]: primitives for primitives in stored}
+
+
+def existing_result(patient_register: dict[str, any], stored: dict[str, dict[str, any]]) -> CreateResult:
+    """Tell a retried create (same data as the stored record) from another record reusing the uuid."""
+    stored_primitives = stored.get(str(patient_register["uuid"]))
+    if stored_primitives is not None and all(
+        stored_primitives.get(key) == value for key, value in patient_register.items()
+    ):
+        return CreateResult.ALREADY_EXISTS
+    return CreateResult.CONFLICT
 
 
 class CreatePatientRegisterPostgress(CreatePatientRepo):
     """Class to create patient register in Postgres database."""
 
-    def __init__(self):
-        """Initialize CreatePatientRegisterPostgress repository."""
+    def __init__(self, engine: Optional[Engine] = None, outbox: bool = False):
+        """Initialize CreatePatientRegisterPostgress repository on the primary engine.
+
+        outbox=True writes an outbox row with every record, for the outbox
+        relay to deliver; without a relay draining them they would pile up.
+        """
         super().__init__()
+        self._engine = engine or get_connection_engine()
+        self._outbox = outbox
+
+    def create(self, patient_register: dict[str, any]) -> CreateResult:
+        """Create a patient register in the Postgres database, once per uuid."""
+        try:
+            with Session(self._engine) as db:
+                result = self._insert_if_new(db, patient_register)
+                db.commit()
+            return result
+        except Exception as e:
+            logger.error("creating patient register failed: %r", e)
+            return CreateResult.FAILED
+
+    def create_many(self, patient_registers: list[dict[str, any]]) -> bool:
+        """Create many patient registers using a single multi-row INSERT and one commit."""
+        return all(self.create_each(patient_registers))
+
+    def create_each(self, patient_registers: list[dict[str, any]]) -> list[CreateResult]:
+        """Create many patient registers with one commit, reporting the result of each one.
 
-    def create(self, patient_register: dict[str, any]) -> bool:
-        """Create a patient register in the Postgres database."""
+        The rows go in as one multi-row INSERT ... ON CONFLICT DO NOTHING inside
+        a savepoint; uuids already stored, or repeated in the batch, are reported
+        as ALREADY_EXISTS, or CONFLICT when the stored record holds other data,
+        and only the new records get an outbox row. When the INSERT fails every
+        row is retried in its own savepoint, so only the offending rows are
+        rejected and the rest still share the commit.
+        """
+        if not patient_registers:
+            return []
         try:
-            db: Session = Session(connection_engine)
-            patient_register_model = PatientRegisterModel(**patient_register)
-            print(f"patientRegisterModel {patient_register_model}")
+            with Session(self._engine) as db:
+                try:
+                    with db.begin_nested():
+                        inserted = set(db.execute(build_insert_if_new_statement(), patient_registers).scalars())
+                        results = self._results_by_row(patient_registers, inserted)
+                        existing = self._existing_uuids(patient_registers, results)
+                        if existing:
+                            stored = stored_by_uuid(db.execute(build_select_stored_statement(existing)))
+                            results = self._results_against_stored(patient_registers, results, stored)
+                        outbox_rows = [
+                            to_outbox_row(patient_register)
+                            for patient_register, result in zip(patient_registers, results)
+                            if result is CreateResult.CREATED and self._outbox
+                        ]
+                        if outbox_rows:
+                            db.execute(insert(PatientRegisterOutboxModel), outbox_rows)
+                except Exception as e:
+                    logger.warning("multi-row insert of %d patient registers failed, retrying row by row: %r",
+                                   len(patient_registers), e)
+                    results = [
+                        self._insert_in_savepoint(db, patient_register)
+                        for patient_register in patient_registers
+                    ]
+                db.commit()
+            return results
+        except Exception as e:
+            logger.error("creating patient registers batch failed: %r", e)
+            return [CreateResult.FAILED] * len(patient_registers)
 
-            db.add(patient_register_model)
-            db.commit()
-            return True
+    def _insert_in_savepoint(self, db: Session, patient_register: dict[str, any]) -> CreateResult:
+        """Insert one record and its outbox row, rolling back only this savepoint on failure."""
+        try:
+            with db.begin_nested():
+                return self._insert_if_new(db, patient_register)
         except Exception as e:
-            """hola"""
-            print(f"Error creating patient register: {e}")
-            return False
+            logger.error("creating patient register failed: %r", e)
+            return CreateResult.FAILED
+
+    def _insert_if_new(self, db: Session, patient_register: dict[str, any]) -> CreateResult:
+        """Insert the record unless its uuid is already stored, with its outbox row in the same transaction."""
+        inserted = db.execute(build_insert_if_new_statement(), patient_register).first()
+        if inserted is None:
+            stored = stored_by_uuid(db.execute(build_select_stored_statement([patient_register["uuid"]])))
+            return existing_result(patient_register, stored)
+        # same transaction -> the outbox row exists if and only if the record does
+        if self._outbox:
+            db.execute(insert(PatientRegisterOutboxModel), to_outbox_row(patient_register))
+        return CreateResult.CREATED
+
+    @staticmethod
+    def _existing_uuids(rows: list[dict[str, any]], results: list[CreateResult]) -> list:
+        """Get the uuids of the rows not inserted because they were already stored."""
+        return list({row["uuid"] for row, result in zip(rows, results) if result is CreateResult.ALREADY_EXISTS})
+
+    @staticmethod
+    def _results_against_stored(
+        patient_registers: list[dict[str, any]],
+        results: list[CreateResult],
+        stored: dict[str, dict[str, any]]
+    ) -> list[CreateResult]:
+        """Compare every record not inserted with the stored one (see existing_result)."""
+        return [
+            existing_result(patient_register, stored) if result is CreateResult.ALREADY_EXISTS else result
+            for patient_register, result in zip(patient_registers, results)
+        ]
+
+    @staticmethod
+    def _results_by_row(rows: list[dict[str, any]], inserted: set) -> list[CreateResult]:
+        """Map the uuids returned by the INSERT back to the rows, the first row of a repeated uuid wins."""
+        # the driver returns uuid objects -> compared as text with the (str or uuid) row values
+        inserted = {str(uuid) for uuid in inserted}
+        results = []
+        for row in rows:
+            if str(row["uuid"]) in inserted:
+                inserted.discard(str(row["uuid"]))
+                results.append(CreateResult.CREATED)
+            else:
+                results.append(CreateResult.ALREADY_EXISTS)
+        return results
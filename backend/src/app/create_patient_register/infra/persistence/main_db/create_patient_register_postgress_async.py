@@ -0,0 +1,117 @@
+""""Module to create patient register in Postgres database with the async engine."""
+
+import logging
+from typing import Optional
+
+from sqlalchemy import Engine, insert
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+# # infra
+from src.app.create_patient_register.domain.repos.create_patient_repo import CreateResult
+from src.app.create_patient_register.infra.persistence.main_db.create_patient_register_postgress import (
+    CreatePatientRegisterPostgress,
+    build_insert_if_new_statement,
+    build_select_stored_statement,
+    existing_result,
+    stored_by_uuid,
+    to_outbox_row
+)
+
+# # infra - aux
+from src.app.shared.infra.persistence.asyncpg_coercion import coerce_values
+from src.app.shared.infra.persistence.main_postgres_sql.utils.async_connection import get_async_connection_engine
+from src.app.shared.infra.persistence.main_postgres_sql.utils.patient_register_model import PatientRegisterModel
+from src.app.shared.infra.persistence.main_postgres_sql.utils.patient_register_outbox_model import PatientRegisterOutboxModel
+
+logger = logging.getLogger(__name__)
+
+
+class CreatePatientRegisterPostgressAsync(CreatePatientRegisterPostgress):
+    """Class to create patient register in Postgres database without blocking the event loop."""
+
+    def __init__(
+        self,
+        async_engine: Optional[AsyncEngine] = None,
+        engine: Optional[Engine] = None,
+        outbox: bool = False
+    ):
+        """Initialize CreatePatientRegisterPostgressAsync repository on the primary engines."""
+        super().__init__(engine, outbox)
+        self._async_engine = async_engine or get_async_connection_engine()
+
+    async def create_async(self, patient_register: dict[str, any]) -> CreateResult:
+        """Create a patient register in the Postgres database using the asyncpg driver, once per uuid."""
+        try:
+            async with AsyncSession(self._async_engine) as db:
+                result = await self._insert_if_new_async(db, patient_register)
+                await db.commit()
+            return result
+        except Exception as e:
+            logger.error("creating patient register failed: %r", e)
+            return CreateResult.FAILED
+
+    async def create_each_async(self, patient_registers: list[dict[str, any]]) -> list[CreateResult]:
+        """Create many patient registers with one commit, reporting the result of each one.
+
+        The rows go in as one multi-row INSERT ... ON CONFLICT DO NOTHING inside
+        a savepoint, like create_each; when the INSERT fails every row is retried
+        in its own savepoint, so only the offending rows are rejected and the
+        rest still share the commit.
+        """
+        if not patient_registers:
+            return []
+        # asyncpg binds python types -> coerce the json primitives first
+        rows = [coerce_values(PatientRegisterModel.__table__, patient_register) for patient_register in patient_registers]
+        try:
+            async with AsyncSession(self._async_engine) as db:
+                try:
+                    async with db.begin_nested():
+                        inserted = set((await db.execute(build_insert_if_new_statement(), rows)).scalars())
+                        results = self._results_by_row(rows, inserted)
+                        existing = self._existing_uuids(rows, results)
+                        if existing:
+                            stored = stored_by_uuid(await db.execute(build_select_stored_statement(existing)))
+                            results = self._results_against_stored(patient_registers, results, stored)
+                        outbox_rows = [
+                            coerce_values(PatientRegisterOutboxModel.__table__, to_outbox_row(patient_register))
+                            for patient_register, result in zip(patient_registers, results)
+                            if result is CreateResult.CREATED and self._outbox
+                        ]
+                        if outbox_rows:
+                            await db.execute(insert(PatientRegisterOutboxModel), outbox_rows)
+                except Exception as e:
+                    logger.warning("multi-row insert of %d patient registers failed, retrying row by row: %r",
+                                   len(rows), e)
+                    results = [
+                        await self._insert_in_savepoint_async(db, patient_register)
+                        for patient_register in patient_registers
+                    ]
+                await db.commit()
+            return results
+        except Exception as e:
+            logger.error("creating patient registers batch failed: %r", e)
+            return [CreateResult.FAILED] * len(rows)
+
+    async def _insert_in_savepoint_async(self, db: AsyncSession, patient_register: dict[str, any]) -> CreateResult:
+        """Insert one record and its outbox row, rolling back only this savepoint on failure."""
+        try:
+            async with db.begin_nested():
+                return await self._insert_if_new_async(db, patient_register)
+        except Exception as e:
+            logger.error("creating patient register failed: %r", e)
+            return CreateResult.FAILED
+
+    async def _insert_if_new_async(self, db: AsyncSession, patient_register: dict[str, any]) -> CreateResult:
+        """Insert the record unless its uuid is already stored, with its outbox row in the same transaction."""
+        row = coerce_values(PatientRegisterModel.__table__, patient_register)
+        inserted = (await db.execute(build_insert_if_new_statement(), row)).first()
+        if inserted is None:
+            stored = stored_by_uuid(await db.execute(build_select_stored_statement([row["uuid"]])))
+            return existing_result(patient_register, stored)
+        # same transaction -> the outbox row exists if and only if the record does
+        if self._outbox:
+            await db.execute(
+                insert(PatientRegisterOutboxModel),
+                coerce_values(PatientRegisterOutboxModel.__table__, to_outbox_row(patient_register))
+            )
+        return CreateResult.CREATED
@@ -0,0 +1,77 @@
+""""Module to drain the patient register outbox from the Postgres primary database."""
+
+import logging
+from typing import Any, Callable, Optional
+
+from sqlalchemy import Engine, delete, select, update
+from sqlalchemy.orm import Session
+
+# domain - repos
+from src.app.create_patient_register.domain.repos.patient_register_outbox_repo import PatientRegisterOutboxRepo
+
+# infra - aux
+from src.app.shared.infra.persistence.main_postgres_sql.utils.connection import get_connection_engine
+from src.app.shared.infra.persistence.main_postgres_sql.utils.patient_register_outbox_model import PatientRegisterOutboxModel
+
+logger = logging.getLogger(__name__)
+
+
+class PatientRegisterOutboxPostgress(PatientRegisterOutboxRepo):
+    """Class to drain the patient register outbox in Postgres database."""
+
+    def __init__(self, engine: Optional[Engine] = None):
+        """Initialize PatientRegisterOutboxPostgress repository on the primary engine."""
+        super().__init__()
+        self._engine = engine or get_connection_engine()
+
+    def drain(
+        self,
+        batch_size: int,
+        deliver: Callable[[list[dict[str, Any]]], list[Optional[str]]],
+        max_attempts: int = 5
+    ) -> int:
+        """Lock a batch of pending messages, deliver them and delete the delivered ones in one transaction."""
+        with Session(self._engine) as db:
+
+            # SKIP LOCKED lets several relays (one per worker) drain concurrently;
+            # dead letters (max_attempts rejections) are no longer claimed
+            messages = db.execute(
+                select(PatientRegisterOutboxModel.id, PatientRegisterOutboxModel.payload,
+                       PatientRegisterOutboxModel.attempts)
+                .where(PatientRegisterOutboxModel.attempts < max_attempts)
+                .order_by(PatientRegisterOutboxModel.id)
+                .limit(batch_size)
+                .with_for_update(skip_locked=True)
+            ).all()
+            if not messages:
+                return 0
+
+            errors = deliver([message.payload for message in messages])
+            delivered_ids = [message.id for message, error in zip(messages, errors) if error is None]
+            failed = [(message, error) for message, error in zip(messages, errors) if error is not None]
+
+            if delivered_ids:
+                db.execute(
+                    delete(PatientRegisterOutboxModel)
+                    .where(PatientRegisterOutboxModel.id.in_(delivered_ids))
+                )
+            if failed and not delivered_ids:
+                # nothing went through -> the target is unavailable, not the messages
+                db.execute(
+                    update(PatientRegisterOutboxModel)
+                    .where(PatientRegisterOutboxModel.id.in_([message.id for message, _ in failed]))
+                    .values(last_error=failed[0][1])
+                )
+            elif failed:
+                for message, error in failed:
+                    db.execute(
+                        update(PatientRegisterOutboxModel)
+                        .where(PatientRegisterOutboxModel.id == message.id)
+                        .values(attempts=PatientRegisterOutboxModel.attempts + 1, last_error=error)
+                    )
+                    if message.attempts + 1 >= max_attempts:
+                        logger.error("outbox message %d dead-lettered after %d attempts: %s",
+                                     message.id, max_attempts, error)
+            db.commit()
+
+            return len(delivered_ids)
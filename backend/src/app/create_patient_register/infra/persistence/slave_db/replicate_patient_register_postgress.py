@@ -2,31 +2,57 @@
     Replicate Patient Register Postgress Repo Implementation
 """
 
+import logging
+
+from sqlalchemy import Engine
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 
 from src.app.create_patient_register.domain.repos.create_patient_repo import CreatePatientRepo
-from src.app.shared.infra.persistence.slave_postgres_sql.utils.slave_connection import slave_connection_engine
 from src.app.shared.infra.persistence.slave_postgres_sql.utils.patient_register_model import PatientRegisterModel
 
+logger = logging.getLogger(__name__)
+
+
+def build_upsert_statement():
+    """Build an idempotent INSERT ... ON CONFLICT (uuid) DO UPDATE statement."""
+    statement = insert(PatientRegisterModel)
+    columns = [
+        column.name for column in PatientRegisterModel.__table__.columns
+        if column.name != "uuid"
+    ]
+    return statement.on_conflict_do_update(
+        index_elements=["uuid"],
+        set_={column: statement.excluded[column] for column in columns}
+    )
+
 
 class ReplicatePatientRegisterPostgress(CreatePatientRepo):
-    """Class to replicate patient register in Postgres database."""
+    """Class to replicate patient register in Postgres database.
 
-    def __init__(self):
-        """Initialize ReplicatePatientRegisterPostgress repository."""
+    Writes are idempotent upserts, so the outbox relay can redeliver safely.
+    The engine must reach a writable database (a DR endpoint): the streaming
+    replicas are read-only hot standbys.
+    """
+
+    def __init__(self, engine: Engine):
+        """Initialize ReplicatePatientRegisterPostgress repository on a writable DR engine."""
         super().__init__()
+        self._engine = engine
 
     def create(self, patient_register: dict[str, any]) -> bool:
         """Replicate a patient register in the Postgres database."""
-        try:
-            db: Session = Session(slave_connection_engine)
-            patient_register_model = PatientRegisterModel(**patient_register)
-            print(f"patientRegisterModel {patient_register_model}")
+        return self.create_many([patient_register])
 
-            db.add(patient_register_model)
-            db.commit()
+    def create_many(self, patient_registers: list[dict[str, any]]) -> bool:
+        """Replicate many patient registers using a single multi-row upsert and one commit."""
+        if not patient_registers:
+            return True
+        try:
+            with Session(self._engine) as db:
+                db.execute(build_upsert_statement(), patient_registers)
+                db.commit()
             return True
         except Exception as e:
-            """hola"""
-            print(f"Error replicating patient register: {e}")
+            logger.error("replicating patient registers batch failed: %r", e)
             return False
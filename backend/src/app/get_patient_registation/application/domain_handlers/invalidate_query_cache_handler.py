@@ -0,0 +1,21 @@
+""""Handler to invalidate cached patient register queries."""
+
+from src.app.get_patient_registation.infra.cache.cached_get_patient_repo import CachedGetPatientRepo
+from src.app.shared.domain.events.domain_event_handler import DomainEventHandler
+
+
+class InvalidateQueryCacheHandler(DomainEventHandler):
+    """Handler to drop the cached queries a new patient register may belong to (all of them)."""
+
+    # invalidate before acknowledging, so the writer does not read a stale result;
+    # a single counter increment, cheap enough for the request path
+    is_synchronous = True
+
+    def __init__(self, susbscribed_to: str, cached_get_patient_repo: CachedGetPatientRepo):
+        """Initialize the invalidate query cache handler with the subscribed event name."""
+        super().__init__(susbscribed_to)
+        self._cached_get_patient_repo = cached_get_patient_repo
+
+    def handle(self, event) -> None:
+        """Handle the given domain event by invalidating the affected cached queries."""
+        self._cached_get_patient_repo.invalidate()
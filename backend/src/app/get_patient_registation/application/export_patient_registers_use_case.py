@@ -0,0 +1,65 @@
+"""Export Patient Registers Use Case Module."""
+
+import json
+import logging
+from typing import Any, Callable, Iterator, Optional, TypedDict
+# domain
+from src.app.create_patient_register.domain.repos.export_patient_repo import ExportPatientRepo
+from src.app.shared.domain.criteria.criteria import Criteria
+
+logger = logging.getLogger(__name__)
+
+
+class ExportPatientRegistersProps(TypedDict):
+    """TypedDict for exporting patient registers properties."""
+    criteria: Criteria
+
+
+class ExportPatientRegistersUseCase:
+    """Use case for exporting patient registers as NDJSON."""
+
+    def __init__(
+        self,
+        export_patient_repo: ExportPatientRepo,
+        chunk_size: int = 64 * 1024,
+        dumps: Optional[Callable[[Any], bytes]] = None
+    ):
+        """Initialize ExportPatientRegistersUseCase.
+
+        dumps encodes one row as compact JSON bytes, the app passes the
+        encoder of its responses (orjson); the stdlib encoder is the fallback.
+        """
+        self.export_patient_repo = export_patient_repo
+        self.chunk_size = chunk_size
+        self.dumps = dumps or self._json_dumps
+
+    def execute(self, props: ExportPatientRegistersProps) -> Iterator[bytes]:
+        """Yield the matching patient registers, one JSON document per line.
+
+        Lines are grouped into chunks of about chunk_size bytes so the response
+        is not sent one small write per row. A repository error is re-raised:
+        the status line is already sent, so the response must be aborted, not
+        ended as if the export were complete.
+        """
+        chunk: list[bytes] = []
+        chunk_bytes = 0
+        try:
+            for patient_register in self.export_patient_repo.stream(props["criteria"]):
+                line = self.dumps(patient_register) + b"\n"
+                chunk.append(line)
+                chunk_bytes += len(line)
+                if chunk_bytes >= self.chunk_size:
+                    yield b"".join(chunk)
+                    chunk = []
+                    chunk_bytes = 0
+        except Exception as e:
+            # the server drops the connection -> the client sees a truncated body, not a clean end
+            logger.error("exporting patient registers failed: %r", e)
+            raise
+        if chunk:
+            yield b"".join(chunk)
+
+    @staticmethod
+    def _json_dumps(content: Any) -> bytes:
+        """Encode content as compact UTF-8 JSON bytes with the stdlib encoder."""
+        return json.dumps(content, separators=(",", ":"), ensure_ascii=False).encode()
@@ -1,10 +1,11 @@
 """Get Patient Registration Use Case Module."""
 
-from typing import TypedDict
+from typing import Any, Optional, TypedDict
 # domain
+from src.app.create_patient_register.domain.repos.count_patient_repo import CountPatientRepo, PatientRegisterCount
 from src.app.create_patient_register.domain.repos.get_patient_repo import GetPatientRepo
 # infra
-from src.app.shared.domain.criteria.criteria import Criteria
+from src.app.shared.domain.criteria.criteria import Criteria, Cursor, CursorPagination, Pagination
 from src.app.shared.domain.models.custom_response import CustomResponse
 
 
@@ -16,25 +17,97 @@ class GetPatientRegistationProps(TypedDict):
 class GetPatientRegistationUseCase:
     """Use case for getting patient registration."""
 
-    def __init__(self, get_patient_repo: GetPatientRepo):
-        """Initialize GetPatientRegistationUseCase."""
+    def __init__(self, get_patient_repo: GetPatientRepo, count_patient_repo: Optional[CountPatientRepo] = None):
+        """Initialize GetPatientRegistationUseCase, without a count repository total is None."""
         self.get_patient_repo = get_patient_repo
+        self.count_patient_repo = count_patient_repo
 
     def execute(self, props: GetPatientRegistationProps) -> CustomResponse:
         """Use case for getting patient registration."""
         try:
 
             criteria = props["criteria"]
-            patient_registrations = self.get_patient_repo.get(criteria)
-            patient_registrations_primitives = [
-                registration.to_primitives() for registration in patient_registrations
-            ]
-
-            return CustomResponse.success(
-                msg="Get patient registration use case executed successfully",
-                data={
-                    "registrations": patient_registrations_primitives
-                }
-            )
+            patient_registrations, has_next = self._split_page(criteria, self.get_patient_repo.get(criteria))
+            patient_register_count = self._get_count_from_page(criteria, patient_registrations, has_next)
+            if patient_register_count is None and self.count_patient_repo is not None:
+                patient_register_count = self.count_patient_repo.count(criteria)
+            return self._build_response(criteria, patient_registrations, has_next, patient_register_count)
         except RuntimeError:
             return CustomResponse.error(msg="An error occurred while executing the use case")
+
+    async def execute_async(self, props: GetPatientRegistationProps) -> CustomResponse:
+        """Use case for getting patient registration without blocking the event loop."""
+        try:
+
+            criteria = props["criteria"]
+            patient_registrations, has_next = self._split_page(
+                criteria, await self.get_patient_repo.get_async(criteria))
+            patient_register_count = self._get_count_from_page(criteria, patient_registrations, has_next)
+            if patient_register_count is None and self.count_patient_repo is not None:
+                patient_register_count = await self.count_patient_repo.count_async(criteria)
+            return self._build_response(criteria, patient_registrations, has_next, patient_register_count)
+        except RuntimeError:
+            return CustomResponse.error(msg="An error occurred while executing the use case")
+
+    @staticmethod
+    def _split_page(criteria: Criteria, patient_registrations: list) -> tuple[list, bool]:
+        """Drop the row fetched past the page, its presence tells there is a next page."""
+        pagination = criteria.pagination
+        if pagination is None:
+            return patient_registrations, False
+        has_next = len(patient_registrations) > pagination.per_page
+        return patient_registrations[:pagination.per_page], has_next
+
+    @staticmethod
+    def _get_count_from_page(
+        criteria: Criteria,
+        patient_registrations: list,
+        has_next: bool
+    ) -> Optional[PatientRegisterCount]:
+        """Get the exact total without a count query when the last offset page is known."""
+        pagination = criteria.pagination
+        if has_next or not isinstance(pagination, Pagination):
+            return None
+        if not patient_registrations and pagination.page > 1:
+            # past the end -> the rows before it are unknown
+            return None
+        offset = (pagination.page - 1) * pagination.per_page
+        return PatientRegisterCount(offset + len(patient_registrations), False)
+
+    def _build_response(
+        self,
+        criteria: Criteria,
+        patient_registrations: list,
+        has_next: bool,
+        patient_register_count: Optional[PatientRegisterCount]
+    ) -> CustomResponse:
+        """Build the success response from the patient registrations found."""
+        patient_registrations_primitives = [
+            registration.to_primitives() for registration in patient_registrations
+        ]
+
+        return CustomResponse.success(
+            msg="Get patient registration use case executed successfully",
+            data={
+                "registrations": patient_registrations_primitives,
+                "next_cursor": self._get_next_cursor(criteria, patient_registrations_primitives, has_next),
+                "has_next": has_next,
+                "total": patient_register_count.total if patient_register_count else None,
+                "total_is_estimate": patient_register_count.is_estimate if patient_register_count else None,
+            }
+        )
+
+    @staticmethod
+    def _get_next_cursor(criteria: Criteria, registrations: list[dict[str, Any]], has_next: bool) -> Optional[str]:
+        """Encode the last row's sort key and uuid when keyset pagination has a next page."""
+        pagination = criteria.pagination
+        if not isinstance(pagination, CursorPagination):
+            return None
+        if not registrations or not has_next:
+            return None
+
+        last_registration = registrations[-1]
+        sort_values = []
+        if criteria.orders and criteria.orders.field != "uuid":
+            sort_values.append(last_registration.get(criteria.orders.field))
+        return Cursor.encode(sort_values, last_registration["uuid"])
@@ -0,0 +1,74 @@
+"""Search Patient Registers Use Case Module."""
+
+from typing import Optional, TypedDict
+# domain
+from src.app.create_patient_register.domain.repos.search_patient_repo import SearchPatientRepo
+from src.app.shared.domain.models.custom_response import CustomResponse
+
+# trigrams need 3 characters, shorter queries would match (and rank) most of the table
+MIN_QUERY_LENGTH = 3
+MAX_QUERY_LENGTH = 100
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 100
+
+
+class SearchPatientRegistersProps(TypedDict):
+    """TypedDict for searching patient registers properties."""
+    query: Optional[str]
+    limit: Optional[str]
+
+
+class SearchPatientRegistersUseCase:
+    """Use case for the fuzzy search of patient registers by name, email or phone number."""
+
+    def __init__(self, search_patient_repo: SearchPatientRepo):
+        """Initialize SearchPatientRegistersUseCase."""
+        self.search_patient_repo = search_patient_repo
+
+    def execute(self, props: SearchPatientRegistersProps) -> CustomResponse:
+        """Use case for searching patient registers."""
+        query, limit, error = self._parse(props)
+        if error is not None:
+            return error
+        try:
+            patient_registers = self.search_patient_repo.search(query, limit)
+            return self._build_response(patient_registers)
+        except RuntimeError:
+            return CustomResponse.error(msg="An error occurred while executing the use case")
+
+    async def execute_async(self, props: SearchPatientRegistersProps) -> CustomResponse:
+        """Use case for searching patient registers without blocking the event loop."""
+        query, limit, error = self._parse(props)
+        if error is not None:
+            return error
+        try:
+            patient_registers = await self.search_patient_repo.search_async(query, limit)
+            return self._build_response(patient_registers)
+        except RuntimeError:
+            return CustomResponse.error(msg="An error occurred while executing the use case")
+
+    @staticmethod
+    def _parse(props: SearchPatientRegistersProps) -> tuple[str, int, Optional[CustomResponse]]:
+        """Get the normalized query and limit, or the error response for invalid ones."""
+        query = " ".join((props.get("query") or "").split())
+        if not MIN_QUERY_LENGTH <= len(query) <= MAX_QUERY_LENGTH:
+            return query, 0, CustomResponse.error(
+                msg=f"q must have between {MIN_QUERY_LENGTH} and {MAX_QUERY_LENGTH} characters", data={})
+
+        limit = DEFAULT_LIMIT
+        if props.get("limit"):
+            try:
+                limit = int(props["limit"])
+            except ValueError:
+                limit = 0
+            if not 1 <= limit <= MAX_LIMIT:
+                return query, 0, CustomResponse.error(msg=f"limit must be between 1 and {MAX_LIMIT}", data={})
+        return query, limit, None
+
+    @staticmethod
+    def _build_response(patient_registers: list) -> CustomResponse:
+        """Build the success response, best match first."""
+        return CustomResponse.success(
+            msg="Search patient registers use case executed successfully",
+            data={"registrations": [patient_register.to_primitives() for patient_register in patient_registers]}
+        )
@@ -0,0 +1,59 @@
+""""Short-lived cache of the counts around a CountPatientRepo."""
+
+import json
+from typing import Optional
+
+# domain - repos
+from src.app.create_patient_register.domain.repos.count_patient_repo import CountPatientRepo, PatientRegisterCount
+from src.app.shared.domain.criteria.criteria import Criteria
+
+# infra - aux
+from src.app.shared.infra.cache.query_cache import QueryCacheBackend
+
+
+def criteria_to_count_key(criteria: Criteria) -> str:
+    """Build a key from the filters only: every page and order of a search has the same count."""
+    filters = sorted(
+        (str(flt.field), str(flt.operator), str(flt.value)) for flt in criteria.filters
+    )
+    return json.dumps(filters, separators=(",", ":"))
+
+
+class CachedCountPatientRepo(CountPatientRepo):
+    """CountPatientRepo decorator caching the counts by filters for a short TTL.
+
+    Paging through a search counts once. Creates are not invalidated: a count
+    is at most ttl seconds old, which the page count of a UI tolerates.
+    """
+
+    def __init__(self, count_patient_repo: CountPatientRepo, backend: QueryCacheBackend, ttl: float = 30.0):
+        """Initialize CachedCountPatientRepo around the repository that runs the counts."""
+        super().__init__()
+        self._count_patient_repo = count_patient_repo
+        self._backend = backend
+        self._ttl = ttl
+
+    def count(self, criteria: Criteria) -> Optional[PatientRegisterCount]:
+        key = criteria_to_count_key(criteria)
+        cached = self._backend.get(key)
+        if cached is not None:
+            return PatientRegisterCount(*cached)
+        patient_register_count = self._count_patient_repo.count(criteria)
+        self._store(key, patient_register_count)
+        return patient_register_count
+
+    async def count_async(self, criteria: Criteria) -> Optional[PatientRegisterCount]:
+        key = criteria_to_count_key(criteria)
+        # the backend calls of a network cache run off the event loop
+        cached = await self._backend.get_async(key)
+        if cached is not None:
+            return PatientRegisterCount(*cached)
+        patient_register_count = await self._count_patient_repo.count_async(criteria)
+        if patient_register_count is not None:
+            await self._backend.set_async(key, tuple(patient_register_count), self._ttl)
+        return patient_register_count
+
+    def _store(self, key: str, patient_register_count: Optional[PatientRegisterCount]) -> None:
+        """Cache successful counts only (the repositories return None on errors)."""
+        if patient_register_count is not None:
+            self._backend.set(key, tuple(patient_register_count), self._ttl)
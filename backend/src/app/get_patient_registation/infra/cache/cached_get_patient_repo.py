@@ -0,0 +1,114 @@
+""""Read-through cache around a GetPatientRepo."""
+
+import json
+import threading
+
+# domain - repos
+from src.app.create_patient_register.domain.models.patient_register import PatientRegister
+from src.app.create_patient_register.domain.models.patient_register_read_model import PatientRegisterReadModel
+from src.app.create_patient_register.domain.repos.get_patient_repo import GetPatientRepo
+from src.app.shared.domain.criteria.criteria import Criteria
+
+# infra - aux
+from src.app.shared.infra.cache.query_cache import QueryCacheBackend
+from src.app.shared.infra.persistence.read_router import session_lsn
+
+
+def criteria_to_cache_key(criteria: Criteria) -> str:
+    """Build a canonical key: filters are AND-ed so their order does not matter."""
+    criteria_dict = criteria.to_dict()
+    criteria_dict["filters"] = sorted(
+        criteria_dict["filters"],
+        key=lambda flt: (str(flt["field"]), str(flt["operator"]), str(flt["value"]))
+    )
+    return json.dumps(criteria_dict, sort_keys=True, separators=(",", ":"), default=str)
+
+
+class CachedGetPatientRepo(GetPatientRepo):
+    """GetPatientRepo decorator caching results by normalized criteria.
+
+    Keys start with the generation of the cache; invalidate starts a new
+    generation, so a create costs one counter increment whatever the number of
+    cached queries. A result is stored under the generation read before its
+    query ran: a query racing with a create cannot store its older result as
+    current. A query that starts after the create may still read a lagging
+    replica and cache a result without the record for up to ttl seconds; the
+    writer's own session (session LSN) bypasses the cache.
+    """
+
+    GENERATION_COUNTER = "generation"
+
+    def __init__(self, get_patient_repo: GetPatientRepo, backend: QueryCacheBackend, ttl: float = 10.0):
+        """Initialize CachedGetPatientRepo around the repository that runs the queries."""
+        super().__init__()
+        self._get_patient_repo = get_patient_repo
+        self._backend = backend
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, criteria: Criteria) -> list[PatientRegister]:
+        key = self._cache_key(criteria)
+        # read-your-writes -> an entry may predate the session's write
+        if session_lsn.get() is None:
+            cached = self._lookup(key)
+            if cached is not None:
+                return cached
+        patient_registers = self._get_patient_repo.get(criteria)
+        self._store(key, patient_registers)
+        return patient_registers
+
+    async def get_async(self, criteria: Criteria) -> list[PatientRegister]:
+        # the backend calls of a network cache run off the event loop
+        key = self._build_key(await self._backend.get_counter_async(self.GENERATION_COUNTER), criteria)
+        if session_lsn.get() is None:
+            cached = self._count_lookup(await self._backend.get_async(key))
+            if cached is not None:
+                return cached
+        patient_registers = await self._get_patient_repo.get_async(criteria)
+        if patient_registers:
+            await self._backend.set_async(key, self._to_primitives(patient_registers), self._ttl)
+        return patient_registers
+
+    def invalidate(self) -> int:
+        """Start a new generation: every query cached so far is read again, returns the new generation."""
+        return self._backend.increment(self.GENERATION_COUNTER)
+
+    def stats(self) -> dict[str, int]:
+        """Get the hit and miss counters."""
+        return {"hits": self.hits, "misses": self.misses}
+
+    def _cache_key(self, criteria: Criteria) -> str:
+        """Build the key of the criteria in the current generation."""
+        return self._build_key(self._backend.get_counter(self.GENERATION_COUNTER), criteria)
+
+    @staticmethod
+    def _build_key(generation: int, criteria: Criteria) -> str:
+        """Build the key of the criteria in the given generation."""
+        return f"{generation}:{criteria_to_cache_key(criteria)}"
+
+    def _lookup(self, key: str):
+        """Read from the backend, count the hit or miss and rebuild the read models."""
+        return self._count_lookup(self._backend.get(key))
+
+    def _count_lookup(self, cached):
+        """Count the hit or miss and rebuild the read models."""
+        with self._lock:
+            if cached is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        if cached is None:
+            return None
+        return [PatientRegisterReadModel(primitives) for primitives in cached]
+
+    def _store(self, key: str, patient_registers: list[PatientRegister]) -> None:
+        """Cache the primitives of successful results only (the repositories return [] on errors)."""
+        if patient_registers:
+            self._backend.set(key, self._to_primitives(patient_registers), self._ttl)
+
+    @staticmethod
+    def _to_primitives(patient_registers: list[PatientRegister]) -> list[dict]:
+        """Get the JSON primitives cached for the results."""
+        return [patient_register.to_primitives() for patient_register in patient_registers]
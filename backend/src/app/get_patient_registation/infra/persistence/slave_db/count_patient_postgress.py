@@ -0,0 +1,148 @@
+""""PostgreSQL implementation of CountPatientRepo using planner estimates for large results."""
+
+import json
+import logging
+import os
+from typing import Any, Optional
+
+from sqlalchemy import Engine, text
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+# domain - repos
+from src.app.create_patient_register.domain.repos.count_patient_repo import CountPatientRepo, PatientRegisterCount
+from src.app.shared.domain.criteria.criteria import Criteria
+from src.app.shared.domain.criteria.criteria_to_sql import CriteriaToSQL
+
+# infra - aux
+from src.app.shared.infra.persistence.asyncpg_coercion import coerce_params
+from src.app.shared.infra.persistence.slave_postgres_sql.utils.patient_register_model import PatientRegisterModel
+from src.app.shared.infra.persistence.engine_registry import EngineRegistry
+from src.app.shared.infra.persistence.read_router import ReadRouter
+from src.app.shared.infra.persistence.replica_read_repo import ReplicaReadRepo
+
+logger = logging.getLogger(__name__)
+
+TABLE_NAME = "patientregister"
+
+# the statistics row count, -1 until the table is first vacuumed or analyzed;
+# a partitioned table has no rows of its own -> the sum over its partitions
+RELTUPLES_QUERY = f"""
+SELECT CAST(CASE WHEN parent.relkind = 'p' THEN (
+    SELECT COALESCE(SUM(GREATEST(child.reltuples, 0)), 0)
+    FROM pg_inherits JOIN pg_class AS child ON child.oid = pg_inherits.inhrelid
+    WHERE pg_inherits.inhparent = parent.oid
+) ELSE parent.reltuples END AS BIGINT)
+FROM pg_class AS parent
+WHERE parent.oid = CAST('{TABLE_NAME}' AS regclass)
+"""
+
+
+class CountPatientConfig:
+    """Search count configuration with environment-based defaults."""
+
+    def __init__(self):
+        self.enabled = self._get_env_var(
+            'COUNT_ENABLED', 'true').lower() == 'true'
+        self.exact_threshold = int(
+            self._get_env_var('COUNT_EXACT_THRESHOLD', '10000'))
+
+    @staticmethod
+    def _get_env_var(key: str, default: str) -> str:
+        """Get environment variable with fallback to default value."""
+        value = os.getenv(key)
+        if value is None:
+            return default
+        return value
+
+
+class CountPatientPostgress(ReplicaReadRepo, CountPatientRepo):
+    """PostgreSQL implementation of CountPatientRepo.
+
+    The count starts from the planner: the table statistics without filters,
+    the EXPLAIN row estimate with filters. Estimates above exact_threshold are
+    returned as they are; below it the rows are counted, stopping after
+    exact_threshold + 1 matches, so a wrong estimate never costs more than
+    scanning exact_threshold rows.
+    """
+
+    def __init__(
+        self,
+        async_engine: Optional[AsyncEngine] = None,
+        engine: Optional[Engine] = None,
+        read_router: Optional[ReadRouter] = None,
+        engine_registry: Optional[EngineRegistry] = None,
+        exact_threshold: int = 10000
+    ):
+        """Initialize CountPatientPostgress repository on the replica engines."""
+        super().__init__(engine=engine, async_engine=async_engine, read_router=read_router,
+                         engine_registry=engine_registry)
+        self._exact_threshold = exact_threshold
+
+    def count(self, criteria: Criteria) -> Optional[PatientRegisterCount]:
+        try:
+            criteria_to_sql = self._build_criteria_to_sql(criteria)
+            estimate_query, params = self._get_estimate_query(criteria_to_sql)
+            bounded_query, _ = criteria_to_sql.get_count_query_parametrized(self._exact_threshold + 1)
+
+            with Session(self._get_engine()) as db:
+                estimate = self._parse_estimate(db.execute(text(estimate_query), params).scalar_one())
+                if estimate > self._exact_threshold:
+                    return PatientRegisterCount(estimate, True)
+                counted = db.execute(text(bounded_query), params).scalar_one()
+            return self._to_count(estimate, counted)
+
+        except Exception as e:
+            logger.error("counting patient registers failed: %r", e)
+            return None
+
+    async def count_async(self, criteria: Criteria) -> Optional[PatientRegisterCount]:
+        """Count the matching patient registers using the asyncpg driver."""
+        try:
+            criteria_to_sql = self._build_criteria_to_sql(criteria)
+            estimate_query, params = self._get_estimate_query(criteria_to_sql)
+            bounded_query, _ = criteria_to_sql.get_count_query_parametrized(self._exact_threshold + 1)
+            # asyncpg binds python types -> coerce the query string values per column
+            params = coerce_params(PatientRegisterModel.__table__, params, criteria_to_sql.param_fields)
+
+            async with AsyncSession(self._get_async_engine()) as db:
+                estimate = self._parse_estimate((await db.execute(text(estimate_query), params)).scalar_one())
+                if estimate > self._exact_threshold:
+                    return PatientRegisterCount(estimate, True)
+                counted = (await db.execute(text(bounded_query), params)).scalar_one()
+            return self._to_count(estimate, counted)
+
+        except Exception as e:
+            logger.error("counting patient registers failed: %r", e)
+            return None
+
+    @staticmethod
+    def _build_criteria_to_sql(criteria: Criteria) -> CriteriaToSQL:
+        """Translate the criteria filters, the count ignores order and pagination."""
+        criteria_to_sql = CriteriaToSQL()
+        criteria_to_sql.set_table_name(TABLE_NAME)
+        criteria_to_sql.set_where_by_criteria(criteria)
+        return criteria_to_sql
+
+    @staticmethod
+    def _get_estimate_query(criteria_to_sql: CriteriaToSQL) -> tuple[str, dict]:
+        """Get the statistics row count without filters, the EXPLAIN of the filtered count otherwise."""
+        if not criteria_to_sql.where_clause:
+            return RELTUPLES_QUERY, {}
+        select_query, params = criteria_to_sql.get_select_query_parametrized()
+        return f"EXPLAIN (FORMAT JSON) {select_query}", params
+
+    @staticmethod
+    def _parse_estimate(value: Any) -> int:
+        """Get the row estimate from reltuples or an EXPLAIN (FORMAT JSON) plan (a string with asyncpg)."""
+        if isinstance(value, str):
+            value = json.loads(value)
+        if isinstance(value, list):
+            value = value[0]["Plan"]["Plan Rows"]
+        return int(value)
+
+    def _to_count(self, estimate: int, counted: int) -> PatientRegisterCount:
+        """Exact when the bounded count finished, else the best lower bound known."""
+        if counted <= self._exact_threshold:
+            return PatientRegisterCount(counted, False)
+        return PatientRegisterCount(max(estimate, counted), True)
@@ -0,0 +1,55 @@
+""""PostgreSQL implementation of ExportPatientRepo using a server-side cursor."""
+
+from typing import Any, Iterator, Optional
+
+from sqlalchemy import Engine, text
+
+# domain - repos
+from src.app.create_patient_register.domain.models.patient_register_read_model import PatientRegisterReadModel
+from src.app.create_patient_register.domain.repos.export_patient_repo import ExportPatientRepo
+from src.app.shared.domain.criteria.criteria import Criteria
+from src.app.shared.domain.criteria.criteria_to_sql import CriteriaToSQL
+
+# infra - aux
+from src.app.shared.infra.persistence.engine_registry import EngineRegistry
+from src.app.shared.infra.persistence.read_router import ReadRouter
+from src.app.shared.infra.persistence.replica_read_repo import ReplicaReadRepo
+
+
+class ExportPatientPostgress(ReplicaReadRepo, ExportPatientRepo):
+    """PostgreSQL implementation of ExportPatientRepo."""
+
+    def __init__(
+        self,
+        engine: Optional[Engine] = None,
+        yield_per: int = 1000,
+        read_router: Optional[ReadRouter] = None,
+        engine_registry: Optional[EngineRegistry] = None
+    ):
+        """Initialize ExportPatientPostgress repository on the replica engine, routed like the other reads."""
+        super().__init__(engine=engine, read_router=read_router, engine_registry=engine_registry)
+        self._yield_per = yield_per
+
+    def stream(self, criteria: Criteria) -> Iterator[dict[str, Any]]:
+        """Fetch the rows in chunks of yield_per from a server-side (named) cursor."""
+        criteria_to_sql = self._build_criteria_to_sql(criteria)
+        sql_query, params = criteria_to_sql.get_select_query_parametrized()
+
+        with self._get_engine().connect() as connection:
+            result = connection.execution_options(
+                stream_results=True,
+                yield_per=self._yield_per
+            ).execute(text(sql_query), params)
+            columns = list(result.keys())
+            for row in result:
+                yield PatientRegisterReadModel.from_row(columns, row).to_primitives()
+
+    @staticmethod
+    def _build_criteria_to_sql(criteria: Criteria) -> CriteriaToSQL:
+        """Translate the criteria fields, filters and order, without pagination, into the SELECT."""
+        criteria_to_sql = CriteriaToSQL()
+        criteria_to_sql.set_table_name("patientregister")
+        criteria_to_sql.set_fields_by_criteria(criteria)
+        criteria_to_sql.set_where_by_criteria(criteria)
+        criteria_to_sql.set_order_by_criteria(criteria)
+        return criteria_to_sql
@@ -1,70 +1,137 @@
 """"PostgreSQL implementation of GetPatientRepo."""
 
+import logging
+import time
+from typing import Any, Iterable, Optional
+
 from sqlalchemy.orm import Session
-from sqlalchemy import text
+from sqlalchemy import Engine, text
 
 # domain - repos
-from src.app.create_patient_register.domain.models.patient_register import PatientRegister
+from src.app.create_patient_register.domain.models.patient_register import PartialPatientRegister, PatientRegister
+from src.app.create_patient_register.domain.models.patient_register_read_model import PatientRegisterReadModel
 from src.app.create_patient_register.domain.repos.get_patient_repo import GetPatientRepo
+from src.app.shared.domain.criteria.criteria import Criteria
 from src.app.shared.domain.criteria.criteria_to_sql import CriteriaToSQL
 
 # infra - aux
-from src.app.shared.infra.persistence.slave_postgres_sql.utils.slave_connection import slave_connection_engine
+from src.app.shared.infra.observability.metrics import criteria_shape, db_query_duration_seconds
+from src.app.shared.infra.persistence.engine_registry import EngineRegistry
+from src.app.shared.infra.persistence.read_router import ReadRouter
+from src.app.shared.infra.persistence.replica_read_repo import ReplicaReadRepo
+from src.app.shared.infra.persistence.slave_postgres_sql.utils.patient_register_model import PatientRegisterModel
 
+logger = logging.getLogger(__name__)
 
-class GetPatientPostgress(GetPatientRepo):
-    """PostgreSQL implementation of GetPatientRepo."""
+# columns a criteria may name, anything else is labelled "other" in the metrics
+SEARCHABLE_FIELDS = frozenset(PatientRegisterModel.__table__.columns.keys())
 
-    def __init__(self):
-        """Initialize GetPatientPostgress repository."""
-        super().__init__()
 
-    def get(self, criteria) -> list[PatientRegister]:
+class GetPatientPostgress(ReplicaReadRepo, GetPatientRepo):
+    """PostgreSQL implementation of GetPatientRepo."""
+
+    def __init__(
+        self,
+        engine: Optional[Engine] = None,
+        trusted: bool = True,
+        read_router: Optional[ReadRouter] = None,
+        engine_registry: Optional[EngineRegistry] = None
+    ):
+        """Initialize GetPatientPostgress repository on the replica engine.
+
+        trusted=True maps rows straight to PatientRegisterReadModel, False runs
+        every row through PatientRegister validation. With a read_router every
+        query runs on the engine it chooses instead of the replica engine, with
+        an engine_registry on its replica endpoints in turn.
+        """
+        super().__init__(engine=engine, read_router=read_router, engine_registry=engine_registry)
+        self._trusted = trusted
+
+    def get(self, criteria) -> list[PatientRegister | PatientRegisterReadModel]:
 
         try:
-            db: Session = Session(slave_connection_engine)
+            db: Session = Session(self._get_engine())
 
             # Build SQL query
-            criteria_to_sql = CriteriaToSQL()
-            criteria_to_sql.set_table_name("patientregister")
-            criteria_to_sql.set_where_by_criteria(criteria)
-            criteria_to_sql.set_order_by_criteria(criteria)
-            criteria_to_sql.set_pagination_by_criteria(criteria)
+            criteria_to_sql = self._build_criteria_to_sql(criteria)
             sql_query, params = criteria_to_sql.get_select_query_parametrized()
 
             # execute query
-            print(f"\n\n ====== Executing SQL Query START ======")
-            print(f"sql_query -> {sql_query}")
+            # the parameters hold filter values (patient data) -> only the statement is logged
+            logger.debug("executing search query", extra={"sql": sql_query})
+            start = time.perf_counter()
             result = db.execute(text(sql_query), params)
-            print(f"====== Executing SQL Query END ====== \n")
 
             # Convert result to list of dictionaries
             rows = result.fetchall()
             columns = result.keys()
-            result_dicts = [dict(zip(columns, row)) for row in rows]
             db.close()
+            self._observe_query(criteria, time.perf_counter() - start)
 
-            patient_register_list: list[PatientRegister] = []
-
-            for row in result_dicts:
-                try:
+            return self._to_patient_registers(columns, rows)
 
-                    # parse uuid to string
-                    uuid_value = row.get('uuid')
-                    if uuid_value is not None:
-                        uuid_value = str(uuid_value)
-                    row["uuid"] = uuid_value
+        except Exception as e:
+            logger.error("getting patient registration data failed: %r", e)
+            return []
 
-                    # parse row into PatientRegister and convert to dict
+    def _observe_query(self, criteria: Criteria, duration: float) -> None:
+        """Record the query duration labelled by the criteria shape."""
+        db_query_duration_seconds.observe(
+            duration, type(self).__name__, criteria_shape(criteria, SEARCHABLE_FIELDS))
+
+    @staticmethod
+    def _build_criteria_to_sql(criteria: Criteria) -> CriteriaToSQL:
+        """Translate the criteria into the SELECT over the patient register table."""
+        criteria_to_sql = CriteriaToSQL()
+        criteria_to_sql.set_table_name("patientregister")
+        criteria_to_sql.set_fields_by_criteria(criteria)
+        criteria_to_sql.set_where_by_criteria(criteria)
+        criteria_to_sql.set_order_by_criteria(criteria)
+        # one row past the page -> the use case tells whether there is a next page
+        criteria_to_sql.set_pagination_by_criteria(criteria, lookahead=1)
+        return criteria_to_sql
+
+    def _to_patient_registers(
+        self,
+        columns: Iterable[str],
+        rows: Iterable[Any]
+    ) -> list[PatientRegister | PatientRegisterReadModel]:
+        """Convert result rows into patient registers."""
+        columns = list(columns)
+        if self._trusted:
+            return [PatientRegisterReadModel.from_row(columns, row) for row in rows]
+        return self._to_validated_patient_registers(columns, rows)
+
+    @staticmethod
+    def _to_validated_patient_registers(
+        columns: list[str],
+        rows: Iterable[Any]
+    ) -> list[PatientRegister | PartialPatientRegister]:
+        """Validate every row with PatientRegister (a projection with its fields only), skipping the invalid ones."""
+        result_dicts = [dict(zip(columns, row)) for row in rows]
+        # fields= selected some columns only -> validate the projection
+        partial_fields = tuple(columns) if set(columns) != set(SEARCHABLE_FIELDS) else None
+
+        patient_register_list: list[PatientRegister | PartialPatientRegister] = []
+
+        for row in result_dicts:
+            try:
+
+                # parse uuid to string
+                uuid_value = row.get('uuid')
+                if uuid_value is not None:
+                    uuid_value = str(uuid_value)
+                row["uuid"] = uuid_value
+
+                # parse row into PatientRegister and convert to dict
+                if partial_fields is not None:
+                    patient_register_parsed = PartialPatientRegister(row, partial_fields)
+                else:
                     patient_register_parsed = PatientRegister(row)
-                    patient_register_list.append(patient_register_parsed)
-
-                except Exception as e:
-                    print(f"Error creating PatientRegister: {e}")
-                    continue
+                patient_register_list.append(patient_register_parsed)
 
-            return patient_register_list
+            except Exception as e:
+                logger.warning("skipping invalid patient register row: %r", e)
+                continue
 
-        except Exception as e:
-            print(f"Error getting patient registration data: {e}")
-            return []
+        return patient_register_list
@@ -0,0 +1,62 @@
+""""PostgreSQL implementation of GetPatientRepo using the async engine."""
+
+import logging
+import time
+from typing import Optional
+
+from sqlalchemy import Engine, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+# domain - repos
+from src.app.create_patient_register.domain.models.patient_register import PatientRegister
+from src.app.create_patient_register.domain.models.patient_register_read_model import PatientRegisterReadModel
+from src.app.shared.domain.criteria.criteria import Criteria
+
+# infra
+from src.app.get_patient_registation.infra.persistence.slave_db.get_patient_postgress import GetPatientPostgress
+
+# infra - aux
+from src.app.shared.infra.persistence.asyncpg_coercion import coerce_params
+from src.app.shared.infra.persistence.engine_registry import EngineRegistry
+from src.app.shared.infra.persistence.read_router import ReadRouter
+from src.app.shared.infra.persistence.slave_postgres_sql.utils.patient_register_model import PatientRegisterModel
+
+logger = logging.getLogger(__name__)
+
+
+class GetPatientPostgressAsync(GetPatientPostgress):
+    """PostgreSQL implementation of GetPatientRepo that does not block the event loop."""
+
+    def __init__(
+        self,
+        async_engine: Optional[AsyncEngine] = None,
+        engine: Optional[Engine] = None,
+        trusted: bool = True,
+        read_router: Optional[ReadRouter] = None,
+        engine_registry: Optional[EngineRegistry] = None
+    ):
+        """Initialize GetPatientPostgressAsync repository on the replica engines."""
+        super().__init__(engine, trusted, read_router, engine_registry)
+        self._async_engine = async_engine
+
+    async def get_async(self, criteria: Criteria) -> list[PatientRegister | PatientRegisterReadModel]:
+        """Get patient registration data using the asyncpg driver."""
+        try:
+            criteria_to_sql = self._build_criteria_to_sql(criteria)
+            sql_query, params = criteria_to_sql.get_select_query_parametrized()
+
+            # asyncpg binds python types -> coerce the query string values per column
+            params = coerce_params(PatientRegisterModel.__table__, params, criteria_to_sql.param_fields)
+
+            start = time.perf_counter()
+            async with AsyncSession(self._get_async_engine()) as db:
+                result = await db.execute(text(sql_query), params)
+                rows = result.fetchall()
+                columns = result.keys()
+            self._observe_query(criteria, time.perf_counter() - start)
+
+            return self._to_patient_registers(columns, rows)
+
+        except Exception as e:
+            logger.error("getting patient registration data failed: %r", e)
+            return []
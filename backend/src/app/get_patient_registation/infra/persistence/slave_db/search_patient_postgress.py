@@ -0,0 +1,103 @@
+""""PostgreSQL implementation of SearchPatientRepo on the pg_trgm indexes."""
+
+import logging
+import time
+from typing import Any, Iterable, Optional
+
+from sqlalchemy import Engine, text
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+# domain - repos
+from src.app.create_patient_register.domain.models.patient_register_read_model import PatientRegisterReadModel
+from src.app.create_patient_register.domain.repos.search_patient_repo import SearchPatientRepo
+from src.app.shared.domain.criteria.criteria import escape_like
+
+# infra - aux
+from src.app.shared.infra.observability.metrics import db_query_duration_seconds
+from src.app.shared.infra.persistence.engine_registry import EngineRegistry
+from src.app.shared.infra.persistence.read_router import ReadRouter
+from src.app.shared.infra.persistence.replica_read_repo import ReplicaReadRepo
+
+logger = logging.getLogger(__name__)
+
+# the name expression must match idx_patient_full_name_trgm verbatim to use it
+FULL_NAME_SQL = "(first_name || ' ' || last_name)"
+
+# every predicate is served by a trigram GIN index (BitmapOr of the three)
+# -> the score is only computed for the candidate rows
+SEARCH_QUERY = f"""
+SELECT *, GREATEST(
+    word_similarity(:query, {FULL_NAME_SQL}),
+    similarity(:query, email),
+    similarity(:query, phone_number)
+) AS score
+FROM patientregister
+WHERE :query <% {FULL_NAME_SQL}
+    OR email ILIKE :pattern
+    OR phone_number ILIKE :pattern
+ORDER BY score DESC, uuid
+LIMIT :limit
+"""
+
+
+class SearchPatientPostgress(ReplicaReadRepo, SearchPatientRepo):
+    """PostgreSQL implementation of SearchPatientRepo."""
+
+    def __init__(
+        self,
+        async_engine: Optional[AsyncEngine] = None,
+        engine: Optional[Engine] = None,
+        read_router: Optional[ReadRouter] = None,
+        engine_registry: Optional[EngineRegistry] = None
+    ):
+        """Initialize SearchPatientPostgress repository on the replica engines."""
+        super().__init__(engine=engine, async_engine=async_engine, read_router=read_router,
+                         engine_registry=engine_registry)
+
+    def search(self, query: str, limit: int) -> list[PatientRegisterReadModel]:
+        """Get the best matching patient registers, ranked by trigram similarity."""
+        try:
+            start = time.perf_counter()
+            with Session(self._get_engine()) as db:
+                result = db.execute(text(SEARCH_QUERY), self._build_params(query, limit))
+                rows = result.fetchall()
+                columns = result.keys()
+            self._observe_query(time.perf_counter() - start)
+
+            return self._to_patient_registers(columns, rows)
+
+        except Exception as e:
+            logger.error("searching patient registers failed: %r", e)
+            return []
+
+    async def search_async(self, query: str, limit: int) -> list[PatientRegisterReadModel]:
+        """Get the best matching patient registers using the asyncpg driver."""
+        try:
+            start = time.perf_counter()
+            async with AsyncSession(self._get_async_engine()) as db:
+                result = await db.execute(text(SEARCH_QUERY), self._build_params(query, limit))
+                rows = result.fetchall()
+                columns = result.keys()
+            self._observe_query(time.perf_counter() - start)
+
+            return self._to_patient_registers(columns, rows)
+
+        except Exception as e:
+            logger.error("searching patient registers failed: %r", e)
+            return []
+
+    @staticmethod
+    def _build_params(query: str, limit: int) -> dict[str, Any]:
+        """Bind the query for the similarity operators and as a literal substring pattern."""
+        return {"query": query, "pattern": f"%{escape_like(query)}%", "limit": limit}
+
+    def _observe_query(self, duration: float) -> None:
+        """Record the query duration, the search has a single shape."""
+        db_query_duration_seconds.observe(duration, type(self).__name__, "search")
+
+    @staticmethod
+    def _to_patient_registers(columns: Iterable[str], rows: Iterable[Any]) -> list[PatientRegisterReadModel]:
+        """Map the rows, score included, to read models."""
+        columns = list(columns)
+        return [PatientRegisterReadModel.from_row(columns, row) for row in rows]
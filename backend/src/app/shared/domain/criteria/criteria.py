@@ -1,6 +1,12 @@
 """"Domain criteria for patient registration."""
 
-from typing import Literal
+import base64
+import binascii
+import json
+import logging
+from typing import Literal, Optional, get_args
+
+logger = logging.getLogger(__name__)
 
 
 Operator = Literal[
@@ -9,8 +15,83 @@ Operator = Literal[
     "LESS_THAN",
     "LESS_THAN_OR_EQUAL",
     "GREATER_THAN",
-    "GREATER_THAN_OR_EQUAL"
+    "GREATER_THAN_OR_EQUAL",
+    # text search, served by the pg_trgm GIN indexes
+    "CONTAINS",
+    "ILIKE",
+    "SIMILAR",
+    # comma separated values: IN a list, BETWEEN two bounds (inclusive)
+    "IN",
+    "BETWEEN",
+    # array columns (allergies, medical_history, current_medications), served by their GIN indexes
+    "CONTAINS_ANY",
+    "CONTAINS_ALL"
 ]
+OPERATORS = frozenset(get_args(Operator))
+
+# columns a client may select with fields=, in table order; uuid is always selected
+SELECTABLE_FIELDS = (
+    "uuid",
+    "first_name",
+    "last_name",
+    "date_of_birth",
+    "email",
+    "phone_number",
+    "address",
+    "emergency_contact",
+    "allergies",
+    "medical_history",
+    "current_medications",
+)
+
+# column -> type in the database, the operators a filter may use depend on it
+FIELD_TYPES = {
+    "uuid": "uuid",
+    "first_name": "text",
+    "last_name": "text",
+    "date_of_birth": "date",
+    "email": "text",
+    "phone_number": "text",
+    "address": "text",
+    "emergency_contact": "text",
+    "allergies": "text[]",
+    "medical_history": "text[]",
+    "current_medications": "text[]",
+}
+ARRAY_FIELDS = frozenset(field for field, field_type in FIELD_TYPES.items() if field_type == "text[]")
+
+# columns a client may order by: the scalar columns with a keyset index (migration 06)
+ORDER_FIELDS = ("uuid", "first_name", "last_name", "date_of_birth")
+
+# largest page a client may ask for, a page is always a bounded LIMIT
+MAX_PER_PAGE = 100
+
+# operators whose value is a comma separated list
+LIST_OPERATORS = frozenset({"IN", "BETWEEN", "CONTAINS_ANY", "CONTAINS_ALL"})
+# the only operators of the array columns, and only of them
+ARRAY_OPERATORS = frozenset({"CONTAINS_ANY", "CONTAINS_ALL"})
+# text pattern operators, only on the text columns with a pg_trgm index
+TEXT_OPERATORS = frozenset({"CONTAINS", "ILIKE", "SIMILAR"})
+TRIGRAM_FIELDS = frozenset({"first_name", "last_name", "email", "phone_number"})
+
+
+class CriteriaError(ValueError):
+    """Raised when the query parameters do not describe a valid criteria."""
+
+
+def escape_like(value: str) -> str:
+    """Escape the LIKE wildcards so the value matches literally."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def check_operator(field: str, operator: str) -> None:
+    """Raise CriteriaError unless the operator applies to the type of the field."""
+    if (field in ARRAY_FIELDS) != (operator in ARRAY_OPERATORS):
+        if field in ARRAY_FIELDS:
+            raise CriteriaError(f"{field} only supports CONTAINS_ANY and CONTAINS_ALL")
+        raise CriteriaError(f"{operator} only applies to {', '.join(sorted(ARRAY_FIELDS))}")
+    if operator in TEXT_OPERATORS and field not in TRIGRAM_FIELDS:
+        raise CriteriaError(f"{operator} only applies to {', '.join(sorted(TRIGRAM_FIELDS))}")
 
 
 class Filter:
@@ -29,12 +110,38 @@ class Filter:
             "LESS_THAN": "<",
             "LESS_THAN_OR_EQUAL": "<=",
             "GREATER_THAN": ">",
-            "GREATER_THAN_OR_EQUAL": ">="
+            "GREATER_THAN_OR_EQUAL": ">=",
+            # case-insensitive substring
+            "CONTAINS": "ILIKE",
+            # case-insensitive pattern with the client's own % and _ wildcards
+            "ILIKE": "ILIKE",
+            # pg_trgm similarity above pg_trgm.similarity_threshold (0.3 by default)
+            "SIMILAR": "%",
+            "IN": "IN",
+            "BETWEEN": "BETWEEN",
+            # array overlap / containment
+            "CONTAINS_ANY": "&&",
+            "CONTAINS_ALL": "@>"
         }
         return operator_mapping.get(self.operator, "=")
 
+    def get_value_sql(self) -> any:
+        """Get the value bound for the operator."""
+        if self.operator == "CONTAINS":
+            return f"%{escape_like(str(self.value))}%"
+        if self.operator in LIST_OPERATORS:
+            return self.get_values()
+        return self.value
+
+    def get_values(self) -> list:
+        """Get the values of a list operator, split on commas when given as a string."""
+        if isinstance(self.value, (list, tuple)):
+            return list(self.value)
+        return [value.strip() for value in str(self.value).split(",") if value.strip()]
+
 
 OrderDirection = Literal["ASC", "DESC"]
+ORDER_DIRECTIONS = frozenset(get_args(OrderDirection))
 
 
 class Order:
@@ -53,13 +160,51 @@ class Pagination:
         self.per_page = per_page
 
 
+class CursorPagination:
+    """Keyset pagination: the page that follows the row encoded in the cursor."""
+
+    def __init__(self, per_page: int, cursor: Optional[str] = None):
+        self.per_page = per_page
+        self.cursor = cursor
+
+    def get_after(self) -> Optional[tuple[list, str]]:
+        """Get the (sort key values, uuid) of the last row of the previous page."""
+        if not self.cursor:
+            return None
+        return Cursor.decode(self.cursor)
+
+
+class Cursor:
+    """Opaque cursor encoding the sort key and uuid of the last row of a page."""
+
+    @staticmethod
+    def encode(sort_values: list, uuid: str) -> str:
+        """Encode the sort key values and uuid into an url-safe token."""
+        raw = json.dumps([sort_values, uuid], separators=(",", ":"))
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    @staticmethod
+    def decode(cursor: str) -> Optional[tuple[list, str]]:
+        """Decode a token built by encode, returning None when it is malformed."""
+        try:
+            padding = "=" * (-len(cursor) % 4)
+            sort_values, uuid = json.loads(base64.urlsafe_b64decode(cursor + padding))
+            if not isinstance(sort_values, list) or not isinstance(uuid, str):
+                return None
+            return sort_values, uuid
+        except (ValueError, TypeError, binascii.Error):
+            return None
+
+
 class Criteria:
     """Criteria class to handle query parameters for patient registration."""
 
     def __init__(self):
         self.filters: list[Filter] = []
         self.orders: Order = None
-        self.pagination: Pagination = None
+        self.pagination: Pagination | CursorPagination = None
+        # selected columns, None selects them all
+        self.fields: Optional[list[str]] = None
 
     def add_filter(self, filter: Filter) -> None:
         """Add filter to criteria."""
@@ -69,16 +214,21 @@ class Criteria:
         """Set orders to criteria."""
         self.orders = orders
 
-    def set_pagination(self, pagination: Pagination) -> None:
+    def set_pagination(self, pagination: Pagination | CursorPagination) -> None:
         """Set pagination to criteria."""
         self.pagination = pagination
 
+    def set_fields(self, fields: Optional[list[str]]) -> None:
+        """Set the selected columns to criteria."""
+        self.fields = fields
+
     def to_dict(self) -> dict[str, any]:
         """Convert criteria to dictionary."""
         return {
             "filters": [filter.__dict__ for filter in self.filters],
             "orders": self.orders.__dict__ if self.orders else None,
-            "pagination": self.pagination.__dict__ if self.pagination else None
+            "pagination": self.pagination.__dict__ if self.pagination else None,
+            "fields": self.fields
         }
 
 
@@ -86,21 +236,23 @@ class CriteriaParser:
     """Criteria class to handle query parameters for patient registration."""
 
     def dict_to_criteria(self, query_params:  dict[str, any]) -> Criteria:
-        """Convert dictionary to criteria attributes."""
+        """Convert dictionary to criteria attributes, raising CriteriaError for an invalid filter, order or page."""
 
         criteria = Criteria()
 
-        print(f"\n\n ====== Criteria ======")
-
         # get data for ordering
         order_by_key = "orderBy"
         order_dir_key = "order"
         if order_by_key in query_params and order_dir_key in query_params:
+            # both are written into the ORDER BY -> only known columns and directions
             order = Order(
                 field=query_params[order_by_key],
-                direction=query_params[order_dir_key]
+                direction=str(query_params[order_dir_key]).upper()
             )
-            print(f"order {order.__dict__}")
+            if order.field not in ORDER_FIELDS:
+                raise CriteriaError(f"orderBy must be one of {', '.join(ORDER_FIELDS)}")
+            if order.direction not in ORDER_DIRECTIONS:
+                raise CriteriaError("order must be ASC or DESC")
             criteria.set_orders(order)
 
         # Parse filters from query_params
@@ -117,7 +269,7 @@ class CriteriaParser:
                     operator=query_params[operator_key],
                     value=query_params[value_key]
                 )
-                print(f"filter_obj {filter_obj.__dict__}")
+                self._validate_filter(filter_obj)
                 criteria.add_filter(filter_obj)
                 # # Remove used keys
                 # query_params.pop(field_key, None)
@@ -129,16 +281,17 @@ class CriteriaParser:
                 continue
 
         # Parse pagination from query_params
-        try:
+        # keys
+        page_key = "page"
+        per_page_key = "per_page"
+        # present (even empty, for the first page) -> keyset pagination
+        cursor_key = "cursor"
 
-            # keys
-            page_key = "page"
-            per_page_key = "per_page"
-
-            # values
-            page_value = 1
-            per_page_value = 10
+        # values
+        page_value = 1
+        per_page_value = 10
 
+        try:
             if page_key in query_params and query_params[page_key]:
                 value_aux = int(query_params[page_key])
                 page_value = value_aux if value_aux > 0 else page_value
@@ -146,22 +299,52 @@ class CriteriaParser:
             if per_page_key in query_params and query_params[per_page_key]:
                 value_aux = int(query_params[per_page_key])
                 per_page_value = value_aux if value_aux > 0 else per_page_value
-
+        except ValueError:
+            raise CriteriaError("page and per_page must be integers")
+        if per_page_value > MAX_PER_PAGE:
+            raise CriteriaError(f"per_page must be at most {MAX_PER_PAGE}")
+
+        if cursor_key in query_params:
+            pagination = CursorPagination(
+                per_page=per_page_value,
+                cursor=query_params[cursor_key] or None
+            )
+        else:
             pagination = Pagination(
                 page=page_value,
                 per_page=per_page_value
             )
-            print(f"pagination {pagination.__dict__}")
-            criteria.set_pagination(pagination)
-
-            # # Remove used keys
-            # query_params.pop(page_key, None)
-            # query_params.pop(per_page_key, None)
-        except RuntimeError:
-            pass
-
-        print(f"criteria {criteria.to_dict()}")
-
-        print(f"====== Criteria END ======\n")
+        criteria.set_pagination(pagination)
+
+        # Parse the selected columns, comma separated
+        # only whitelisted names reach the SELECT list, uuid identifies every row
+        fields_key = "fields"
+        if query_params.get(fields_key):
+            requested = {field.strip() for field in query_params[fields_key].split(",")}
+            criteria.set_fields([field for field in SELECTABLE_FIELDS if field in requested or field == "uuid"])
+
+        # filter values are patient data -> only the shape of the criteria is logged
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "criteria parsed",
+                extra={
+                    "filters": [f"{flt.field} {flt.operator}" for flt in criteria.filters],
+                    "pagination": type(criteria.pagination).__name__,
+                    "fields": criteria.fields,
+                }
+            )
 
         return criteria
+
+    @staticmethod
+    def _validate_filter(flt: Filter) -> None:
+        """Reject unknown fields and operators, operators the column type lacks and wrong value counts."""
+        if flt.field not in SELECTABLE_FIELDS:
+            raise CriteriaError(f"unknown filter field {flt.field!r}")
+        if flt.operator not in OPERATORS:
+            raise CriteriaError(f"unknown operator {flt.operator!r}")
+        check_operator(flt.field, flt.operator)
+        if flt.operator == "BETWEEN" and len(flt.get_values()) != 2:
+            raise CriteriaError("BETWEEN expects two comma separated values")
+        if flt.operator in LIST_OPERATORS and not flt.get_values():
+            raise CriteriaError(f"{flt.operator} expects at least one value")
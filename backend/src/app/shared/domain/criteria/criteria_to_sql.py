@@ -1,6 +1,21 @@
 """Convert Criteria object to SQL query string."""
 
-from src.app.shared.domain.criteria.criteria import Criteria
+from typing import Optional
+
+from src.app.shared.domain.criteria.criteria import (
+    ORDER_DIRECTIONS,
+    ORDER_FIELDS,
+    SELECTABLE_FIELDS,
+    TEXT_OPERATORS,
+    Criteria,
+    CursorPagination,
+    Filter,
+    check_operator
+)
+
+
+# patientregister is hash partitioned on uuid
+PARTITION_KEY = "uuid"
 
 
 class CriteriaToSQL:
@@ -10,13 +25,26 @@ class CriteriaToSQL:
         self.table_name: str = ""
         self.where_clause: list = []
         self.params: dict = {}
+        # param name -> column it is compared with (drivers with typed binds need it)
+        self.param_fields: dict[str, str] = {}
         self.order_clause: str = ""
         self.pagination_clause: str = ""
+        self.select_columns: list[str] = []
 
     def set_table_name(self, table_name: str) -> None:
         """Set the table name for SQL queries."""
         self.table_name = table_name
 
+    def set_fields_by_criteria(self, criteria: Criteria) -> None:
+        """Select only the criteria fields, plus the keyset sort column the next cursor is built from."""
+        if not criteria.fields:
+            return
+
+        selected = set(criteria.fields) | {"uuid"}
+        if isinstance(criteria.pagination, CursorPagination):
+            selected.update(self._get_cursor_sort_fields(criteria))
+        self.select_columns = [field for field in SELECTABLE_FIELDS if field in selected]
+
     def set_where_by_criteria(self, criteria: Criteria) -> None:
         """Set WHERE clause based on Criteria filters."""
 
@@ -27,33 +55,167 @@ class CriteriaToSQL:
         filter_clauses = []
         index = 1
         for flt in criteria.filters:
-            clause = f"{flt.field} {flt.get_operator_sql()} :where_param_{index}"
-            filter_clauses.append(clause)
-            self.params[f"where_param_{index}"] = flt.value
+            filter_clauses.append(self._get_filter_clause(flt, f"where_param_{index}"))
             index += 1
-        self.where_clause = filter_clauses
+        self.where_clause.extend(filter_clauses)
+
+    def _get_filter_clause(self, flt: Filter, param_name: str) -> str:
+        """Bind the filter value(s) and get its WHERE condition."""
+        self._check_field(flt.field)
+        # an operator the column type does not support is a SQL error, not an empty result
+        check_operator(flt.field, flt.operator)
+        operator_sql = flt.get_operator_sql()
+        value = flt.get_value_sql()
+
+        if flt.operator in ("IN", "BETWEEN"):
+            # one parameter per value -> each one is typed (coerced) like the column
+            placeholders = []
+            for position, item in enumerate(value, start=1):
+                self._bind(f"{param_name}_{position}", flt.field, item)
+                placeholders.append(self._get_placeholder(flt.field, f"{param_name}_{position}"))
+            if flt.operator == "BETWEEN":
+                if len(placeholders) != 2:
+                    raise ValueError("BETWEEN expects two comma separated values")
+                return f"{flt.field} BETWEEN {placeholders[0]} AND {placeholders[1]}"
+            if not placeholders:
+                raise ValueError("IN expects at least one value")
+            return f"{flt.field} IN ({', '.join(placeholders)})"
+
+        self._bind(param_name, flt.field, value)
+        if flt.operator in ("CONTAINS_ANY", "CONTAINS_ALL"):
+            # one array parameter, typed like the TEXT[] columns for the GIN index
+            return f"{flt.field} {operator_sql} CAST(:{param_name} AS TEXT[])"
+        if flt.operator in TEXT_OPERATORS:
+            return f"{flt.field} {operator_sql} :{param_name}"
+        return f"{flt.field} {operator_sql} {self._get_placeholder(flt.field, param_name)}"
+
+    @staticmethod
+    def _check_field(field: str) -> str:
+        """Get the field, which is written into the SQL as is, when it is a known column."""
+        if field not in SELECTABLE_FIELDS:
+            raise ValueError(f"unknown field {field!r}")
+        return field
+
+    @staticmethod
+    def _check_order_field(field: str) -> str:
+        """Get the order field, which is written into the SQL as is, when it has a keyset index."""
+        if field not in ORDER_FIELDS:
+            raise ValueError(f"cannot order by {field!r}")
+        return field
+
+    @staticmethod
+    def _get_placeholder(field: str, param_name: str) -> str:
+        """Get the placeholder of a value compared with the field.
+
+        Values compared with the partition key are typed as uuid in the
+        statement, so the planner prunes the hash partitions whatever type
+        the driver sends (also for generic plans of prepared statements).
+        """
+        if field == PARTITION_KEY:
+            return f"CAST(:{param_name} AS UUID)"
+        return f":{param_name}"
+
+    def _bind(self, param_name: str, field: str, value) -> None:
+        """Add a parameter compared with the field."""
+        self.params[param_name] = value
+        self.param_fields[param_name] = field
 
     def set_order_by_criteria(self, criteria: Criteria) -> None:
         """Set ORDER BY clause based on Criteria orders."""
+        if isinstance(criteria.pagination, CursorPagination):
+            # keyset pagination needs a total order -> uuid breaks the ties
+            direction = self._get_cursor_direction(criteria)
+            order_fields = [*self._get_cursor_sort_fields(criteria), "uuid"]
+            self.order_clause = "ORDER BY " + ", ".join(
+                f"{field} {direction}" for field in order_fields
+            )
+            return
+
         if not criteria.orders:
             return
 
-        order_clause = f"ORDER BY {criteria.orders.field} {criteria.orders.direction}"
+        direction = str(criteria.orders.direction).upper()
+        if direction not in ORDER_DIRECTIONS:
+            raise ValueError("order direction must be ASC or DESC")
+        order_clause = f"ORDER BY {self._check_order_field(criteria.orders.field)} {direction}"
         self.order_clause = order_clause
 
-    def set_pagination_by_criteria(self, criteria: Criteria) -> None:
-        """Set pagination based on Criteria pagination."""
+    def set_pagination_by_criteria(self, criteria: Criteria, lookahead: int = 0) -> None:
+        """Set pagination based on Criteria pagination.
+
+        lookahead rows are fetched past the page: one extra row tells whether a
+        next page exists without a second query.
+        """
         if not criteria.pagination:
             return
 
-        limit = criteria.pagination.per_page
+        if isinstance(criteria.pagination, CursorPagination):
+            self._set_cursor_pagination_by_criteria(criteria, lookahead)
+            return
+
+        limit = criteria.pagination.per_page + lookahead
         offset = (criteria.pagination.page - 1) * criteria.pagination.per_page
         pagination_clause = f"LIMIT {limit} OFFSET {offset}"
         self.pagination_clause = pagination_clause
 
+    def _set_cursor_pagination_by_criteria(self, criteria: Criteria, lookahead: int = 0) -> None:
+        """Seek past the cursor row with a row comparison instead of an OFFSET."""
+        self.pagination_clause = f"LIMIT {criteria.pagination.per_page + lookahead}"
+
+        after = criteria.pagination.get_after()
+        if after is None:
+            return
+
+        sort_values, uuid = after
+        sort_fields = self._get_cursor_sort_fields(criteria)
+        if len(sort_values) != len(sort_fields):
+            # the cursor was issued for another ordering -> start from the first page
+            return
+
+        operator = "<" if self._get_cursor_direction(criteria) == "DESC" else ">"
+        columns = [*sort_fields, "uuid"]
+        placeholders = []
+        for index, (column, value) in enumerate(zip(columns, [*sort_values, uuid]), start=1):
+            self._bind(f"cursor_param_{index}", column, value)
+            placeholders.append(self._get_placeholder(column, f"cursor_param_{index}"))
+        self.where_clause.append(
+            f"({', '.join(columns)}) {operator} ({', '.join(placeholders)})"
+        )
+
+    @staticmethod
+    def _get_cursor_sort_fields(criteria: Criteria) -> list[str]:
+        """Get the sort columns that precede uuid in the keyset."""
+        if not criteria.orders or criteria.orders.field == "uuid":
+            return []
+        return [CriteriaToSQL._check_order_field(criteria.orders.field)]
+
+    @staticmethod
+    def _get_cursor_direction(criteria: Criteria) -> str:
+        """Get the keyset direction, ASC unless DESC is requested."""
+        if criteria.orders and str(criteria.orders.direction).upper() == "DESC":
+            return "DESC"
+        return "ASC"
+
+    def get_count_query_parametrized(self, max_rows: Optional[int] = None) -> tuple[str, dict]:
+        """Get the COUNT over the WHERE clause, counting at most max_rows rows when given.
+
+        Order and pagination do not change the count and are left out; build it
+        before set_pagination_by_criteria, which adds the cursor seek to the WHERE.
+        """
+        where_statement = ""
+        if self.where_clause:
+            where_statement = f" WHERE {' AND '.join(self.where_clause)}"
+
+        if max_rows is None:
+            return f"SELECT count(*) FROM {self.table_name}{where_statement}", self.params
+        # bounded count -> stops scanning after max_rows matches
+        query = f"SELECT count(*) FROM (SELECT 1 FROM {self.table_name}{where_statement} LIMIT {max_rows}) AS bounded"
+        return query, self.params
+
     def get_select_query_parametrized(self) -> tuple[str, dict]:
         """Get the full SQL query string and parameters."""
-        query = f"SELECT * FROM {self.table_name}"
+        columns = ", ".join(self.select_columns) or "*"
+        query = f"SELECT {columns} FROM {self.table_name}"
 
         if self.where_clause:
             where_statement = " AND ".join(self.where_clause)
@@ -1,14 +1,27 @@
 """Domain event handler base class."""
 
+import asyncio
+from typing import Optional
+
 from src.app.shared.domain.events.domain_event import DomainEvent
 
 
 class DomainEventHandler:
     """Base class for domain event handlers."""
 
+    # handlers that must finish before the write is acknowledged run inline on publish
+    is_synchronous: bool = False
+    # per-handler overrides for the async event bus (None -> use the bus defaults)
+    timeout_seconds: Optional[float] = None
+    max_retries: Optional[int] = None
+
     def __init__(self, susbscribed_to: str):
         self.susbscribed_to = susbscribed_to
 
     def handle(self, event: DomainEvent) -> None:
         """Handle the given domain event."""
         raise NotImplementedError("Subclasses must implement this method.")
+
+    async def handle_async(self, event: DomainEvent) -> None:
+        """Handle the given domain event without blocking the event loop, in a worker thread unless overridden."""
+        await asyncio.to_thread(self.handle, event)
@@ -1,9 +1,11 @@
 class CustomResponse:
-    def __init__(self, code: int = 200, msg: str = "", is_success: bool = True, data: None = None):
+    def __init__(self, code: int = 200, msg: str = "", is_success: bool = True, data: None = None, replayed: bool = False):
         self.code = code
         self.message = msg
         self.is_success = is_success
         self.data = data
+        # the request repeated one already applied, nothing was written
+        self.replayed = replayed
 
     def to_primitives(self) -> dict:
         """Convert the response to primitive dictionary format."""
@@ -26,11 +28,12 @@ class CustomResponse:
         }
 
     @staticmethod
-    def success(msg: str = "Success", success: bool = True, data: None = None):
+    def success(msg: str = "Success", success: bool = True, data: None = None, replayed: bool = False):
         return CustomResponse(
             msg=msg,
             is_success=success,
-            data=data
+            data=data,
+            replayed=replayed
         )
 
     @staticmethod
@@ -41,3 +44,12 @@ class CustomResponse:
             is_success=False,
             data=data
         )
+
+    @staticmethod
+    def conflict(msg: str = "Conflict", data: None = None):
+        return CustomResponse(
+            code=409,
+            msg=msg,
+            is_success=False,
+            data=data
+        )
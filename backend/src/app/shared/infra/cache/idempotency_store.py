@@ -0,0 +1,81 @@
+"""Recent Idempotency-Key store used to answer retried requests without a write.
+
+Keys live in a bounded in-process LRU with a TTL, so a retry reaching another
+worker or arriving after eviction falls through to the database, where the
+insert is idempotent on its own (ON CONFLICT DO NOTHING).
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, NamedTuple, Optional
+
+
+# request header carrying the client's key for a create, the same on every retry
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+# response header telling a replay (nothing written) apart from a new insert
+IDEMPOTENT_REPLAYED_HEADER = "Idempotent-Replayed"
+MAX_IDEMPOTENCY_KEY_LENGTH = 255
+
+
+class IdempotencyConfig:
+    """Idempotency-Key store configuration with environment-based defaults."""
+
+    def __init__(self):
+        self.enabled = self._get_env_var(
+            'IDEMPOTENCY_ENABLED', 'true').lower() == 'true'
+        self.max_keys = int(self._get_env_var('IDEMPOTENCY_MAX_KEYS', '10000'))
+        self.ttl = float(self._get_env_var('IDEMPOTENCY_TTL', '3600'))
+
+    @staticmethod
+    def _get_env_var(key: str, default: str) -> str:
+        """Get environment variable with fallback to default value."""
+        value = os.getenv(key)
+        if value is None:
+            return default
+        return value
+
+
+class StoredResponse(NamedTuple):
+    """Response sent for an Idempotency-Key, with the fingerprint of the request body."""
+
+    fingerprint: str
+    status_code: int
+    content: Any
+    headers: dict[str, str]
+
+
+class IdempotencyStore:
+    """Bounded LRU of the responses sent for recent Idempotency-Keys."""
+
+    def __init__(self, max_keys: int = 10000, ttl: float = 3600):
+        self._max_keys = max_keys
+        self._ttl = ttl
+        # key -> (expires_at, response), least recently used first
+        self._entries: OrderedDict[str, tuple[float, StoredResponse]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[StoredResponse]:
+        """Get the response stored for the key, None when unknown or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, response = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return response
+
+    def put(self, key: str, response: StoredResponse) -> None:
+        """Store the response sent for the key, evicting the least recently used keys."""
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (time.monotonic() + self._ttl, response)
+            while len(self._entries) > self._max_keys:
+                self._entries.popitem(last=False)
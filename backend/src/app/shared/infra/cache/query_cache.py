@@ -0,0 +1,262 @@
+"""Query result cache backends with TTL expiration.
+
+The in-process backend keeps entries in LRU order within a bounded memory
+budget. The shared backend stores entries in Redis so every worker sees the same
+entries and invalidations; it needs the optional ``redis`` package. Values are
+JSON primitives: they hold patient data, and Redis never gets a pickle to load.
+
+Invalidation is by generation: callers put a counter of the backend in their
+keys and increment it, the entries of older generations are never read again
+and expire with their TTL (or are evicted first, in the LRU).
+
+Async callers use the *_async methods: network backends run the call in a
+worker thread, the in-process backend answers on the event loop.
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Iterable, Optional
+
+
+class QueryCacheConfig:
+    """Query cache configuration with environment-based defaults."""
+
+    def __init__(self):
+        self.enabled = self._get_env_var(
+            'QUERY_CACHE_ENABLED', 'true').lower() == 'true'
+        self.backend = self._get_env_var('QUERY_CACHE_BACKEND', 'memory')
+        self.ttl = float(self._get_env_var('QUERY_CACHE_TTL', '10'))
+        self.max_entries = int(
+            self._get_env_var('QUERY_CACHE_MAX_ENTRIES', '1024'))
+        self.max_bytes = int(
+            self._get_env_var('QUERY_CACHE_MAX_BYTES', str(64 * 1024 * 1024)))
+        self.redis_url = self._get_env_var(
+            'QUERY_CACHE_REDIS_URL', 'redis://localhost:6379/0')
+        # search totals, cached by filters and not invalidated by creates
+        self.count_ttl = float(self._get_env_var('QUERY_CACHE_COUNT_TTL', '30'))
+
+    @staticmethod
+    def _get_env_var(key: str, default: str) -> str:
+        """Get environment variable with fallback to default value."""
+        value = os.getenv(key)
+        if value is None:
+            return default
+        return value
+
+
+class QueryCacheBackend(ABC):
+    """Storage for cached query results."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """Get a cached value, None when missing or expired."""
+        raise NotImplementedError()
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """Cache a JSON serializable value for ``ttl`` seconds."""
+        raise NotImplementedError()
+
+    @abstractmethod
+    def delete(self, keys: Iterable[str]) -> None:
+        """Remove the given keys."""
+        raise NotImplementedError()
+
+    @abstractmethod
+    def get_counter(self, name: str) -> int:
+        """Get a counter that does not expire, 0 until it is first incremented."""
+        raise NotImplementedError()
+
+    @abstractmethod
+    def increment(self, name: str) -> int:
+        """Increment a counter atomically and get its new value."""
+        raise NotImplementedError()
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every cached value."""
+        raise NotImplementedError()
+
+    async def get_async(self, key: str) -> Optional[Any]:
+        """Get a cached value without blocking the event loop."""
+        return await asyncio.to_thread(self.get, key)
+
+    async def set_async(self, key: str, value: Any, ttl: float) -> None:
+        """Cache a value without blocking the event loop."""
+        await asyncio.to_thread(self.set, key, value, ttl)
+
+    async def get_counter_async(self, name: str) -> int:
+        """Get a counter without blocking the event loop."""
+        return await asyncio.to_thread(self.get_counter, name)
+
+
+def approximate_size(value: Any) -> int:
+    """Approximate the JSON size of a value from its first item only.
+
+    Cached values are pages of rows with the same columns, encoding one row
+    keeps the cost per entry constant whatever the page size.
+    """
+    if isinstance(value, list) and value:
+        return len(value) * (len(json.dumps(value[0], separators=(",", ":"), default=str)) + 1) + 1
+    return len(json.dumps(value, separators=(",", ":"), default=str))
+
+
+class InMemoryQueryCacheBackend(QueryCacheBackend):
+    """In-process LRU cache bounded by number of entries and approximate bytes."""
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 64 * 1024 * 1024):
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        # key -> (expires_at, size, value), least recently used first
+        self._entries: OrderedDict[str, tuple[float, int, Any]] = OrderedDict()
+        self._bytes = 0
+        self._counters: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def size_bytes(self) -> int:
+        """Approximate memory used by the cached values."""
+        return self._bytes
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, _, value = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        # the JSON size is a stable approximation of the memory held by the value
+        size = approximate_size(value)
+        if size > self._max_bytes:
+            return
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = (time.monotonic() + ttl, size, value)
+            self._bytes += size
+            while len(self._entries) > self._max_entries or self._bytes > self._max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def delete(self, keys: Iterable[str]) -> None:
+        with self._lock:
+            for key in keys:
+                self._remove(key)
+
+    def get_counter(self, name: str) -> int:
+        with self._lock:
+            return self._counters.get(name, 0)
+
+    def increment(self, name: str) -> int:
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + 1
+            return self._counters[name]
+
+    # no I/O and short critical sections -> served on the event loop, no thread hop
+    async def get_async(self, key: str) -> Optional[Any]:
+        return self.get(key)
+
+    async def set_async(self, key: str, value: Any, ttl: float) -> None:
+        self.set(key, value, ttl)
+
+    async def get_counter_async(self, name: str) -> int:
+        return self.get_counter(name)
+
+    def keys(self) -> list[str]:
+        """Get the keys currently cached, least recently used first."""
+        with self._lock:
+            return list(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _remove(self, key: str) -> None:
+        """Remove a key, the lock must be held."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[1]
+
+
+class RedisQueryCacheBackend(QueryCacheBackend):
+    """Shared cache in Redis; eviction under memory pressure is Redis' maxmemory-policy.
+
+    Every entry carries its own expiry, nothing indexes the keys: an
+    invalidation is one INCR, whatever the number of entries.
+    """
+
+    def __init__(self, redis_url: str, namespace: str = "query-cache"):
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError(
+                "The redis package is required for QUERY_CACHE_BACKEND=redis") from e
+        self._client = redis.Redis.from_url(redis_url)
+        self._namespace = namespace
+
+    def get(self, key: str) -> Optional[Any]:
+        raw = self._client.get(self._redis_key(key))
+        if raw is None:
+            return None
+        return json.loads(raw)
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        self._client.set(self._redis_key(key), json.dumps(value, separators=(",", ":")), px=int(ttl * 1000))
+
+    def delete(self, keys: Iterable[str]) -> None:
+        keys = [self._redis_key(key) for key in keys]
+        if keys:
+            self._client.delete(*keys)
+
+    def get_counter(self, name: str) -> int:
+        return int(self._client.get(self._counter_key(name)) or 0)
+
+    def increment(self, name: str) -> int:
+        return self._client.incr(self._counter_key(name))
+
+    def clear(self) -> None:
+        # SCAN in batches, KEYS would block Redis on a large keyspace
+        batch = []
+        for redis_key in self._client.scan_iter(match=f"{self._namespace}:*", count=1000):
+            batch.append(redis_key)
+            if len(batch) == 1000:
+                self._client.delete(*batch)
+                batch = []
+        if batch:
+            self._client.delete(*batch)
+
+    def _redis_key(self, key: str) -> str:
+        """Namespace the key inside Redis."""
+        return f"{self._namespace}:{key}"
+
+    def _counter_key(self, name: str) -> str:
+        """Namespace a counter apart from the cached keys."""
+        return f"{self._namespace}:counter:{name}"
+
+
+def build_query_cache_backend(
+    config: Optional[QueryCacheConfig] = None,
+    namespace: str = "query-cache"
+) -> QueryCacheBackend:
+    """Build the backend selected by QUERY_CACHE_BACKEND (memory or redis).
+
+    Caches with different key formats need their own namespace in Redis.
+    """
+    if config is None:
+        config = QueryCacheConfig()
+    if config.backend == "redis":
+        return RedisQueryCacheBackend(config.redis_url, namespace=namespace)
+    return InMemoryQueryCacheBackend(
+        max_entries=config.max_entries,
+        max_bytes=config.max_bytes
+    )
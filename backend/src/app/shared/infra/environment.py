@@ -0,0 +1,20 @@
+"""Loading of the backend .env file into the environment.
+
+The file is read once, when the first configuration is built (the app
+lifespan, a script or a benchmark), instead of as a side effect of importing
+the connection modules. Variables already set in the environment win.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+# Look for .env in the backend directory
+ENV_PATH = Path(__file__).resolve().parents[4] / '.env'
+
+
+@lru_cache(maxsize=None)
+def load_environment() -> None:
+    """Load the variables of the .env file, once per process."""
+    load_dotenv(dotenv_path=ENV_PATH)
@@ -0,0 +1,260 @@
+"""In-process metrics exposed in the Prometheus text format.
+
+A deliberately small registry: counters and histograms keep one lock-protected
+slot per label combination (an observation is a bisect and three additions),
+and callback metrics read their value only when /metrics is scraped. Keep label
+values low cardinality (route templates, handler names, criteria shapes), never
+ids or patient data.
+"""
+
+import bisect
+import threading
+from typing import Callable, Collection, Iterable, Optional, get_args
+
+from src.app.shared.domain.criteria.criteria import Criteria, CursorPagination, Operator, OrderDirection
+
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_OPERATORS = frozenset(get_args(Operator))
+_DIRECTIONS = frozenset(get_args(OrderDirection))
+
+# label values -> value, for callback metrics
+CallbackSamples = Iterable[tuple[tuple[str, ...], float]]
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the text format."""
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labelnames: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    """Format a label set as {name="value",...}."""
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(labelnames, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value, integers without the trailing .0."""
+    if value == int(value):
+        return str(int(value))
+    return repr(value)
+
+
+class Counter:
+    """Monotonic counter per label combination."""
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._values: dict[tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labelvalues: str, amount: float = 1) -> None:
+        """Increase the counter of the label combination."""
+        with self._lock:
+            self._values[labelvalues] = self._values.get(labelvalues, 0) + amount
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            values = list(self._values.items())
+        for labelvalues, value in values:
+            lines.append(f"{self.name}{_format_labels(self.labelnames, labelvalues)} {_format_value(value)}")
+        return lines
+
+
+class Histogram:
+    """Histogram with fixed buckets per label combination."""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.buckets = tuple(sorted(buckets))
+        # label values -> [per bucket counts (+Inf last), sum, count]
+        self._values: dict[tuple[str, ...], list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labelvalues: str) -> None:
+        """Record an observation for the label combination."""
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            slot = self._values.get(labelvalues)
+            if slot is None:
+                slot = self._values[labelvalues] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            slot[0][index] += 1
+            slot[1] += value
+            slot[2] += 1
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            values = [(labelvalues, list(slot[0]), slot[1], slot[2]) for labelvalues, slot in self._values.items()]
+        for labelvalues, bucket_counts, total, count in values:
+            cumulative = 0
+            for upper_bound, bucket_count in zip([*self.buckets, "+Inf"], bucket_counts):
+                cumulative += bucket_count
+                le = f'le="{upper_bound}"'
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(self.labelnames, labelvalues, le)} {cumulative}")
+            labels = _format_labels(self.labelnames, labelvalues)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+class CallbackMetric:
+    """Gauge (or counter kept elsewhere) whose samples are read from a callback at scrape time."""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...],
+        callback: Callable[[], CallbackSamples],
+        metric_type: str = "gauge"
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.callback = callback
+        self.metric_type = metric_type
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.metric_type}"]
+        for labelvalues, value in self.callback():
+            lines.append(f"{self.name}{_format_labels(self.labelnames, labelvalues)} {_format_value(value)}")
+        return lines
+
+
+class MetricsRegistry:
+    """Collection of metrics rendered together."""
+
+    def __init__(self):
+        self._metrics: dict[str, Counter | Histogram | CallbackMetric] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Counter:
+        """Get or create a counter."""
+        return self._get_or_create(name, lambda: Counter(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        """Get or create a histogram."""
+        return self._get_or_create(name, lambda: Histogram(name, documentation, labelnames, buckets))
+
+    def callback(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...],
+        callback: Callable[[], CallbackSamples],
+        metric_type: str = "gauge"
+    ) -> CallbackMetric:
+        """Register a callback metric, replacing the previous callback with the same name."""
+        metric = CallbackMetric(name, documentation, labelnames, callback, metric_type)
+        with self._lock:
+            self._metrics[name] = metric
+        return metric
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text exposition format."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            try:
+                lines.extend(metric.render())
+            except Exception as e:
+                # a failing callback must not hide the other metrics
+                lines.append(f"# {metric.name} unavailable: {e!r}".replace("\n", " "))
+        return "\n".join(lines) + "\n"
+
+    def _get_or_create(self, name: str, factory: Callable):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = factory()
+            return metric
+
+
+def criteria_shape(criteria: Optional[Criteria], fields: Collection[str]) -> str:
+    """Describe a criteria by its fields, operators, order and pagination kind, never its values.
+
+    Fields, operators and directions come from the query string, anything
+    outside ``fields`` and the known operators is reported as "other" so a
+    client cannot grow the label set.
+    """
+    if criteria is None:
+        return "none"
+
+    def known(value: str, allowed: Collection[str]) -> str:
+        return value if value in allowed else "other"
+
+    filters = sorted(
+        f"{known(flt.field, fields)}:{known(flt.operator, _OPERATORS)}" for flt in criteria.filters
+    )
+    order = "-"
+    if criteria.orders:
+        order = f"{known(criteria.orders.field, fields)}:{known(str(criteria.orders.direction).upper(), _DIRECTIONS)}"
+    pagination = "cursor" if isinstance(criteria.pagination, CursorPagination) else "offset"
+    return f"filters={','.join(filters) or '-'};order={order};pagination={pagination}"
+
+
+def observe_event_handler(event_handler: object, duration: float, failed: bool) -> None:
+    """Event bus observer recording the handler execution time and failures."""
+    handler_name = type(event_handler).__name__
+    event_handler_duration_seconds.observe(duration, handler_name)
+    if failed:
+        event_handler_failures_total.inc(handler_name)
+
+
+# Global registry instance
+metrics_registry = MetricsRegistry()
+
+http_request_duration_seconds = metrics_registry.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template, method and status code.",
+    ("route", "method", "status"),
+)
+event_handler_duration_seconds = metrics_registry.histogram(
+    "event_handler_duration_seconds",
+    "Domain event handler execution time.",
+    ("handler",),
+)
+event_handler_failures_total = metrics_registry.counter(
+    "event_handler_failures_total",
+    "Domain event handler executions that raised or timed out.",
+    ("handler",),
+)
+db_query_duration_seconds = metrics_registry.histogram(
+    "db_query_duration_seconds",
+    "Search query duration by repository and criteria shape.",
+    ("repository", "shape"),
+)
+db_pool_wait_seconds = metrics_registry.histogram(
+    "db_pool_wait_seconds",
+    "Time spent waiting for a connection from the pool.",
+    ("pool",),
+    buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0),
+)
+write_coalescing_batch_size = metrics_registry.histogram(
+    "write_coalescing_batch_size",
+    "Records written per coalesced transaction.",
+    buckets=(1, 2, 5, 10, 25, 50, 100, 250, 500, 1000),
+)
@@ -0,0 +1,131 @@
+"""Structured logging written off the request path.
+
+Records are put on a bounded queue by a non-blocking handler and formatted and
+written to stdout by a single listener thread, so a request never waits on
+terminal or pipe I/O. When the queue is full records are dropped (and counted)
+instead of blocking. Hot-path events are logged at DEBUG and can be sampled with
+LOG_DEBUG_SAMPLE_RATE. Never put patient data (record fields, filter values, SQL
+parameters) in a log record.
+"""
+
+import json
+import logging
+import os
+import queue
+import random
+import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional, TextIO
+
+
+# attributes every LogRecord has, anything else was passed through ``extra``
+_STANDARD_RECORD_ATTRIBUTES = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+
+class LoggingConfig:
+    """Logging configuration with environment-based defaults."""
+
+    def __init__(self):
+        self.level = self._get_env_var('LOG_LEVEL', 'INFO').upper()
+        self.format = self._get_env_var('LOG_FORMAT', 'json')
+        self.queue_size = int(self._get_env_var('LOG_QUEUE_SIZE', '10000'))
+        self.debug_sample_rate = float(
+            self._get_env_var('LOG_DEBUG_SAMPLE_RATE', '1'))
+
+    @staticmethod
+    def _get_env_var(key: str, default: str) -> str:
+        """Get environment variable with fallback to default value."""
+        value = os.getenv(key)
+        if value is None:
+            return default
+        return value
+
+
+class JsonFormatter(logging.Formatter):
+    """Format a record as one JSON object per line, ``extra`` fields included."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        document = {
+            "ts": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _STANDARD_RECORD_ATTRIBUTES:
+                document[key] = value
+        if record.exc_info:
+            document["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(document, default=str)
+
+
+class DebugSamplingFilter(logging.Filter):
+    """Keep a fraction of the DEBUG records, every record above DEBUG passes."""
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self._rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.DEBUG or self._rate >= 1:
+            return True
+        return random.random() < self._rate
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """Queue handler that drops records when the queue is full instead of waiting."""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self._dropped_lock = threading.Lock()
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._dropped_lock:
+                self.dropped += 1
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # formatting happens on the listener thread, only resolve the message here
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def configure_logging(
+    config: Optional[LoggingConfig] = None,
+    stream: Optional[TextIO] = None
+) -> QueueListener:
+    """Route the root logger through the queue and start the writer thread.
+
+    Returns the started listener; stop it on shutdown to flush the queue.
+    """
+    if config is None:
+        config = LoggingConfig()
+
+    stream_handler = logging.StreamHandler(stream or sys.stdout)
+    if config.format == "json":
+        stream_handler.setFormatter(JsonFormatter())
+    else:
+        stream_handler.setFormatter(logging.Formatter(
+            "%(asctime)s %(levelname)s %(name)s %(message)s"))
+
+    queue_handler = NonBlockingQueueHandler(queue.Queue(maxsize=config.queue_size))
+    queue_handler.addFilter(DebugSamplingFilter(config.debug_sample_rate))
+
+    root_logger = logging.getLogger()
+    for handler in list(root_logger.handlers):
+        if isinstance(handler, NonBlockingQueueHandler):
+            root_logger.removeHandler(handler)
+    root_logger.addHandler(queue_handler)
+    root_logger.setLevel(config.level)
+    # SQLAlchemy logs every statement at INFO when its loggers inherit the root
+    # level; statement logging stays opt-in through DB_ECHO (engine echo)
+    logging.getLogger("sqlalchemy").setLevel(logging.WARNING)
+
+    listener = QueueListener(queue_handler.queue, stream_handler, respect_handler_level=True)
+    listener.start()
+    return listener
@@ -0,0 +1,46 @@
+"""Coerce JSON primitives into the python types asyncpg expects for a column.
+
+psycopg2 sends parameters as SQL literals and lets Postgres cast them, asyncpg
+uses binary typed parameters, so e.g. a date column needs a ``datetime.date``.
+"""
+
+import uuid
+from datetime import date
+from typing import Any
+
+from sqlalchemy import Column, Table
+
+
+def coerce_value(column: Column, value: Any) -> Any:
+    """Coerce a single value into the python type of the column."""
+    if isinstance(value, list):
+        # array parameters (CONTAINS_ANY / CONTAINS_ALL) -> coerce the elements
+        return [coerce_value(column, item) for item in value]
+    if not isinstance(value, str):
+        return value
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+    if python_type is uuid.UUID:
+        return uuid.UUID(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    return value
+
+
+def coerce_values(table: Table, values: dict[str, Any]) -> dict[str, Any]:
+    """Coerce the values of a column -> value mapping, leaving unknown keys untouched."""
+    return {
+        key: coerce_value(table.columns[key], value) if key in table.columns else value
+        for key, value in values.items()
+    }
+
+
+def coerce_params(table: Table, params: dict[str, Any], param_fields: dict[str, str]) -> dict[str, Any]:
+    """Coerce query parameters by the column each one is compared with (see CriteriaToSQL.param_fields)."""
+    return {
+        name: coerce_value(table.columns[param_fields[name]], value)
+        if param_fields.get(name) in table.columns else value
+        for name, value in params.items()
+    }
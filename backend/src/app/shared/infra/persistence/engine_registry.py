@@ -0,0 +1,342 @@
+"""Named database endpoints and the engines built for them on first use.
+
+Every endpoint has a role (primary, replica or dr) and its own pool settings.
+DB_ENDPOINTS lists them as name=role@host:port; without it the registry holds
+the primary of POSTGRES_* and the replica (the load balancer) of
+SLAVE_POSTGRES_*. Each setting can be overridden per endpoint with
+DB_<NAME>_<SETTING> (DB_PRIMARY_POOL_SIZE, DB_REPLICA_02_MAX_OVERFLOW, ...),
+falling back to the role credentials and to the shared DB_POOL_* values.
+
+Engines are fork safe: a forked worker drops the pooled connections of its
+parent (without closing them, the parent still owns the sockets) and opens
+its own. warm_up() opens pool_size connections per pool before the worker
+takes traffic.
+"""
+
+import asyncio
+import itertools
+import logging
+import os
+import re
+import threading
+import weakref
+from typing import NamedTuple, Optional
+
+from sqlalchemy import Engine, create_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from src.app.shared.infra.environment import load_environment
+from src.app.shared.infra.persistence.instrumented_pool import (
+    InstrumentedAsyncAdaptedQueuePool,
+    InstrumentedQueuePool
+)
+
+logger = logging.getLogger(__name__)
+
+PRIMARY = "primary"
+REPLICA = "replica"
+DR = "dr"
+ENDPOINT_ROLES = (PRIMARY, REPLICA, DR)
+
+# prefix of the credentials each role reads when the endpoint does not override them
+_CREDENTIALS_PREFIX = {PRIMARY: "POSTGRES", REPLICA: "SLAVE_POSTGRES", DR: "POSTGRES"}
+_DEFAULT_PORT = {PRIMARY: "5432", REPLICA: "5433", DR: "5432"}
+
+# role read instead when no endpoint has the requested one
+_ROLE_FALLBACK = {REPLICA: PRIMARY}
+
+# every engine built in this process (the sync engine of the async ones) and every registry
+_engines: "weakref.WeakSet[Engine]" = weakref.WeakSet()
+_registries: "weakref.WeakSet[EngineRegistry]" = weakref.WeakSet()
+
+
+def _reset_after_fork() -> None:
+    """Drop the connections inherited from the parent, without closing its sockets."""
+    for engine in list(_engines):
+        engine.dispose(close=False)
+    for registry in list(_registries):
+        registry._lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+class DatabaseEndpoint:
+    """One database to connect to: its role, address, credentials and pool settings."""
+
+    def __init__(self, name: str, role: str, host: Optional[str] = None, port: Optional[str] = None):
+        if role not in ENDPOINT_ROLES:
+            raise ValueError(f"unknown endpoint role {role!r}, expected one of {', '.join(ENDPOINT_ROLES)}")
+        self.name = name
+        self.role = role
+        load_environment()
+
+        credentials = _CREDENTIALS_PREFIX[role]
+        self.user = self._get_setting('USER', f'{credentials}_USER', 'admin')
+        self.password = self._get_setting('PASSWORD', f'{credentials}_PASSWORD', '123456')
+        self.database = self._get_setting('DB', f'{credentials}_DB', 'db_patient_health_record')
+        self.host = host or self._get_setting('HOST', f'{credentials}_HOST', 'localhost')
+        self.port = port or self._get_setting('PORT', f'{credentials}_PORT', _DEFAULT_PORT[role])
+
+        # Connection pool settings
+        self.pool_size = int(self._get_setting('POOL_SIZE', 'DB_POOL_SIZE', '5'))
+        self.max_overflow = int(self._get_setting('MAX_OVERFLOW', 'DB_MAX_OVERFLOW', '10'))
+        self.pool_timeout = int(self._get_setting('POOL_TIMEOUT', 'DB_POOL_TIMEOUT', '30'))
+        self.pool_recycle = int(self._get_setting('POOL_RECYCLE', 'DB_POOL_RECYCLE', '3600'))
+
+        # label of the pools in the metrics
+        self.pool_name = name
+
+        # SQL statement logging (with parameters -> patient data), development only
+        self.echo = self._get_setting('ECHO', 'DB_ECHO', 'false').lower() == 'true'
+
+    @property
+    def env_prefix(self) -> str:
+        """Get the prefix of the per-endpoint variables, DB_REPLICA_01_ for replica-01."""
+        return f"DB_{re.sub(r'[^A-Z0-9]+', '_', self.name.upper())}_"
+
+    def _get_setting(self, setting: str, fallback_key: str, default: str) -> str:
+        """Get the per-endpoint variable, then the shared one, then the default."""
+        value = os.getenv(self.env_prefix + setting)
+        if value is not None:
+            return value
+        return self._get_env_var(fallback_key, default)
+
+    @staticmethod
+    def _get_env_var(key: str, default: str) -> str:
+        """Get environment variable with fallback to default value."""
+        value = os.getenv(key)
+        if value is None:
+            return default
+        return value
+
+    def get_database_url(self) -> str:
+        """Build PostgreSQL connection string."""
+        return f"postgresql://{self.user}:{self.password}@{self.host}:{self.port}/{self.database}"
+
+    def get_async_database_url(self) -> str:
+        """Build PostgreSQL connection string for the asyncpg driver."""
+        return f"postgresql+asyncpg://{self.user}:{self.password}@{self.host}:{self.port}/{self.database}"
+
+
+def parse_endpoints(value: str) -> list[DatabaseEndpoint]:
+    """Parse a DB_ENDPOINTS value such as 'primary=primary@db-main:5432,replica-01=replica@db-slave-01:5432'."""
+    endpoints = []
+    for item in value.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        name, _, target = item.partition("=")
+        role, _, address = target.partition("@")
+        if not name or not role:
+            raise ValueError(f"invalid endpoint {item!r}, expected name=role@host:port")
+        host, _, port = address.partition(":")
+        endpoints.append(DatabaseEndpoint(name.strip(), role.strip(), host or None, port or None))
+    return endpoints
+
+
+def create_endpoint_engine(endpoint: DatabaseEndpoint) -> Engine:
+    """Create the SQLAlchemy engine of an endpoint with its pool settings."""
+    engine = create_engine(
+        endpoint.get_database_url(),
+        poolclass=InstrumentedQueuePool,
+        pool_logging_name=endpoint.pool_name,
+        pool_size=endpoint.pool_size,
+        max_overflow=endpoint.max_overflow,
+        pool_timeout=endpoint.pool_timeout,
+        pool_recycle=endpoint.pool_recycle,
+        pool_pre_ping=True,  # Verify connections before using them
+        echo=endpoint.echo,  # DB_ECHO=true for SQL query logging during development
+    )
+    _engines.add(engine)
+    return engine
+
+
+def create_async_endpoint_engine(endpoint: DatabaseEndpoint) -> AsyncEngine:
+    """Create the SQLAlchemy asyncpg engine of an endpoint with its pool settings."""
+    engine = create_async_engine(
+        endpoint.get_async_database_url(),
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        pool_logging_name=f"{endpoint.pool_name}-async",
+        pool_size=endpoint.pool_size,
+        max_overflow=endpoint.max_overflow,
+        pool_timeout=endpoint.pool_timeout,
+        pool_recycle=endpoint.pool_recycle,
+        pool_pre_ping=True,  # Verify connections before using them
+        echo=endpoint.echo,  # DB_ECHO=true for SQL query logging during development
+    )
+    _engines.add(engine.sync_engine)
+    return engine
+
+
+class EngineRegistryConfig:
+    """Engine registry configuration with environment-based defaults."""
+
+    def __init__(self):
+        load_environment()
+        # name=role@host:port, comma separated; empty -> the primary and replica defaults
+        self.endpoints = parse_endpoints(self._get_env_var('DB_ENDPOINTS', ''))
+        # open pool_size connections per pool on startup, before the worker takes traffic
+        self.warm_up = self._get_env_var('DB_WARM_UP_ENABLED', 'true').lower() == 'true'
+
+    @staticmethod
+    def _get_env_var(key: str, default: str) -> str:
+        """Get environment variable with fallback to default value."""
+        value = os.getenv(key)
+        if value is None:
+            return default
+        return value
+
+
+class PoolHealth(NamedTuple):
+    """Occupancy of one engine pool."""
+
+    pool: str
+    endpoint: str
+    role: str
+    size: int
+    checked_out: int
+    overflow: int
+    capacity: int
+
+    @property
+    def saturated(self) -> bool:
+        """Whether a checkout would have to wait for a connection to be returned."""
+        return self.checked_out >= self.capacity
+
+
+class EngineRegistry:
+    """Build the engines of the endpoints on first use and pick them by role.
+
+    Endpoints that are never asked for (a DR site, an idle replica) never get
+    an engine. Several endpoints with a role are used in turn.
+    """
+
+    def __init__(self, endpoints: list[DatabaseEndpoint]):
+        self._endpoints: dict[str, DatabaseEndpoint] = {}
+        self._engines: dict[str, Engine] = {}
+        self._async_engines: dict[str, AsyncEngine] = {}
+        self._turns = {role: itertools.count() for role in ENDPOINT_ROLES}
+        self._lock = threading.Lock()
+        for endpoint in endpoints:
+            self.add(endpoint)
+        _registries.add(self)
+
+    def add(self, endpoint: DatabaseEndpoint) -> DatabaseEndpoint:
+        """Register an endpoint, its engines are built when first asked for."""
+        if endpoint.name in self._endpoints:
+            raise ValueError(f"endpoint {endpoint.name!r} is already registered")
+        self._endpoints[endpoint.name] = endpoint
+        return endpoint
+
+    def endpoint(self, name: str) -> DatabaseEndpoint:
+        """Get an endpoint by name."""
+        try:
+            return self._endpoints[name]
+        except KeyError:
+            raise ValueError(f"unknown endpoint {name!r}") from None
+
+    def endpoints(self, role: Optional[str] = None) -> list[DatabaseEndpoint]:
+        """Get the endpoints, only the ones with the role when given."""
+        return [endpoint for endpoint in self._endpoints.values() if role is None or endpoint.role == role]
+
+    def choose(self, role: str) -> DatabaseEndpoint:
+        """Get the next endpoint with the role, a replica read falls back to the primary."""
+        endpoints = self.endpoints(role)
+        if not endpoints:
+            if role not in _ROLE_FALLBACK:
+                raise ValueError(f"no {role!r} endpoint is configured")
+            return self.choose(_ROLE_FALLBACK[role])
+        return endpoints[next(self._turns[role]) % len(endpoints)]
+
+    def engine(self, name: str) -> Engine:
+        """Get the engine of the endpoint, built on first use."""
+        engine = self._engines.get(name)
+        if engine is None:
+            with self._lock:
+                engine = self._engines.get(name)
+                if engine is None:
+                    engine = self._engines[name] = create_endpoint_engine(self.endpoint(name))
+        return engine
+
+    def async_engine(self, name: str) -> AsyncEngine:
+        """Get the asyncpg engine of the endpoint, built on first use."""
+        engine = self._async_engines.get(name)
+        if engine is None:
+            with self._lock:
+                engine = self._async_engines.get(name)
+                if engine is None:
+                    engine = self._async_engines[name] = create_async_endpoint_engine(self.endpoint(name))
+        return engine
+
+    def engine_for(self, role: str) -> Engine:
+        """Get the engine of the next endpoint with the role."""
+        return self.engine(self.choose(role).name)
+
+    def async_engine_for(self, role: str) -> AsyncEngine:
+        """Get the asyncpg engine of the next endpoint with the role."""
+        return self.async_engine(self.choose(role).name)
+
+    def built_engines(self) -> list[tuple[DatabaseEndpoint, Engine]]:
+        """Get the engines built so far, the sync engine of the async ones included."""
+        engines = [(self._endpoints[name], engine) for name, engine in list(self._engines.items())]
+        engines.extend(
+            (self._endpoints[name], engine.sync_engine) for name, engine in list(self._async_engines.items()))
+        return engines
+
+    def pool_health(self) -> list[PoolHealth]:
+        """Get the occupancy of every pool built so far."""
+        return [
+            PoolHealth(
+                pool=engine.pool.logging_name or endpoint.pool_name,
+                endpoint=endpoint.name,
+                role=endpoint.role,
+                size=engine.pool.size(),
+                checked_out=engine.pool.checkedout(),
+                overflow=engine.pool.overflow(),
+                capacity=endpoint.pool_size + endpoint.max_overflow,
+            )
+            for endpoint, engine in self.built_engines()
+        ]
+
+    async def warm_up(self) -> None:
+        """Open pool_size connections in every pool built so far and return them to the pool.
+
+        An unreachable endpoint is logged and skipped, its pool fills on demand.
+        """
+        await asyncio.gather(
+            *(asyncio.to_thread(self._warm_up_engine, name, engine) for name, engine in list(self._engines.items())),
+            *(self._warm_up_async_engine(name, engine) for name, engine in list(self._async_engines.items())),
+        )
+
+    def _warm_up_engine(self, name: str, engine: Engine) -> None:
+        """Check out pool_size connections at once, then check them all back in."""
+        connections = []
+        try:
+            for _ in range(self._endpoints[name].pool_size):
+                connections.append(engine.connect())
+        except Exception as e:
+            logger.warning("warming up the %s pool failed: %r", name, e)
+        finally:
+            for connection in connections:
+                connection.close()
+
+    async def _warm_up_async_engine(self, name: str, engine: AsyncEngine) -> None:
+        """Check out pool_size connections concurrently, then check them all back in."""
+        results = await asyncio.gather(
+            *(engine.connect().start() for _ in range(self._endpoints[name].pool_size)),
+            return_exceptions=True)
+        connections = [result for result in results if not isinstance(result, BaseException)]
+        if len(connections) < len(results):
+            error = next(result for result in results if isinstance(result, BaseException))
+            logger.warning("warming up the %s-async pool failed: %r", name, error)
+        for connection in connections:
+            await connection.close()
+
+    async def dispose(self) -> None:
+        """Close the connections of every engine built so far."""
+        for engine in list(self._engines.values()):
+            engine.dispose()
+        for async_engine in list(self._async_engines.values()):
+            await async_engine.dispose()
@@ -0,0 +1,39 @@
+"""Connection pools that record how long a checkout waits for a connection.
+
+The engines are created with ``pool_logging_name`` set to the pool label
+(primary, replica, ...); SQLAlchemy keeps it when the pool is recreated on
+dispose, so the label survives.
+"""
+
+import time
+
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from src.app.shared.infra.observability.metrics import db_pool_wait_seconds
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool observing the checkout wait in db_pool_wait_seconds."""
+
+    # keep the pool logs under the sqlalchemy logger
+    _sqla_logger_namespace = "sqlalchemy.pool.impl.QueuePool"
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            db_pool_wait_seconds.observe(time.perf_counter() - start, self.logging_name or "default")
+
+
+class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool observing the checkout wait in db_pool_wait_seconds."""
+
+    _sqla_logger_namespace = "sqlalchemy.pool.impl.AsyncAdaptedQueuePool"
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            db_pool_wait_seconds.observe(time.perf_counter() - start, self.logging_name or "default")
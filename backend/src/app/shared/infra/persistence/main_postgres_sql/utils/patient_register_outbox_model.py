@@ -0,0 +1,24 @@
+from typing import Any
+from typing import Optional
+from datetime import datetime
+from uuid import UUID as UUIDType
+from sqlalchemy import BigInteger, DateTime, Integer, String, Text, func
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import mapped_column
+
+from src.app.shared.infra.persistence.main_postgres_sql.utils.patient_register_model import Base
+
+
+class PatientRegisterOutboxModel(Base):
+
+    __tablename__ = "patientregisteroutbox"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    aggregate_uuid: Mapped[UUIDType] = mapped_column(UUID(as_uuid=True), nullable=False)
+    event_name: Mapped[str] = mapped_column(String(100), nullable=False)
+    payload: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now())
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    last_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
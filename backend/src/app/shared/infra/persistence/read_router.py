@@ -0,0 +1,170 @@
+"""Replication-lag-aware routing of reads across the replica engines.
+
+A background thread samples the primary's current WAL position and every
+replica's replayed WAL position. Each read goes to the least loaded replica
+whose lag is within the bound and, when the request carries a session LSN (the
+primary position returned after a write), that has replayed up to it. When no
+replica qualifies the read falls back to the primary.
+"""
+
+import logging
+import os
+import threading
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import Engine, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+
+# header carrying the session LSN token between the create route and the reads
+SESSION_LSN_HEADER = "X-Session-LSN"
+
+# minimum LSN the current request must observe (read-your-writes), None when any replica will do
+session_lsn: ContextVar[Optional[int]] = ContextVar("session_lsn", default=None)
+
+
+def parse_lsn(lsn: str) -> int:
+    """Parse a pg_lsn such as '16/B374D848' into an integer byte position."""
+    high, low = lsn.split("/")
+    return (int(high, 16) << 32) + int(low, 16)
+
+
+def parse_session_lsn(value: Optional[str]) -> Optional[int]:
+    """Parse the session LSN token sent by a client, None when missing or malformed."""
+    if not value:
+        return None
+    try:
+        return parse_lsn(value)
+    except ValueError:
+        return None
+
+
+def format_lsn(lsn: int) -> str:
+    """Format an integer byte position as a pg_lsn."""
+    return f"{lsn >> 32:X}/{lsn & 0xFFFFFFFF:X}"
+
+
+class ReadRouterConfig:
+    """Read router configuration with environment-based defaults."""
+
+    def __init__(self):
+        self.enabled = self._get_env_var(
+            'READ_ROUTER_ENABLED', 'false').lower() == 'true'
+        self.max_lag_bytes = int(
+            self._get_env_var('READ_ROUTER_MAX_LAG_BYTES', str(16 * 1024 * 1024)))
+        self.sample_interval = float(
+            self._get_env_var('READ_ROUTER_SAMPLE_INTERVAL', '0.5'))
+
+    @staticmethod
+    def _get_env_var(key: str, default: str) -> str:
+        """Get environment variable with fallback to default value."""
+        value = os.getenv(key)
+        if value is None:
+            return default
+        return value
+
+
+class ReadTarget:
+    """A database that can serve reads, with its engines and last sampled position."""
+
+    def __init__(self, name: str, engine: Engine, async_engine: AsyncEngine):
+        self.name = name
+        self.engine = engine
+        self.async_engine = async_engine
+        # last replayed (replica) or written (primary) LSN, None until sampled or when unreachable
+        self.lsn: Optional[int] = None
+
+    def in_use(self) -> int:
+        """Get the connections checked out from both pools, used as the load."""
+        return self.engine.pool.checkedout() + self.async_engine.sync_engine.pool.checkedout()
+
+
+class ReadRouter:
+    """Pick the engines each read runs on."""
+
+    _PRIMARY_LSN_QUERY = "SELECT pg_current_wal_lsn()::text"
+    _REPLICA_LSN_QUERY = "SELECT pg_last_wal_replay_lsn()::text"
+
+    def __init__(
+        self,
+        primary: ReadTarget,
+        replicas: list[ReadTarget],
+        max_lag_bytes: int = 16 * 1024 * 1024,
+        sample_interval: float = 0.5,
+    ):
+        self.primary = primary
+        self.replicas = replicas
+        self._max_lag_bytes = max_lag_bytes
+        self._sample_interval = sample_interval
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def choose(self, min_lsn: Optional[int] = None) -> ReadTarget:
+        """Get the least loaded caught-up replica, or the primary when none qualifies."""
+        primary_lsn = self.primary.lsn
+        candidates = []
+        for replica in self.replicas:
+            replica_lsn = replica.lsn
+            if replica_lsn is None:
+                continue
+            if primary_lsn is not None and primary_lsn - replica_lsn > self._max_lag_bytes:
+                continue
+            if min_lsn is not None and replica_lsn < min_lsn:
+                continue
+            candidates.append(replica)
+
+        if not candidates:
+            return self.primary
+        return min(candidates, key=lambda replica: replica.in_use())
+
+    def sample(self) -> None:
+        """Sample the WAL position of the primary and of every replica."""
+        self.primary.lsn = self._sample_lsn(self.primary, self._PRIMARY_LSN_QUERY)
+        for replica in self.replicas:
+            replica.lsn = self._sample_lsn(replica, self._REPLICA_LSN_QUERY)
+
+    async def get_primary_lsn_async(self) -> int:
+        """Get the primary's current WAL position, past every write committed so far."""
+        async with self.primary.async_engine.connect() as connection:
+            lsn = (await connection.execute(text(self._PRIMARY_LSN_QUERY))).scalar_one()
+        return parse_lsn(lsn)
+
+    def start(self) -> None:
+        """Start sampling on a background thread."""
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name="read-router-sampler",
+            daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the background thread."""
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join(timeout=timeout)
+        self._thread = None
+
+    def _run(self) -> None:
+        """Sample every sample_interval seconds until stopped."""
+        while not self._stop_event.is_set():
+            self.sample()
+            self._stop_event.wait(self._sample_interval)
+
+    @staticmethod
+    def _sample_lsn(target: ReadTarget, query: str) -> Optional[int]:
+        """Run the LSN query, None when the target is unreachable or not replaying."""
+        try:
+            with target.engine.connect() as connection:
+                lsn = connection.execute(text(query)).scalar_one()
+            return parse_lsn(lsn) if lsn is not None else None
+        except Exception as e:
+            logger.warning("sampling WAL position of %s failed: %r", target.name, e)
+            return None
@@ -0,0 +1,56 @@
+"""Engine selection shared by the repositories that read from the replicas."""
+
+from typing import Optional
+
+from sqlalchemy import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.app.shared.infra.persistence.engine_registry import REPLICA, EngineRegistry
+from src.app.shared.infra.persistence.read_router import ReadRouter, session_lsn
+from src.app.shared.infra.persistence.slave_postgres_sql.utils.slave_connection import get_slave_connection_engine
+from src.app.shared.infra.persistence.slave_postgres_sql.utils.async_slave_connection import (
+    get_async_slave_connection_engine
+)
+
+
+class ReplicaReadRepo:
+    """Base of the repositories reading from the replicas.
+
+    Every query runs on the engine the read_router chooses for the session LSN
+    when there is one, else on the replica endpoints of the engine_registry in
+    turn, else on the given engines (the replica load balancer by default,
+    built on first use).
+    """
+
+    def __init__(
+        self,
+        engine: Optional[Engine] = None,
+        async_engine: Optional[AsyncEngine] = None,
+        read_router: Optional[ReadRouter] = None,
+        engine_registry: Optional[EngineRegistry] = None
+    ):
+        super().__init__()
+        self._engine = engine
+        self._async_engine = async_engine
+        self._read_router = read_router
+        self._engine_registry = engine_registry
+
+    def _get_engine(self) -> Engine:
+        """Get the engine for this read, honouring the session LSN when routing."""
+        if self._read_router is not None:
+            return self._read_router.choose(session_lsn.get()).engine
+        if self._engine_registry is not None:
+            return self._engine_registry.engine_for(REPLICA)
+        if self._engine is None:
+            self._engine = get_slave_connection_engine()
+        return self._engine
+
+    def _get_async_engine(self) -> AsyncEngine:
+        """Get the async engine for this read, honouring the session LSN when routing."""
+        if self._read_router is not None:
+            return self._read_router.choose(session_lsn.get()).async_engine
+        if self._engine_registry is not None:
+            return self._engine_registry.async_engine_for(REPLICA)
+        if self._async_engine is None:
+            self._async_engine = get_async_slave_connection_engine()
+        return self._async_engine
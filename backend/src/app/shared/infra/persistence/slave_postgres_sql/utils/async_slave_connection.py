@@ -0,0 +1,33 @@
+"""Async PostgreSQL database connection module using SQLAlchemy and asyncpg.
+
+This module provides a configured async database engine with connection pooling
+for routes that must not block the event loop while waiting on the database.
+"""
+
+from functools import lru_cache
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.app.shared.infra.persistence.engine_registry import create_async_endpoint_engine
+from src.app.shared.infra.persistence.slave_postgres_sql.utils.slave_connection import SlaveDatabaseConfig
+
+
+def create_async_db_engine(config: Optional[SlaveDatabaseConfig] = None) -> AsyncEngine:
+    """Create and configure SQLAlchemy async engine with connection pooling.
+
+    Args:
+        config: Optional SlaveDatabaseConfig instance. If None, creates from env vars.
+
+    Returns:
+        Configured SQLAlchemy AsyncEngine instance.
+    """
+    if config is None:
+        config = SlaveDatabaseConfig()
+
+    return create_async_endpoint_engine(config)
+
+
+@lru_cache(maxsize=None)
+def get_async_slave_connection_engine() -> AsyncEngine:
+    """Get the replica async engine configured from the environment, built on first use."""
+    return create_async_db_engine(SlaveDatabaseConfig())
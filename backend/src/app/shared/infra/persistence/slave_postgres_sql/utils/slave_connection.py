@@ -4,46 +4,18 @@ This module provides a configured database engine with connection pooling
 and environment-based configuration.
 """
 
-import os
-from pathlib import Path
+from functools import lru_cache
 from typing import Optional
-from sqlalchemy import create_engine, Engine
-from sqlalchemy.pool import QueuePool
-from dotenv import load_dotenv
+from sqlalchemy import Engine
 
-# Load environment variables from .env file
-# Look for .env in the backend directory
-env_path = Path(__file__).resolve().parents[5] / '.env'
-load_dotenv(dotenv_path=env_path)
+from src.app.shared.infra.persistence.engine_registry import REPLICA, DatabaseEndpoint, create_endpoint_engine
 
 
-class SlaveDatabaseConfig:
-    """Database configuration with validation and defaults."""
+class SlaveDatabaseConfig(DatabaseEndpoint):
+    """Replica database configuration, the 'replica' endpoint of the engine registry."""
 
     def __init__(self):
-        self.user = self._get_env_var('SLAVE_POSTGRES_USER', 'admin')
-        self.password = self._get_env_var('SLAVE_POSTGRES_PASSWORD', '123456')
-        self.database = self._get_env_var('SLAVE_POSTGRES_DB', 'db_patient_health_record')
-        self.host = self._get_env_var('SLAVE_POSTGRES_HOST', 'localhost')
-        self.port = self._get_env_var('SLAVE_POSTGRES_PORT', '5433')
-
-        # Connection pool settings
-        self.pool_size = int(self._get_env_var('DB_POOL_SIZE', '5'))
-        self.max_overflow = int(self._get_env_var('DB_MAX_OVERFLOW', '10'))
-        self.pool_timeout = int(self._get_env_var('DB_POOL_TIMEOUT', '30'))
-        self.pool_recycle = int(self._get_env_var('DB_POOL_RECYCLE', '3600'))
-
-    @staticmethod
-    def _get_env_var(key: str, default: str) -> str:
-        """Get environment variable with fallback to default value."""
-        value = os.getenv(key)
-        if value is None:
-            return default
-        return value
-
-    def get_database_url(self) -> str:
-        """Build PostgreSQL connection string."""
-        return f"postgresql://{self.user}:{self.password}@{self.host}:{self.port}/{self.database}"
+        super().__init__('replica', REPLICA)
 
 
 def create_db_engine(config: Optional[SlaveDatabaseConfig] = None) -> Engine:
@@ -58,22 +30,10 @@ def create_db_engine(config: Optional[SlaveDatabaseConfig] = None) -> Engine:
     if config is None:
         config = SlaveDatabaseConfig()
 
-    database_url = config.get_database_url()
-
-    engine = create_engine(
-        database_url,
-        poolclass=QueuePool,
-        pool_size=config.pool_size,
-        max_overflow=config.max_overflow,
-        pool_timeout=config.pool_timeout,
-        pool_recycle=config.pool_recycle,
-        pool_pre_ping=True,  # Verify connections before using them
-        echo=True,  # Set to True for SQL query logging during development
-    )
-
-    return engine
+    return create_endpoint_engine(config)
 
 
-# Global engine instance
-slave_config = SlaveDatabaseConfig()
-slave_connection_engine = create_db_engine(slave_config)
+@lru_cache(maxsize=None)
+def get_slave_connection_engine() -> Engine:
+    """Get the replica engine configured from the environment, built on first use."""
+    return create_db_engine(SlaveDatabaseConfig())
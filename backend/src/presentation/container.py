@@ -0,0 +1,326 @@
+"""Application-scoped composition root.
+
+The container is built once in the FastAPI lifespan (see main.py), so requests
+reuse the same engines, event bus subscriptions and use cases instead of
+rebuilding the object graph on every call.
+"""
+
+import asyncio
+from typing import Callable, Optional
+
+from sqlalchemy import Engine
+from sqlalchemy.pool import Pool
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+# domain
+from src.app.create_patient_register.domain.events.event_bus import EventBus
+from src.app.create_patient_register.domain.events.async_event_bus import AsyncEventBus, AsyncEventBusConfig
+from src.app.create_patient_register.domain.events.patient_register_created_event import PatientRegisterCreatedEvent
+from src.app.create_patient_register.domain.repos.count_patient_repo import CountPatientRepo
+from src.app.shared.domain.criteria.criteria import CriteriaParser
+# infra
+from src.app.create_patient_register.infra.persistence.main_db.create_patient_register_postgress import CreatePatientRegisterPostgress
+from src.app.create_patient_register.infra.persistence.main_db.create_patient_register_postgress_async import CreatePatientRegisterPostgressAsync
+from src.app.create_patient_register.infra.persistence.main_db.patient_register_outbox_postgress import PatientRegisterOutboxPostgress
+from src.app.create_patient_register.infra.persistence.main_db.coalescing_create_patient_repo import (
+    CoalescingCreatePatientRepo,
+    WriteCoalescingConfig
+)
+from src.app.create_patient_register.infra.persistence.slave_db.replicate_patient_register_postgress import ReplicatePatientRegisterPostgress
+from src.app.get_patient_registation.infra.persistence.slave_db.get_patient_postgress_async import GetPatientPostgressAsync
+from src.app.get_patient_registation.infra.persistence.slave_db.export_patient_postgress import ExportPatientPostgress
+from src.app.get_patient_registation.infra.persistence.slave_db.search_patient_postgress import SearchPatientPostgress
+from src.app.get_patient_registation.infra.persistence.slave_db.count_patient_postgress import (
+    CountPatientConfig,
+    CountPatientPostgress
+)
+from src.app.get_patient_registation.infra.cache.cached_count_patient_repo import CachedCountPatientRepo
+from src.app.get_patient_registation.infra.cache.cached_get_patient_repo import CachedGetPatientRepo
+from src.app.shared.infra.cache.idempotency_store import IdempotencyConfig, IdempotencyStore
+from src.app.shared.infra.cache.query_cache import QueryCacheConfig, build_query_cache_backend
+from src.app.shared.infra.observability.metrics import CallbackSamples, metrics_registry, observe_event_handler
+from src.app.shared.infra.persistence.engine_registry import DR, PRIMARY, REPLICA, EngineRegistry, EngineRegistryConfig
+from src.app.shared.infra.persistence.read_router import ReadRouter, ReadRouterConfig, ReadTarget
+from src.app.shared.infra.persistence.main_postgres_sql.utils.connection import DatabaseConfig
+from src.app.shared.infra.persistence.slave_postgres_sql.utils.slave_connection import SlaveDatabaseConfig
+# application
+from src.app.create_patient_register.application.create_patient_register import CreatePatientRegisterUseCase
+from src.app.create_patient_register.application.create_patient_register_batch import CreatePatientRegisterBatchUseCase
+from src.app.create_patient_register.application.patient_register_outbox_relay import (
+    PatientRegisterOutboxRelay,
+    PatientRegisterOutboxRelayConfig
+)
+from src.app.create_patient_register.application.domain_handlers.loggin_handler import LogginHandler
+from src.app.create_patient_register.application.domain_handlers.persist_on_db_master import PersistOnDbMasterHandler
+from src.app.get_patient_registation.application.get_patient_registation_use_case import GetPatientRegistationUseCase
+from src.app.get_patient_registation.application.export_patient_registers_use_case import ExportPatientRegistersUseCase
+from src.app.get_patient_registation.application.search_patient_registers_use_case import SearchPatientRegistersUseCase
+from src.app.get_patient_registation.application.domain_handlers.invalidate_query_cache_handler import InvalidateQueryCacheHandler
+# presentation
+from src.presentation.responses import dumps
+
+
+class Container:
+    """Own the engines, the event bus with its subscriptions and the use cases."""
+
+    def __init__(
+        self,
+        database_config: Optional[DatabaseConfig] = None,
+        slave_database_config: Optional[SlaveDatabaseConfig] = None,
+        event_bus_config: Optional[AsyncEventBusConfig] = None,
+        outbox_relay_config: Optional[PatientRegisterOutboxRelayConfig] = None,
+        query_cache_config: Optional[QueryCacheConfig] = None,
+        read_router_config: Optional[ReadRouterConfig] = None,
+        write_coalescing_config: Optional[WriteCoalescingConfig] = None,
+        idempotency_config: Optional[IdempotencyConfig] = None,
+        count_config: Optional[CountPatientConfig] = None,
+        engine_registry_config: Optional[EngineRegistryConfig] = None,
+    ):
+        # configuration -> pool sizes and handlers are configured here (env vars by default)
+        database_config = database_config or DatabaseConfig()
+        slave_database_config = slave_database_config or SlaveDatabaseConfig()
+        event_bus_config = event_bus_config or AsyncEventBusConfig()
+        outbox_relay_config = outbox_relay_config or PatientRegisterOutboxRelayConfig()
+        query_cache_config = query_cache_config or QueryCacheConfig()
+        read_router_config = read_router_config or ReadRouterConfig()
+        write_coalescing_config = write_coalescing_config or WriteCoalescingConfig()
+        idempotency_config = idempotency_config or IdempotencyConfig()
+        count_config = count_config or CountPatientConfig()
+        engine_registry_config = engine_registry_config or EngineRegistryConfig()
+
+        # engines -> DB_ENDPOINTS, else the primary and the replica load balancer
+        self.engine_registry = EngineRegistry(
+            engine_registry_config.endpoints or [database_config, slave_database_config])
+        self._warm_up_pools = engine_registry_config.warm_up
+        self.engine: Engine = self.engine_registry.engine_for(PRIMARY)
+        self.async_engine: AsyncEngine = self.engine_registry.async_engine_for(PRIMARY)
+        replica = self.engine_registry.choose(REPLICA)
+        self.slave_engine: Engine = self.engine_registry.engine(replica.name)
+        self.async_slave_engine: AsyncEngine = self.engine_registry.async_engine(replica.name)
+
+        # read routing -> the replica endpoints of the registry, each one sampled for its lag
+        self.read_router: Optional[ReadRouter] = None
+        if read_router_config.enabled:
+            self.read_router = self._build_read_router(read_router_config)
+
+        # persistence
+        # outbox rows are only written when the relay drains them
+        self.create_patient_repo = CreatePatientRegisterPostgress(self.engine, outbox=outbox_relay_config.enabled)
+        self.create_patient_repo_async = CreatePatientRegisterPostgressAsync(
+            self.async_engine,
+            self.engine,
+            outbox=outbox_relay_config.enabled
+        )
+        self.patient_register_outbox_repo = PatientRegisterOutboxPostgress(self.engine)
+        self.get_patient_repo = GetPatientPostgressAsync(
+            self.async_slave_engine,
+            self.slave_engine,
+            read_router=self.read_router,
+            engine_registry=self.engine_registry
+        )
+        self.export_patient_repo = ExportPatientPostgress(
+            self.slave_engine,
+            read_router=self.read_router,
+            engine_registry=self.engine_registry
+        )
+        self.search_patient_repo = SearchPatientPostgress(
+            self.async_slave_engine,
+            self.slave_engine,
+            read_router=self.read_router,
+            engine_registry=self.engine_registry
+        )
+
+        # write coalescing -> concurrent creates share one commit on the primary
+        self.coalescing_create_patient_repo: Optional[CoalescingCreatePatientRepo] = None
+        if write_coalescing_config.enabled:
+            self.coalescing_create_patient_repo = CoalescingCreatePatientRepo(
+                create_patient_repo=self.create_patient_repo_async,
+                max_delay=write_coalescing_config.max_delay,
+                max_batch_size=write_coalescing_config.max_batch_size
+            )
+            self.create_patient_repo_async = self.coalescing_create_patient_repo
+
+        # query cache -> read-through around the search repository
+        self.cached_get_patient_repo: Optional[CachedGetPatientRepo] = None
+        if query_cache_config.enabled:
+            self.cached_get_patient_repo = CachedGetPatientRepo(
+                get_patient_repo=self.get_patient_repo,
+                backend=build_query_cache_backend(query_cache_config),
+                ttl=query_cache_config.ttl
+            )
+            self.get_patient_repo = self.cached_get_patient_repo
+
+        # search totals -> exact below the threshold, planner estimates above, cached by filters
+        self.count_patient_repo: Optional[CountPatientRepo] = None
+        if count_config.enabled:
+            self.count_patient_repo = CountPatientPostgress(
+                self.async_slave_engine,
+                self.slave_engine,
+                read_router=self.read_router,
+                engine_registry=self.engine_registry,
+                exact_threshold=count_config.exact_threshold
+            )
+            if query_cache_config.enabled:
+                self.count_patient_repo = CachedCountPatientRepo(
+                    count_patient_repo=self.count_patient_repo,
+                    backend=build_query_cache_backend(query_cache_config, namespace="count-cache"),
+                    ttl=query_cache_config.count_ttl
+                )
+
+        # idempotency -> retried creates with a recent Idempotency-Key are answered without a write
+        self.idempotency_store: Optional[IdempotencyStore] = None
+        if idempotency_config.enabled:
+            self.idempotency_store = IdempotencyStore(
+                max_keys=idempotency_config.max_keys,
+                ttl=idempotency_config.ttl
+            )
+
+        # event bus
+        self.event_bus = self._build_event_bus(event_bus_config)
+        self._event_bus_shutdown_timeout = event_bus_config.shutdown_timeout
+        self.event_bus.observe_handlers(observe_event_handler)
+
+        # use cases
+        self.criteria_parser = CriteriaParser()
+        self.create_patient_register_use_case = CreatePatientRegisterUseCase(event_bus=self.event_bus)
+        self.create_patient_register_batch_use_case = CreatePatientRegisterBatchUseCase(
+            create_patient_repo=self.create_patient_repo
+        )
+        self.get_patient_registation_use_case = GetPatientRegistationUseCase(
+            self.get_patient_repo,
+            self.count_patient_repo
+        )
+        self.export_patient_registers_use_case = ExportPatientRegistersUseCase(self.export_patient_repo, dumps=dumps)
+        self.search_patient_registers_use_case = SearchPatientRegistersUseCase(self.search_patient_repo)
+
+        # background workers
+        # the replicas are read-only hot standbys fed by streaming replication ->
+        # the relay writes to the dr endpoints, which must be writable
+        self.replicate_patient_repos: list[ReplicatePatientRegisterPostgress] = []
+        self.patient_register_outbox_relay: Optional[PatientRegisterOutboxRelay] = None
+        if outbox_relay_config.enabled:
+            dr_endpoints = self.engine_registry.endpoints(DR)
+            if not dr_endpoints:
+                raise ValueError("OUTBOX_RELAY_ENABLED needs a writable dr endpoint in DB_ENDPOINTS")
+            self.replicate_patient_repos = [
+                ReplicatePatientRegisterPostgress(self.engine_registry.engine(endpoint.name))
+                for endpoint in dr_endpoints
+            ]
+            self.patient_register_outbox_relay = PatientRegisterOutboxRelay(
+                outbox_repo=self.patient_register_outbox_repo,
+                targets=self.replicate_patient_repos,
+                batch_size=outbox_relay_config.batch_size,
+                poll_interval=outbox_relay_config.poll_interval,
+                max_attempts=outbox_relay_config.max_attempts,
+            )
+
+        # metrics -> gauges are read from the objects above when /metrics is scraped
+        self._register_metrics()
+
+    def _register_metrics(self) -> None:
+        """Expose the pool, event bus and query cache state, read at scrape time."""
+
+        def pool_samples(read: Callable[[Pool], int]) -> Callable[[], CallbackSamples]:
+            return lambda: [((pool.logging_name or "default",), read(pool)) for pool in self._pools()]
+
+        metrics_registry.callback(
+            "db_pool_checked_out", "Connections currently checked out of the pool.",
+            ("pool",), pool_samples(lambda pool: pool.checkedout()))
+        metrics_registry.callback(
+            "db_pool_overflow", "Connections open beyond pool_size (negative while the pool is not full).",
+            ("pool",), pool_samples(lambda pool: pool.overflow()))
+        metrics_registry.callback(
+            "db_pool_size", "Configured pool_size.",
+            ("pool",), pool_samples(lambda pool: pool.size()))
+
+        if isinstance(self.event_bus, AsyncEventBus):
+            event_bus = self.event_bus
+            metrics_registry.callback(
+                "event_bus_pending", "Handler executions waiting in the event bus queue.",
+                (), lambda: [((), event_bus.pending)])
+
+        if self.cached_get_patient_repo is not None:
+            cached_get_patient_repo = self.cached_get_patient_repo
+            metrics_registry.callback(
+                "query_cache_requests_total", "Query cache lookups by result.",
+                ("result",),
+                lambda: [((result,), count) for result, count in cached_get_patient_repo.stats().items()],
+                metric_type="counter")
+
+    def _pools(self) -> list[Pool]:
+        """Get the pools of every engine built by the registry."""
+        return [engine.pool for _, engine in self.engine_registry.built_engines()]
+
+    def _build_read_router(self, read_router_config: ReadRouterConfig) -> ReadRouter:
+        """Build a router over the replica endpoints of the registry, falling back to the primary."""
+        replicas = [
+            ReadTarget(
+                name=endpoint.name,
+                engine=self.engine_registry.engine(endpoint.name),
+                async_engine=self.engine_registry.async_engine(endpoint.name)
+            )
+            for endpoint in self.engine_registry.endpoints(REPLICA)
+        ]
+
+        return ReadRouter(
+            primary=ReadTarget("primary", self.engine, self.async_engine),
+            replicas=replicas,
+            max_lag_bytes=read_router_config.max_lag_bytes,
+            sample_interval=read_router_config.sample_interval,
+        )
+
+    def _build_event_bus(self, event_bus_config: AsyncEventBusConfig) -> EventBus:
+        """Build the event bus and subscribe the patient register created handlers once."""
+
+        # EVENT_BUS_MODE=sync keeps every handler on the request path
+        if event_bus_config.mode == "sync":
+            event_bus = EventBus()
+        else:
+            event_bus = AsyncEventBus.from_config(event_bus_config)
+
+        # init the event handlers
+        logging_create_register_handler = LogginHandler(
+            susbscribed_to=PatientRegisterCreatedEvent.event_name()
+        )
+        persist_on_db_master_handler = PersistOnDbMasterHandler(
+            susbscribed_to=PatientRegisterCreatedEvent.event_name(),
+            create_patient_repo=self.create_patient_repo_async
+        )
+        # replicas and DR are fed by the outbox relay, off the request path
+        # subscribe the handlers to the event bus
+        event_bus.subscribe(logging_create_register_handler)
+        event_bus.subscribe(persist_on_db_master_handler)
+        # after the insert: a search that started before it stores its result under the previous generation
+        if self.cached_get_patient_repo is not None:
+            event_bus.subscribe(InvalidateQueryCacheHandler(
+                susbscribed_to=PatientRegisterCreatedEvent.event_name(),
+                cached_get_patient_repo=self.cached_get_patient_repo
+            ))
+
+        return event_bus
+
+    async def warm_up(self) -> None:
+        """Open the connections of the pools before the worker takes traffic, when enabled."""
+        if self._warm_up_pools:
+            await self.engine_registry.warm_up()
+
+    def start(self) -> None:
+        """Start the background workers."""
+        self.event_bus.start()
+        if self.read_router is not None:
+            self.read_router.start()
+        if self.patient_register_outbox_relay is not None:
+            self.patient_register_outbox_relay.start()
+
+    async def shutdown(self) -> None:
+        """Drain the background workers and dispose the engines."""
+        if self.patient_register_outbox_relay is not None:
+            self.patient_register_outbox_relay.stop()
+        # draining joins the worker threads -> off the event loop, bounded
+        await asyncio.to_thread(self.event_bus.shutdown, drain=True, timeout=self._event_bus_shutdown_timeout)
+        if self.coalescing_create_patient_repo is not None:
+            await self.coalescing_create_patient_repo.close()
+        if self.read_router is not None:
+            self.read_router.stop()
+
+        await self.engine_registry.dispose()
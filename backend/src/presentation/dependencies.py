@@ -0,0 +1,76 @@
+"""FastAPI dependencies resolving application-scoped objects from the container."""
+
+from typing import Optional
+
+from fastapi import Depends, Request
+
+from src.presentation.container import Container
+from src.app.shared.domain.criteria.criteria import CriteriaParser
+from src.app.shared.infra.cache.idempotency_store import IdempotencyStore
+from src.app.shared.infra.persistence.engine_registry import EngineRegistry
+from src.app.shared.infra.persistence.read_router import ReadRouter
+from src.app.create_patient_register.application.create_patient_register import CreatePatientRegisterUseCase
+from src.app.create_patient_register.application.create_patient_register_batch import CreatePatientRegisterBatchUseCase
+from src.app.get_patient_registation.application.get_patient_registation_use_case import GetPatientRegistationUseCase
+from src.app.get_patient_registation.application.export_patient_registers_use_case import ExportPatientRegistersUseCase
+from src.app.get_patient_registation.application.search_patient_registers_use_case import SearchPatientRegistersUseCase
+
+
+def get_container(request: Request) -> Container:
+    """Get the container wired by the application lifespan."""
+    return request.app.state.container
+
+
+def get_create_patient_register_use_case(
+    container: Container = Depends(get_container)
+) -> CreatePatientRegisterUseCase:
+    """Get the create patient register use case."""
+    return container.create_patient_register_use_case
+
+
+def get_create_patient_register_batch_use_case(
+    container: Container = Depends(get_container)
+) -> CreatePatientRegisterBatchUseCase:
+    """Get the batch create patient register use case."""
+    return container.create_patient_register_batch_use_case
+
+
+def get_criteria_parser(container: Container = Depends(get_container)) -> CriteriaParser:
+    """Get the criteria parser."""
+    return container.criteria_parser
+
+
+def get_get_patient_registation_use_case(
+    container: Container = Depends(get_container)
+) -> GetPatientRegistationUseCase:
+    """Get the get patient registration use case."""
+    return container.get_patient_registation_use_case
+
+
+def get_export_patient_registers_use_case(
+    container: Container = Depends(get_container)
+) -> ExportPatientRegistersUseCase:
+    """Get the export patient registers use case."""
+    return container.export_patient_registers_use_case
+
+
+def get_search_patient_registers_use_case(
+    container: Container = Depends(get_container)
+) -> SearchPatientRegistersUseCase:
+    """Get the search patient registers use case."""
+    return container.search_patient_registers_use_case
+
+
+def get_read_router(container: Container = Depends(get_container)) -> Optional[ReadRouter]:
+    """Get the read router, None when reads go to the replica load balancer."""
+    return container.read_router
+
+
+def get_idempotency_store(container: Container = Depends(get_container)) -> Optional[IdempotencyStore]:
+    """Get the recent Idempotency-Key store, None when disabled."""
+    return container.idempotency_store
+
+
+def get_engine_registry(container: Container = Depends(get_container)) -> EngineRegistry:
+    """Get the registry owning the database engines."""
+    return container.engine_registry
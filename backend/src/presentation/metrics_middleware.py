@@ -0,0 +1,44 @@
+"""ASGI middleware recording the request latency per route template and status."""
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.app.shared.infra.observability.metrics import http_request_duration_seconds
+
+
+class MetricsMiddleware:
+    """Observe http_request_duration_seconds once the response is complete.
+
+    The route label is the matched path template (/patient-register, not the
+    raw path with its query values); requests that match no route share the
+    "unmatched" label.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status = "500"
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = str(message["status"])
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = scope.get("route")
+            http_request_duration_seconds.observe(
+                time.perf_counter() - start,
+                getattr(route, "path", "unmatched"),
+                scope["method"],
+                status,
+            )
@@ -0,0 +1,47 @@
+"""JSON responses encoded straight to bytes by a native encoder.
+
+The stock JSONResponse runs the stdlib ``json`` encoder over the search pages,
+lists of dicts of str/list values. orjson (or pydantic-core's Rust serializer
+when orjson is not installed) encodes the same content several times faster,
+with the same compact UTF-8 output.
+"""
+
+from typing import Any, Mapping, Optional
+
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+from src.app.shared.domain.models.custom_response import CustomResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+def dumps(content: Any) -> bytes:
+    """Encode content as compact UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(content)
+    return to_json(content)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered by orjson, the default response class of the app."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+    @classmethod
+    def from_custom_response(
+        cls,
+        response: CustomResponse,
+        headers: Optional[Mapping[str, str]] = None
+    ) -> "FastJSONResponse":
+        """Build the HTTP response of a use case result."""
+        response_json = response.to_JSON_response()
+        return cls(
+            status_code=response_json["status_code"],
+            content=response_json["content"],
+            headers=headers,
+        )
@@ -1,60 +1,112 @@
 """Module for create patient register route."""
 
-from fastapi import APIRouter, Request, status
-from fastapi.responses import JSONResponse
-# domain
-from src.app.create_patient_register.domain.events.event_bus import EventBus
-from src.app.create_patient_register.domain.events.patient_register_created_event import PatientRegisterCreatedEvent
-# infra
-from src.app.create_patient_register.infra.persistence.main_db.create_patient_register_postgress import CreatePatientRegisterPostgress
-from src.app.create_patient_register.infra.persistence.slave_db.replicate_patient_register_postgress import ReplicatePatientRegisterPostgress
+import hashlib
+import logging
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Request
+from fastapi.concurrency import run_in_threadpool
 # application
 from src.app.create_patient_register.application.create_patient_register import CreatePatientRegisterProps, CreatePatientRegisterUseCase
-from src.app.create_patient_register.application.domain_handlers.loggin_handler import LogginHandler
-from src.app.create_patient_register.application.domain_handlers.persist_on_db_master import PersistOnDbMasterHandler
-from src.app.create_patient_register.application.domain_handlers.replicate_record_on_slave import ReplicateRecordOnSlaveHandler
+from src.app.create_patient_register.application.create_patient_register_batch import (
+    CreatePatientRegisterBatchProps,
+    CreatePatientRegisterBatchUseCase
+)
+from src.app.shared.domain.models.custom_response import CustomResponse
+# infra
+from src.app.shared.infra.cache.idempotency_store import (
+    IDEMPOTENCY_KEY_HEADER,
+    IDEMPOTENT_REPLAYED_HEADER,
+    MAX_IDEMPOTENCY_KEY_LENGTH,
+    IdempotencyStore,
+    StoredResponse
+)
+from src.app.shared.infra.persistence.read_router import SESSION_LSN_HEADER, ReadRouter, format_lsn
+# presentation
+from src.presentation.dependencies import (
+    get_create_patient_register_use_case,
+    get_create_patient_register_batch_use_case,
+    get_idempotency_store,
+    get_read_router
+)
+from src.presentation.responses import FastJSONResponse
+
+logger = logging.getLogger(__name__)
 
 
 create_patient_register_route = APIRouter()
 
 
 @create_patient_register_route.post("/patient-register")
-async def create_patient_register(request: Request):
+async def create_patient_register(
+    request: Request,
+    use_case: CreatePatientRegisterUseCase = Depends(get_create_patient_register_use_case),
+    read_router: Optional[ReadRouter] = Depends(get_read_router),
+    idempotency_store: Optional[IdempotencyStore] = Depends(get_idempotency_store)
+):
     """Route to create a patient register."""
 
-   # init persistence
-    create_patient_repo = CreatePatientRegisterPostgress()
-    replicate_patient_repo = ReplicatePatientRegisterPostgress()
-
-    # init event bus
-    event_bus = EventBus()
-    # init the event handlers
-    logging_create_register_handler = LogginHandler(
-        susbscribed_to=PatientRegisterCreatedEvent.event_name()
-    )
-    persist_on_db_master_handler = PersistOnDbMasterHandler(
-        susbscribed_to=PatientRegisterCreatedEvent.event_name(),
-        create_patient_repo=create_patient_repo
-    )
-    # replicate_record_on_slave_handler = ReplicateRecordOnSlaveHandler(
-    #     susbscribed_to=PatientRegisterCreatedEvent.event_name(),
-    #     replicate_patient_repo=replicate_patient_repo
-    # )
-    # subscribe the handlers to the event bus
-    event_bus.subscribe(logging_create_register_handler)
-    event_bus.subscribe(persist_on_db_master_handler)
-    # event_bus.subscribe(replicate_record_on_slave_handler)
-
-    use_case = CreatePatientRegisterUseCase(event_bus=event_bus)
+    # idempotency key -> a retry of a recent request gets the first response back without a write
+    idempotency_key = request.headers.get(IDEMPOTENCY_KEY_HEADER) if idempotency_store is not None else None
+    fingerprint = None
+    if idempotency_key:
+        if len(idempotency_key) > MAX_IDEMPOTENCY_KEY_LENGTH:
+            return FastJSONResponse.from_custom_response(CustomResponse.error(
+                msg=f"{IDEMPOTENCY_KEY_HEADER} must not exceed {MAX_IDEMPOTENCY_KEY_LENGTH} characters", data={}))
+        fingerprint = hashlib.sha256(await request.body()).hexdigest()
+        stored = idempotency_store.get(idempotency_key)
+        if stored is not None:
+            if stored.fingerprint != fingerprint:
+                return FastJSONResponse.from_custom_response(CustomResponse.error(
+                    msg=f"{IDEMPOTENCY_KEY_HEADER} already used with a different body", data={}))
+            return FastJSONResponse(
+                status_code=stored.status_code,
+                content=stored.content,
+                headers={**stored.headers, IDEMPOTENT_REPLAYED_HEADER: "true"},
+            )
+
     props = CreatePatientRegisterProps()
     props['body'] = await request.json()
 
-    # execute use case
-    response = use_case.execute(props)
-    response_json = response.to_JSON_response()
+    # execute use case -> synchronous handlers (master insert) are awaited
+    response = await use_case.execute_async(props)
+
+    # session LSN -> sent back on the next reads so they see this write
+    headers = {}
+    if read_router is not None and response.is_success:
+        try:
+            headers[SESSION_LSN_HEADER] = format_lsn(await read_router.get_primary_lsn_async())
+        except Exception as e:
+            # the write is committed -> answer without the token, reads may be stale
+            logger.warning("reading the primary WAL position failed: %r", e)
+
+    # errors are not stored -> the client may retry them
+    http_response = FastJSONResponse.from_custom_response(response, headers=headers)
+    if fingerprint is not None and response.is_success:
+        idempotency_store.put(idempotency_key, StoredResponse(
+            fingerprint=fingerprint,
+            status_code=http_response.status_code,
+            content=response.to_JSON_response()["content"],
+            headers=headers,
+        ))
+    http_response.headers[IDEMPOTENT_REPLAYED_HEADER] = "true" if response.replayed else "false"
+
+    # return response
+    return http_response
+
+
+@create_patient_register_route.post("/patient-register/batch")
+async def create_patient_register_batch(
+    request: Request,
+    use_case: CreatePatientRegisterBatchUseCase = Depends(get_create_patient_register_batch_use_case)
+):
+    """Route to create many patient registers with a single write to the primary database."""
+
+    props = CreatePatientRegisterBatchProps()
+    props['body'] = await request.json()
+
+    # execute use case -> the batch insert runs in the threadpool
+    response = await run_in_threadpool(use_case.execute, props)
 
     # return response
-    return JSONResponse(
-        status_code=response_json["status_code"],
-        content=response_json["content"],
-    )
+    return FastJSONResponse.from_custom_response(response)
@@ -1,42 +1,111 @@
 """Get Patient Registration Route Module."""
 
-from fastapi import APIRouter, Request
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import StreamingResponse
 
-from src.app.get_patient_registation.infra.persistence.slave_db.get_patient_postgress import GetPatientPostgress
-from src.app.shared.domain.criteria.criteria import CriteriaParser
+from src.app.shared.domain.criteria.criteria import CriteriaError, CriteriaParser
 from src.app.get_patient_registation.application.get_patient_registation_use_case import (
     GetPatientRegistationUseCase,
     GetPatientRegistationProps
 )
+from src.app.get_patient_registation.application.export_patient_registers_use_case import (
+    ExportPatientRegistersUseCase,
+    ExportPatientRegistersProps
+)
+from src.app.get_patient_registation.application.search_patient_registers_use_case import (
+    SearchPatientRegistersUseCase,
+    SearchPatientRegistersProps
+)
+from src.app.shared.infra.persistence.read_router import SESSION_LSN_HEADER, parse_session_lsn, session_lsn
+from src.presentation.dependencies import (
+    get_criteria_parser,
+    get_get_patient_registation_use_case,
+    get_export_patient_registers_use_case,
+    get_search_patient_registers_use_case
+)
+from src.app.shared.domain.models.custom_response import CustomResponse
+from src.presentation.responses import FastJSONResponse
 
 get_patient_registation_route = APIRouter()
 
 
 @get_patient_registation_route.get("/patient-register")
-async def get_patient_registration(request: Request):
+async def get_patient_registration(
+    request: Request,
+    criteria_parser: CriteriaParser = Depends(get_criteria_parser),
+    use_case: GetPatientRegistationUseCase = Depends(get_get_patient_registation_use_case)
+):
     """Route to get patient registration."""
 
     # init data
     query_params = request.query_params
     query_params_primitives = query_params.__dict__.get('_dict')
-    criteria_parser = CriteriaParser()
-    criteria = criteria_parser.dict_to_criteria(query_params_primitives)
-
-    #
-    get_patient_postgress = GetPatientPostgress()
+    try:
+        criteria = criteria_parser.dict_to_criteria(query_params_primitives)
+    except CriteriaError as e:
+        return FastJSONResponse.from_custom_response(CustomResponse.error(msg=str(e)))
 
     # init use case props
-    use_case = GetPatientRegistationUseCase(get_patient_postgress)
     props = GetPatientRegistationProps()
     props["criteria"] = criteria
 
-    # execute use case
-    response = use_case.execute(props)
-    response_json = response.to_JSON_response()
+    # execute use case -> reads honour the session LSN returned by the create route
+    token = session_lsn.set(parse_session_lsn(request.headers.get(SESSION_LSN_HEADER)))
+    try:
+        response = await use_case.execute_async(props)
+    finally:
+        session_lsn.reset(token)
+
+    # return response
+    return FastJSONResponse.from_custom_response(response)
+
+
+@get_patient_registation_route.get("/patient-register/search")
+async def search_patient_registers(
+    request: Request,
+    use_case: SearchPatientRegistersUseCase = Depends(get_search_patient_registers_use_case)
+):
+    """Route to search patient registers by name, email or phone number, best match first."""
+
+    # init use case props
+    props = SearchPatientRegistersProps()
+    props["query"] = request.query_params.get("q")
+    props["limit"] = request.query_params.get("limit")
+
+    # execute use case -> reads honour the session LSN returned by the create route
+    token = session_lsn.set(parse_session_lsn(request.headers.get(SESSION_LSN_HEADER)))
+    try:
+        response = await use_case.execute_async(props)
+    finally:
+        session_lsn.reset(token)
 
     # return response
-    return JSONResponse(
-        status_code=response_json["status_code"],
-        content=response_json["content"],
+    return FastJSONResponse.from_custom_response(response)
+
+
+@get_patient_registation_route.get("/patient-register/export")
+async def export_patient_registers(
+    request: Request,
+    criteria_parser: CriteriaParser = Depends(get_criteria_parser),
+    use_case: ExportPatientRegistersUseCase = Depends(get_export_patient_registers_use_case)
+):
+    """Route to export every patient register matching the filters as NDJSON."""
+
+    # init data -> same filters and order as the search, pagination is ignored
+    query_params = request.query_params
+    query_params_primitives = query_params.__dict__.get('_dict')
+    try:
+        criteria = criteria_parser.dict_to_criteria(query_params_primitives)
+    except CriteriaError as e:
+        # before the stream starts -> still a 400
+        return FastJSONResponse.from_custom_response(CustomResponse.error(msg=str(e)))
+
+    # init use case props
+    props = ExportPatientRegistersProps()
+    props["criteria"] = criteria
+
+    # the use case is a sync generator -> starlette iterates it in the threadpool
+    return StreamingResponse(
+        use_case.execute(props),
+        media_type="application/x-ndjson",
     )
@@ -0,0 +1,30 @@
+"""Metrics Route Module."""
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+
+from src.app.shared.infra.observability.metrics import metrics_registry
+from src.app.shared.infra.persistence.engine_registry import EngineRegistry
+from src.presentation.dependencies import get_engine_registry
+
+metrics_route = APIRouter()
+
+
+@metrics_route.get("/metrics", response_class=PlainTextResponse)
+def get_metrics():
+    """Route to scrape the metrics in the Prometheus text format."""
+    return PlainTextResponse(
+        metrics_registry.render(),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
+
+
+@metrics_route.get("/health/db-pools")
+def get_db_pool_health(engine_registry: EngineRegistry = Depends(get_engine_registry)):
+    """Route to get the occupancy of every database pool built so far."""
+    return {
+        "pools": [
+            {**pool._asdict(), "saturated": pool.saturated}
+            for pool in engine_registry.pool_health()
+        ],
+    }
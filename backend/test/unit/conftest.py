@@ -0,0 +1,81 @@
+"""
+Factories and in-memory fakes shared by the unit tests
+"""
+
+import uuid
+
+from src.app.create_patient_register.domain.repos.create_patient_repo import CreatePatientRepo, CreateResult
+
+
+def build_patient_register_body(**overrides) -> dict:
+    """Build a valid patient register body."""
+    body = {
+        "uuid": str(uuid.uuid4()),
+        "first_name": "Jane",
+        "last_name": "Smith",
+        "date_of_birth": "1990-05-15",
+        # contact data
+        "email": "jane.smith@example.com",
+        "phone_number": "1234567890",
+        "address": "123 Main St, Springfield",
+        "emergency_contact": "John Smith",
+        # medical data
+        "allergies": ["penicillin"],
+        "medical_history": ["hypertension"],
+        "current_medications": ["lisinopril"]
+    }
+    body.update(overrides)
+    return body
+
+
+class InMemoryCreatePatientRepo(CreatePatientRepo):
+    """In-memory repository inserting each uuid once, telling retries from other records.
+
+    Every write call is recorded as (method, uuids) so tests can check which
+    path was taken; with fail=True every write raises like a lost connection.
+    """
+
+    def __init__(self, fail: bool = False):
+        self.created: dict[str, dict] = {}
+        self.calls: list[tuple[str, list[str]]] = []
+        self._fail = fail
+
+    def methods(self) -> list[str]:
+        """Get the write methods called, in order."""
+        return [method for method, _ in self.calls]
+
+    def writes(self, method: str) -> list[list[str]]:
+        """Get the uuids written by every call to the given method."""
+        return [uuids for called, uuids in self.calls if called == method]
+
+    def create(self, patient_register) -> CreateResult:
+        self._record("create", [patient_register])
+        return self._insert(patient_register)
+
+    def create_many(self, patient_registers) -> bool:
+        self._record("create_many", patient_registers)
+        return all([self._insert(patient_register) for patient_register in patient_registers])
+
+    def create_each(self, patient_registers) -> list[CreateResult]:
+        self._record("create_each", patient_registers)
+        return [self._insert(patient_register) for patient_register in patient_registers]
+
+    async def create_async(self, patient_register) -> CreateResult:
+        self._record("create_async", [patient_register])
+        return self._insert(patient_register)
+
+    async def create_each_async(self, patient_registers) -> list[CreateResult]:
+        self._record("create_each_async", patient_registers)
+        return [self._insert(patient_register) for patient_register in patient_registers]
+
+    def _record(self, method: str, patient_registers: list[dict]) -> None:
+        if self._fail:
+            raise RuntimeError("connection lost")
+        self.calls.append((method, [patient_register["uuid"] for patient_register in patient_registers]))
+
+    def _insert(self, patient_register: dict) -> CreateResult:
+        stored = self.created.get(patient_register["uuid"])
+        if stored is None:
+            self.created[patient_register["uuid"]] = patient_register
+            return CreateResult.CREATED
+        return CreateResult.ALREADY_EXISTS if stored == patient_register else CreateResult.CONFLICT
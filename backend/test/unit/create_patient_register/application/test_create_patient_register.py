@@ -3,15 +3,18 @@
 Unit tests for CreatePatientRegisterUseCase
 """
 
+import asyncio
 import uuid
 import pytest
 
-from src.app.create_patient_register.domain.repos.create_patient_repo import CreatePatientRepo
-from src.app.create_patient_register.infra.persistence.main_db.create_patient_register_postgress import CreatePatientRegisterPostgress
+from src.app.create_patient_register.domain.events.event_bus import EventBus
+from src.app.create_patient_register.domain.events.patient_register_created_event import PatientRegisterCreatedEvent
+from src.app.create_patient_register.application.domain_handlers.persist_on_db_master import PersistOnDbMasterHandler
 from src.app.create_patient_register.application.create_patient_register import (
     CreatePatientRegisterUseCase,
     CreatePatientRegisterProps
 )
+from test.unit.conftest import InMemoryCreatePatientRepo, build_patient_register_body
 
 
 class TestCreatePatientRegister:
@@ -19,9 +22,8 @@ class TestCreatePatientRegister:
 
     def setup_method(self, method):
         """Setup code before each test."""
-        createPatientRegisterPostgress = CreatePatientRegisterPostgress()
-        self.create_patient_repo = createPatientRegisterPostgress
-        self.use_case = CreatePatientRegisterUseCase(self.create_patient_repo)
+        self.event_bus = EventBus()
+        self.use_case = CreatePatientRegisterUseCase(self.event_bus)
 
     def teardown_method(self, method):
         """Teardown code after each test."""
@@ -115,3 +117,42 @@ class TestCreatePatientRegister:
         assert response.is_success is True
         assert response.message == "Patient register created successfully"
         assert response.data is not None
+
+    def test_create_patient_register_valid_data_async(self):
+        """Test that the async execution awaits the master insert through create_async."""
+
+        # Arrange
+        create_patient_repo = InMemoryCreatePatientRepo()
+        self.event_bus.subscribe(PersistOnDbMasterHandler(
+            susbscribed_to=PatientRegisterCreatedEvent.event_name(),
+            create_patient_repo=create_patient_repo
+        ))
+        props = CreatePatientRegisterProps()
+        props['body'] = build_patient_register_body()
+
+        # Act
+        response = asyncio.run(self.use_case.execute_async(props))
+
+        # Assert
+        assert response.code == 200
+        assert response.is_success is True
+        assert create_patient_repo.writes("create_async") == [[props['body']["uuid"]]]
+        assert create_patient_repo.methods() == ["create_async"]
+
+    def test_create_patient_register_failed_insert_is_an_error(self):
+        """Test that a failing master insert is not reported as created."""
+
+        # Arrange
+        self.event_bus.subscribe(PersistOnDbMasterHandler(
+            susbscribed_to=PatientRegisterCreatedEvent.event_name(),
+            create_patient_repo=InMemoryCreatePatientRepo(fail=True)
+        ))
+        props = CreatePatientRegisterProps()
+        props['body'] = build_patient_register_body()
+
+        # Act
+        response = asyncio.run(self.use_case.execute_async(props))
+
+        # Assert
+        assert response.is_success is False
+        assert response.message == "Internal server error"
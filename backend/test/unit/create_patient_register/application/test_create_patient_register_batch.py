@@ -0,0 +1,91 @@
+
+"""
+Unit tests for CreatePatientRegisterBatchUseCase
+"""
+
+from src.app.create_patient_register.application.create_patient_register_batch import (
+    CreatePatientRegisterBatchUseCase,
+    CreatePatientRegisterBatchProps
+)
+from test.unit.conftest import InMemoryCreatePatientRepo, build_patient_register_body
+
+
+class TestCreatePatientRegisterBatch:
+    """Instance variables will be initialized in setup_method"""
+
+    def setup_method(self, method):
+        """Setup code before each test."""
+        self.create_patient_repo = InMemoryCreatePatientRepo()
+        self.use_case = CreatePatientRegisterBatchUseCase(self.create_patient_repo)
+
+    def test_create_patient_register_batch_single_write(self):
+        """Test that all valid records are written with a single repository call."""
+
+        # Arrange
+        props = CreatePatientRegisterBatchProps()
+        props['body'] = [build_patient_register_body() for _ in range(3)]
+
+        # Act
+        response = self.use_case.execute(props)
+
+        # Assert
+        assert response.code == 200
+        assert self.create_patient_repo.methods() == ["create_each"]
+        assert len(self.create_patient_repo.writes("create_each")[0]) == 3
+        assert response.data['errors'] == []
+
+    def test_create_patient_register_batch_per_item_errors(self):
+        """Test that invalid records are reported by index and skipped."""
+
+        # Arrange
+        props = CreatePatientRegisterBatchProps()
+        props['body'] = [
+            build_patient_register_body(),
+            build_patient_register_body(date_of_birth="1880-01-01"),
+            "not-an-object",
+        ]
+
+        # Act
+        response = self.use_case.execute(props)
+
+        # Assert
+        assert response.code == 200
+        assert len(response.data['created']) == 1
+        assert [error['index'] for error in response.data['errors']] == [1, 2]
+        assert response.data['errors'][0]['property'] == "date_of_birth"
+
+    def test_create_patient_register_batch_reports_records_already_stored(self):
+        """Test that re-sent records are reported as already stored, and other data under their uuid as conflicts."""
+
+        # Arrange
+        stored = build_patient_register_body()
+        new = build_patient_register_body()
+        self.create_patient_repo.create(stored)
+        props = CreatePatientRegisterBatchProps()
+        props['body'] = [stored, new, dict(new), {**stored, "first_name": "Mallory"}]
+
+        # Act
+        response = self.use_case.execute(props)
+
+        # Assert
+        assert response.code == 200
+        assert response.data['created'] == [new['uuid']]
+        assert response.data['already_exists'] == [stored['uuid'], new['uuid']]
+        assert response.data['conflicts'] == [stored['uuid']]
+        assert response.data['failed'] == []
+        assert len(self.create_patient_repo.created) == 2
+
+    def test_create_patient_register_batch_not_a_list(self):
+        """Test that a body which is not a list is rejected."""
+
+        # Arrange
+        props = CreatePatientRegisterBatchProps()
+        props['body'] = build_patient_register_body()
+
+        # Act
+        response = self.use_case.execute(props)
+
+        # Assert
+        assert response.code == 400
+        assert response.message == "Data validation error"
+        assert self.create_patient_repo.calls == []
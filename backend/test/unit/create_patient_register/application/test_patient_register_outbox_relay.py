@@ -0,0 +1,127 @@
+
+"""
+Unit tests for PatientRegisterOutboxRelay
+"""
+
+from src.app.create_patient_register.domain.repos.create_patient_repo import CreatePatientRepo
+from src.app.create_patient_register.domain.repos.patient_register_outbox_repo import PatientRegisterOutboxRepo
+from src.app.create_patient_register.application.patient_register_outbox_relay import PatientRegisterOutboxRelay
+
+
+class InMemoryOutboxRepo(PatientRegisterOutboxRepo):
+    """In-memory outbox keeping undelivered payloads in insertion order, with their attempts."""
+
+    def __init__(self, payloads: list[dict]):
+        self.pending = list(payloads)
+        self.attempts: dict[str, int] = {}
+
+    def drain(self, batch_size, deliver, max_attempts=5) -> int:
+        batch = [
+            payload for payload in self.pending
+            if self.attempts.get(payload["uuid"], 0) < max_attempts
+        ][:batch_size]
+        if not batch:
+            return 0
+        errors = deliver(batch)
+        delivered = [payload for payload, error in zip(batch, errors) if error is None]
+        for payload, error in zip(batch, errors):
+            if error is None:
+                self.pending.remove(payload)
+            elif delivered:
+                self.attempts[payload["uuid"]] = self.attempts.get(payload["uuid"], 0) + 1
+        return len(delivered)
+
+
+class InMemoryUpsertTarget(CreatePatientRepo):
+    """In-memory target applying payloads as idempotent upserts."""
+
+    def __init__(self, available: bool = True, rejected_uuids: frozenset = frozenset()):
+        self.available = available
+        self.rejected_uuids = rejected_uuids
+        self.records: dict[str, dict] = {}
+        self.writes = 0
+
+    def create(self, patient_register) -> bool:
+        return self.create_many([patient_register])
+
+    def create_many(self, patient_registers) -> bool:
+        if not self.available:
+            return False
+        if any(patient_register["uuid"] in self.rejected_uuids for patient_register in patient_registers):
+            raise ValueError("invalid payload")
+        self.writes += 1
+        for patient_register in patient_registers:
+            self.records[patient_register["uuid"]] = patient_register
+        return True
+
+
+class TestPatientRegisterOutboxRelay:
+    """Instance variables will be initialized in setup_method"""
+
+    def setup_method(self, method):
+        """Setup code before each test."""
+        self.outbox_repo = InMemoryOutboxRepo([{"uuid": str(index)} for index in range(5)])
+        self.target = InMemoryUpsertTarget()
+        self.relay = PatientRegisterOutboxRelay(self.outbox_repo, [self.target], batch_size=2)
+
+    def test_drain_delivers_in_batches(self):
+        """Test that every batch is delivered with a single write."""
+
+        # Act
+        delivered = [self.relay.drain_once() for _ in range(4)]
+
+        # Assert
+        assert delivered == [2, 2, 1, 0]
+        assert self.target.writes == 3
+        assert len(self.target.records) == 5
+        assert self.outbox_repo.pending == []
+
+    def test_failed_target_keeps_messages_pending(self):
+        """Test at-least-once delivery when one of the targets is unavailable."""
+
+        # Arrange
+        failing_target = InMemoryUpsertTarget(available=False)
+        relay = PatientRegisterOutboxRelay(self.outbox_repo, [self.target, failing_target], batch_size=2)
+
+        # Act
+        first_attempt = relay.drain_once()
+        failing_target.available = True
+        second_attempt = relay.drain_once()
+
+        # Assert
+        assert first_attempt == 0
+        assert second_attempt == 2
+        assert self.target.writes == 2
+        assert len(self.target.records) == 2
+        assert len(self.outbox_repo.pending) == 3
+
+    def test_bad_payload_does_not_block_the_batch(self):
+        """Test that a rejected batch is retried message by message."""
+
+        # Arrange
+        target = InMemoryUpsertTarget(rejected_uuids=frozenset({"0"}))
+        relay = PatientRegisterOutboxRelay(self.outbox_repo, [target], batch_size=2)
+
+        # Act
+        delivered = relay.drain_once()
+
+        # Assert
+        assert delivered == 1
+        assert list(target.records) == ["1"]
+        assert self.outbox_repo.attempts == {"0": 1}
+
+    def test_bad_payload_is_dead_lettered_after_max_attempts(self):
+        """Test that a message rejected max_attempts times is no longer claimed."""
+
+        # Arrange
+        target = InMemoryUpsertTarget(rejected_uuids=frozenset({"0"}))
+        relay = PatientRegisterOutboxRelay(self.outbox_repo, [target], batch_size=2, max_attempts=2)
+
+        # Act
+        delivered = [relay.drain_once() for _ in range(5)]
+
+        # Assert
+        assert delivered == [1, 1, 2, 0, 0]
+        assert sorted(target.records) == ["1", "2", "3", "4"]
+        assert self.outbox_repo.pending == [{"uuid": "0"}]
+        assert self.outbox_repo.attempts == {"0": 2}
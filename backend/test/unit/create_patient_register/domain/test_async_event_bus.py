@@ -0,0 +1,110 @@
+
+"""
+Unit tests for AsyncEventBus
+"""
+
+import threading
+import time
+
+from src.app.create_patient_register.domain.events.async_event_bus import AsyncEventBus
+from src.app.create_patient_register.domain.events.patient_register_created_event import PatientRegisterCreatedEvent
+from src.app.shared.domain.events.domain_event_handler import DomainEventHandler
+
+
+class RecordingHandler(DomainEventHandler):
+    """Handler that records the thread it ran on and can fail a number of times."""
+
+    def __init__(self, is_synchronous: bool = False, failures: int = 0, delay: float = 0.0):
+        super().__init__(PatientRegisterCreatedEvent.event_name())
+        self.is_synchronous = is_synchronous
+        self.failures = failures
+        self.delay = delay
+        self.calls = 0
+        self.handled_on: list[str] = []
+
+    def handle(self, event) -> None:
+        self.calls += 1
+        time.sleep(self.delay)
+        if self.calls <= self.failures:
+            raise RuntimeError("transient failure")
+        self.handled_on.append(threading.current_thread().name)
+
+
+class TestAsyncEventBus:
+    """Instance variables will be initialized in setup_method"""
+
+    def setup_method(self, method):
+        """Setup code before each test."""
+        self.event_bus = AsyncEventBus(workers=2, max_queue_size=10, handler_timeout=1, retry_backoff=0)
+        self.event = PatientRegisterCreatedEvent(data={"uuid": "dbd13f36-c8a6-4398-8056-9560dbe0a917"})
+
+    def teardown_method(self, method):
+        """Teardown code after each test."""
+        self.event_bus.shutdown(drain=False)
+
+    def test_synchronous_handler_runs_inline(self):
+        """Test that handlers opting into synchronous handling run on the publisher thread."""
+
+        # Arrange
+        handler = RecordingHandler(is_synchronous=True)
+        self.event_bus.subscribe(handler)
+        self.event_bus.start()
+
+        # Act
+        self.event_bus.publish(PatientRegisterCreatedEvent.event_name(), self.event)
+
+        # Assert
+        assert handler.handled_on == [threading.current_thread().name]
+
+    def test_async_handler_retried_and_drained_on_shutdown(self):
+        """Test that queued handlers are retried and finished before shutdown returns."""
+
+        # Arrange
+        handler = RecordingHandler(failures=2, delay=0.05)
+        self.event_bus.subscribe(handler)
+        self.event_bus.start()
+
+        # Act
+        self.event_bus.publish(PatientRegisterCreatedEvent.event_name(), self.event)
+        self.event_bus.shutdown(drain=True)
+
+        # Assert
+        assert handler.calls == 3
+        assert len(handler.handled_on) == 1
+        assert handler.handled_on[0].startswith("event-bus-handler")
+
+    def test_async_handler_still_running_after_timeout_is_not_retried(self):
+        """Test that a handler exceeding its timeout is not run a second time while the first run goes on."""
+
+        # Arrange
+        handler = RecordingHandler(delay=0.3)
+        handler.timeout_seconds = 0.05
+        handler.max_retries = 1
+        self.event_bus.subscribe(handler)
+        self.event_bus.start()
+
+        # Act
+        self.event_bus.publish(PatientRegisterCreatedEvent.event_name(), self.event)
+        self.event_bus.shutdown(drain=True)
+
+        # Assert
+        assert handler.calls == 1
+
+    def test_shutdown_timeout_bounds_the_drain(self):
+        """Test that shutdown returns after its timeout even with slow handlers still queued."""
+
+        # Arrange
+        handler = RecordingHandler(delay=0.2)
+        handler.timeout_seconds = 1
+        self.event_bus.subscribe(handler)
+        self.event_bus.start()
+        for _ in range(6):
+            self.event_bus.publish(PatientRegisterCreatedEvent.event_name(), self.event)
+
+        # Act
+        start = time.perf_counter()
+        self.event_bus.shutdown(drain=True, timeout=0.1)
+
+        # Assert
+        assert time.perf_counter() - start < 0.5
+        assert handler.calls < 6
@@ -0,0 +1,108 @@
+"""
+Unit tests for PatientRegister validation
+"""
+
+import pytest
+
+from src.app.create_patient_register.domain.models import patient_register
+from src.app.create_patient_register.domain.models.patient_register import PartialPatientRegister, PatientRegister
+from src.app.shared.domain.models.model_error_exeption import ModelErrorException
+from test.unit.conftest import build_patient_register_body
+
+
+class TestPatientRegisterValidateMany:
+    """Tests for the bulk validation"""
+
+    def test_all_valid_records_are_ready_for_insertion(self):
+        """Test that valid records come back as the same primitives as the single-record path."""
+
+        # Arrange
+        records = [build_patient_register_body() for _ in range(3)]
+
+        # Act
+        result = PatientRegister.validate_many(records)
+
+        # Assert
+        assert result.errors == []
+        assert result.valid == [PatientRegister(record).to_primitives() for record in records]
+
+    def test_every_error_is_reported_by_index(self):
+        """Test that each invalid record lists all its field errors and the rest stay valid."""
+
+        # Arrange
+        records = [
+            build_patient_register_body(),
+            build_patient_register_body(date_of_birth="1880-01-01", email="not-an-email"),
+            "not-an-object",
+            build_patient_register_body(first_name="Ada"),
+        ]
+
+        # Act
+        result = PatientRegister.validate_many(records)
+
+        # Assert
+        assert [record["first_name"] for record in result.valid] == ["Jane", "Ada"]
+        assert [error["index"] for error in result.errors] == [1, 2]
+        assert result.errors[0]["property"] == "date_of_birth"
+        assert [field["property"] for field in result.errors[0]["fields"]] == ["date_of_birth", "email"]
+        assert result.errors[1]["property"] == "body"
+
+    def test_each_record_is_validated_once(self, monkeypatch):
+        """Test that the valid records are not validated again when another one fails."""
+
+        # Arrange
+        checked = []
+
+        def check_date_of_birth(value):
+            checked.append(value)
+            return value
+
+        monkeypatch.setattr(patient_register, "_check_date_of_birth", check_date_of_birth)
+        records = [
+            build_patient_register_body(),
+            build_patient_register_body(email="not-an-email"),
+            build_patient_register_body(),
+        ]
+
+        # Act
+        result = PatientRegister.validate_many(records)
+
+        # Assert
+        assert len(result.valid) == 2
+        assert len(checked) == 3
+
+    def test_single_record_reports_the_first_error(self):
+        """Test that the single-record path keeps raising ModelErrorException."""
+
+        # Act
+        with pytest.raises(ModelErrorException) as error:
+            PatientRegister(build_patient_register_body(first_name=""))
+
+        # Assert
+        assert error.value.property_name == "first_name"
+
+
+class TestPartialPatientRegister:
+
+    FIELDS = ("uuid", "first_name", "last_name", "date_of_birth")
+
+    def test_projection_keeps_the_selected_fields_only(self):
+        # Arrange
+        body = build_patient_register_body()
+        projection = {field: body[field] for field in self.FIELDS}
+
+        # Act
+        primitives = PartialPatientRegister(projection, self.FIELDS).to_primitives()
+
+        # Assert
+        assert primitives == projection
+
+    def test_projection_keeps_the_field_constraints(self):
+        # Arrange
+        body = build_patient_register_body(date_of_birth="1850-01-01")
+        projection = {field: body[field] for field in self.FIELDS}
+
+        # Act / Assert
+        with pytest.raises(ModelErrorException) as error:
+            PartialPatientRegister(projection, self.FIELDS)
+        assert error.value.property_name == "date_of_birth"
@@ -0,0 +1,34 @@
+"""
+Unit tests for PatientRegisterReadModel
+"""
+
+import uuid
+from datetime import date
+
+from src.app.create_patient_register.domain.models.patient_register import PatientRegister
+from src.app.create_patient_register.domain.models.patient_register_read_model import PatientRegisterReadModel
+
+
+COLUMNS = [
+    "uuid", "first_name", "last_name", "date_of_birth", "email", "phone_number",
+    "address", "emergency_contact", "allergies", "medical_history", "current_medications",
+]
+
+
+def build_row() -> tuple:
+    return (
+        uuid.uuid4(), "Ada", "Lovelace", date(1990, 1, 1), "ada@example.com",
+        "5551234567", "12 Main Street", "Charles Babbage", ["pollen"], [], ["inhaler"],
+    )
+
+
+class TestPatientRegisterReadModel:
+
+    def test_primitives_match_the_validated_model(self):
+        row = build_row()
+        validated = dict(zip(COLUMNS, row))
+        validated["uuid"] = str(validated["uuid"])
+
+        read_model = PatientRegisterReadModel.from_row(COLUMNS, row)
+
+        assert read_model.to_primitives() == PatientRegister(validated).to_primitives()
@@ -0,0 +1,87 @@
+"""
+Unit tests for CoalescingCreatePatientRepo
+"""
+
+import asyncio
+
+from src.app.create_patient_register.domain.repos.create_patient_repo import CreateResult
+from src.app.create_patient_register.infra.persistence.main_db.coalescing_create_patient_repo import (
+    CoalescingCreatePatientRepo
+)
+from test.unit.conftest import InMemoryCreatePatientRepo
+
+
+class TestCoalescingCreatePatientRepo:
+    """Instance variables will be initialized in setup_method"""
+
+    def setup_method(self, method):
+        """Setup code before each test."""
+        self.create_patient_repo = InMemoryCreatePatientRepo()
+
+    def test_concurrent_creates_share_one_write_with_their_own_result(self):
+        """Test that creates within the window are written together and a reused uuid only fails its caller."""
+
+        # Arrange
+        repo = CoalescingCreatePatientRepo(self.create_patient_repo, max_delay=0.01, max_batch_size=100)
+        records = [{"uuid": "a"}, {"uuid": "b"}, {"uuid": "a", "first_name": "Mallory"}, {"uuid": "c"}]
+
+        async def run():
+            return await asyncio.gather(*(repo.create_async(record) for record in records))
+
+        # Act
+        results = asyncio.run(run())
+
+        # Assert
+        assert self.create_patient_repo.methods() == ["create_each_async"]
+        assert self.create_patient_repo.writes("create_each_async") == [["a", "b", "a", "c"]]
+        assert results == [CreateResult.CREATED, CreateResult.CREATED, CreateResult.CONFLICT, CreateResult.CREATED]
+
+    def test_batch_size_flushes_before_the_window(self):
+        """Test that max_batch_size records are written without waiting for the timer."""
+
+        # Arrange
+        repo = CoalescingCreatePatientRepo(self.create_patient_repo, max_delay=0.05, max_batch_size=2)
+
+        async def run():
+            return await asyncio.gather(*(repo.create_async({"uuid": str(index)}) for index in range(5)))
+
+        # Act
+        results = asyncio.run(run())
+
+        # Assert
+        assert [len(batch) for batch in self.create_patient_repo.writes("create_each_async")] == [2, 2, 1]
+        assert results == [CreateResult.CREATED] * 5
+
+    def test_failed_write_fails_every_caller(self):
+        """Test that a failing transaction resolves every waiting caller with False."""
+
+        # Arrange
+        repo = CoalescingCreatePatientRepo(InMemoryCreatePatientRepo(fail=True), max_delay=0.001)
+
+        async def run():
+            return await asyncio.gather(repo.create_async({"uuid": "a"}), repo.create_async({"uuid": "b"}))
+
+        # Act
+        results = asyncio.run(run())
+
+        # Assert
+        assert results == [CreateResult.FAILED, CreateResult.FAILED]
+
+    def test_close_writes_the_pending_records(self):
+        """Test that close does not wait for the window and writes what is pending."""
+
+        # Arrange
+        repo = CoalescingCreatePatientRepo(self.create_patient_repo, max_delay=60, max_batch_size=100)
+
+        async def run():
+            create = asyncio.ensure_future(repo.create_async({"uuid": "a"}))
+            await asyncio.sleep(0)
+            await repo.close()
+            return await create
+
+        # Act
+        result = asyncio.run(run())
+
+        # Assert
+        assert result is CreateResult.CREATED
+        assert self.create_patient_repo.writes("create_each_async") == [["a"]]
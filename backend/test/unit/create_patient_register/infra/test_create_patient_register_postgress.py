@@ -0,0 +1,124 @@
+"""
+Unit tests for telling retried creates from other records in CreatePatientRegisterPostgress
+"""
+
+import uuid
+from contextlib import contextmanager
+from datetime import date
+
+from src.app.create_patient_register.domain.repos.create_patient_repo import CreateResult
+from src.app.create_patient_register.infra.persistence.main_db import create_patient_register_postgress
+from src.app.create_patient_register.infra.persistence.main_db.create_patient_register_postgress import (
+    CreatePatientRegisterPostgress,
+    existing_result,
+    stored_by_uuid
+)
+
+
+class FakeResult:
+    """Result of the stored records SELECT, as the driver returns it."""
+
+    def __init__(self, columns: list[str], rows: list[tuple]):
+        self.columns = columns
+        self.rows = rows
+
+    def keys(self):
+        return self.columns
+
+    def __iter__(self):
+        return iter(self.rows)
+
+
+class TestExistingResult:
+    """Instance variables will be initialized in setup_method"""
+
+    def setup_method(self, method):
+        """Setup code before each test."""
+        self.uuid = uuid.uuid4()
+        self.stored = stored_by_uuid(FakeResult(
+            ["uuid", "first_name", "date_of_birth", "allergies"],
+            [(self.uuid, "Ada", date(1990, 5, 15), ["penicillin"])]
+        ))
+
+    def test_same_data_is_a_retry(self):
+        # Arrange
+        patient_register = {"uuid": str(self.uuid), "first_name": "Ada", "date_of_birth": "1990-05-15",
+                            "allergies": ["penicillin"]}
+
+        # Act / Assert
+        assert existing_result(patient_register, self.stored) is CreateResult.ALREADY_EXISTS
+
+    def test_other_data_is_a_conflict(self):
+        # Arrange
+        patient_register = {"uuid": str(self.uuid), "first_name": "Mallory", "date_of_birth": "1990-05-15",
+                            "allergies": ["penicillin"]}
+
+        # Act / Assert
+        assert existing_result(patient_register, self.stored) is CreateResult.CONFLICT
+        assert not CreateResult.CONFLICT
+
+
+class FakeInsertResult:
+    """Result of the INSERT ... RETURNING uuid of one row."""
+
+    def __init__(self, row):
+        self.row = row
+
+    def first(self):
+        return self.row
+
+
+class RejectingSession:
+    """Session failing every multi-row INSERT and the single-row INSERTs of rejected uuids."""
+
+    def __init__(self, rejected: set[str]):
+        self.rejected = rejected
+        self.savepoints = 0
+        self.inserted: list[str] = []
+        self.committed = False
+
+    def __call__(self, engine):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    @contextmanager
+    def begin_nested(self):
+        self.savepoints += 1
+        yield
+
+    def execute(self, statement, params):
+        if isinstance(params, list):
+            raise RuntimeError("value too long for type character varying(50)")
+        if params["uuid"] in self.rejected:
+            raise RuntimeError("value too long for type character varying(50)")
+        self.inserted.append(params["uuid"])
+        return FakeInsertResult((params["uuid"],))
+
+    def commit(self):
+        self.committed = True
+
+
+class TestCreateEach:
+    """Instance variables will be initialized in setup_method"""
+
+    def test_failed_multi_row_insert_is_retried_row_by_row(self, monkeypatch):
+        """Test that one bad row only fails itself, like on the async path."""
+
+        # Arrange
+        session = RejectingSession(rejected={"bad"})
+        monkeypatch.setattr(create_patient_register_postgress, "Session", session)
+        repo = CreatePatientRegisterPostgress(engine=object())
+
+        # Act
+        results = repo.create_each([{"uuid": "a"}, {"uuid": "bad"}, {"uuid": "b"}])
+
+        # Assert
+        assert results == [CreateResult.CREATED, CreateResult.FAILED, CreateResult.CREATED]
+        assert session.inserted == ["a", "b"]
+        assert session.savepoints == 4
+        assert session.committed is True
@@ -0,0 +1,75 @@
+"""
+Unit tests for ExportPatientRegistersUseCase
+"""
+
+import json
+
+import pytest
+
+from src.app.create_patient_register.domain.repos.export_patient_repo import ExportPatientRepo
+from src.app.get_patient_registation.application.export_patient_registers_use_case import (
+    ExportPatientRegistersProps,
+    ExportPatientRegistersUseCase
+)
+from src.app.shared.domain.criteria.criteria import Criteria
+from src.presentation.responses import dumps
+
+
+class InMemoryExportPatientRepo(ExportPatientRepo):
+    """In-memory repository yielding the records lazily."""
+
+    def __init__(self, records: list[dict], fail_after: int = None):
+        self.records = records
+        self.fail_after = fail_after
+
+    def stream(self, criteria):
+        for index, record in enumerate(self.records):
+            if index == self.fail_after:
+                raise RuntimeError("connection lost")
+            yield record
+
+
+def build_props() -> ExportPatientRegistersProps:
+    props = ExportPatientRegistersProps()
+    props["criteria"] = Criteria()
+    return props
+
+
+class TestExportPatientRegistersUseCase:
+
+    def test_yields_one_json_document_per_line(self):
+        records = [{"uuid": str(index), "first_name": "Ada"} for index in range(3)]
+        use_case = ExportPatientRegistersUseCase(InMemoryExportPatientRepo(records))
+
+        body = b"".join(use_case.execute(build_props()))
+
+        assert [json.loads(line) for line in body.splitlines()] == records
+
+    def test_groups_lines_into_chunks(self):
+        records = [{"uuid": str(index)} for index in range(10)]
+        use_case = ExportPatientRegistersUseCase(InMemoryExportPatientRepo(records), chunk_size=30)
+
+        chunks = list(use_case.execute(build_props()))
+
+        assert 1 < len(chunks) < len(records)
+        assert all(chunk.endswith(b"\n") for chunk in chunks)
+
+    def test_repository_error_aborts_the_export(self):
+        records = [{"uuid": str(index)} for index in range(5)]
+        use_case = ExportPatientRegistersUseCase(InMemoryExportPatientRepo(records, fail_after=2), chunk_size=1)
+        chunks = []
+
+        with pytest.raises(RuntimeError):
+            for chunk in use_case.execute(build_props()):
+                chunks.append(chunk)
+
+        # the rows sent before the error are not followed by a clean end of the stream
+        assert len(chunks) == 2
+
+    def test_rows_are_encoded_with_the_given_encoder(self):
+        records = [{"uuid": "1", "first_name": "Zoë"}]
+        use_case = ExportPatientRegistersUseCase(InMemoryExportPatientRepo(records), dumps=dumps)
+
+        body = b"".join(use_case.execute(build_props()))
+
+        assert body == dumps(records[0]) + b"\n"
@@ -0,0 +1,101 @@
+"""
+Unit tests for GetPatientRegistationUseCase
+"""
+
+import asyncio
+
+from src.app.create_patient_register.domain.models.patient_register_read_model import PatientRegisterReadModel
+from src.app.create_patient_register.domain.repos.count_patient_repo import CountPatientRepo, PatientRegisterCount
+from src.app.create_patient_register.domain.repos.get_patient_repo import GetPatientRepo
+from src.app.get_patient_registation.application.get_patient_registation_use_case import (
+    GetPatientRegistationProps,
+    GetPatientRegistationUseCase
+)
+from src.app.shared.domain.criteria.criteria import CriteriaParser, Cursor
+
+
+class InMemoryGetPatientRepo(GetPatientRepo):
+    """In-memory repository returning the page plus one row, like the SQL lookahead."""
+
+    def __init__(self, records: list[dict]):
+        self.records = records
+
+    def get(self, criteria):
+        pagination = criteria.pagination
+        offset = (pagination.page - 1) * pagination.per_page if hasattr(pagination, "page") else 0
+        rows = self.records[offset:offset + pagination.per_page + 1]
+        return [PatientRegisterReadModel(record) for record in rows]
+
+
+class FixedCountPatientRepo(CountPatientRepo):
+    """Repository returning a fixed count and recording the calls."""
+
+    def __init__(self, patient_register_count):
+        self.patient_register_count = patient_register_count
+        self.calls = 0
+
+    def count(self, criteria):
+        self.calls += 1
+        return self.patient_register_count
+
+
+def build_props(query_params: dict) -> GetPatientRegistationProps:
+    props = GetPatientRegistationProps()
+    props["criteria"] = CriteriaParser().dict_to_criteria(query_params)
+    return props
+
+
+class TestGetPatientRegistationUseCase:
+
+    def setup_method(self):
+        self.records = [{"uuid": f"uuid-{index:02d}", "last_name": "Lee"} for index in range(25)]
+        self.count_patient_repo = FixedCountPatientRepo(PatientRegisterCount(120000, True))
+        self.use_case = GetPatientRegistationUseCase(InMemoryGetPatientRepo(self.records), self.count_patient_repo)
+
+    def test_trims_the_lookahead_row_and_reports_the_next_page(self):
+        # Act
+        response = asyncio.run(self.use_case.execute_async(build_props({"page": "1", "per_page": "10"})))
+
+        # Assert
+        assert response.data["registrations"] == self.records[:10]
+        assert response.data["has_next"] is True
+        assert response.data["total"] == 120000
+        assert response.data["total_is_estimate"] is True
+        assert self.count_patient_repo.calls == 1
+
+    def test_last_offset_page_counts_without_a_query(self):
+        # Act
+        response = self.use_case.execute(build_props({"page": "3", "per_page": "10"}))
+
+        # Assert
+        assert response.data["registrations"] == self.records[20:]
+        assert response.data["has_next"] is False
+        assert response.data["total"] == 25
+        assert response.data["total_is_estimate"] is False
+        assert self.count_patient_repo.calls == 0
+
+    def test_cursor_only_on_pages_with_a_next_page(self):
+        # Arrange
+        use_case = GetPatientRegistationUseCase(InMemoryGetPatientRepo(self.records[:10]))
+
+        # Act
+        full = use_case.execute(build_props({"cursor": "", "per_page": "5"}))
+        last = use_case.execute(build_props({"cursor": "", "per_page": "10"}))
+
+        # Assert
+        assert full.data["next_cursor"] == Cursor.encode([], "uuid-04")
+        assert last.data["has_next"] is False
+        assert last.data["next_cursor"] is None
+        assert last.data["total"] is None
+
+    def test_failed_count_leaves_the_total_unknown(self):
+        # Arrange
+        use_case = GetPatientRegistationUseCase(InMemoryGetPatientRepo(self.records), FixedCountPatientRepo(None))
+
+        # Act
+        response = use_case.execute(build_props({"page": "1", "per_page": "10"}))
+
+        # Assert
+        assert response.is_success
+        assert response.data["total"] is None
+        assert response.data["total_is_estimate"] is None
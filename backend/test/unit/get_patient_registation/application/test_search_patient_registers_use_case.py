@@ -0,0 +1,84 @@
+"""
+Unit tests for SearchPatientRegistersUseCase
+"""
+
+import asyncio
+
+from src.app.create_patient_register.domain.models.patient_register_read_model import PatientRegisterReadModel
+from src.app.create_patient_register.domain.repos.search_patient_repo import SearchPatientRepo
+from src.app.get_patient_registation.application.search_patient_registers_use_case import (
+    SearchPatientRegistersProps,
+    SearchPatientRegistersUseCase
+)
+
+
+class InMemorySearchPatientRepo(SearchPatientRepo):
+    """In-memory repository recording the searches."""
+
+    def __init__(self, records: list[dict]):
+        self.records = records
+        self.searches = []
+
+    def search(self, query, limit):
+        self.searches.append((query, limit))
+        return [PatientRegisterReadModel(record) for record in self.records[:limit]]
+
+
+def build_props(query=None, limit=None) -> SearchPatientRegistersProps:
+    props = SearchPatientRegistersProps()
+    props["query"] = query
+    props["limit"] = limit
+    return props
+
+
+class TestSearchPatientRegistersUseCase:
+
+    def setup_method(self):
+        self.records = [{"uuid": str(index), "last_name": "Lovelace", "score": 1 - index / 10} for index in range(3)]
+        self.repo = InMemorySearchPatientRepo(self.records)
+        self.use_case = SearchPatientRegistersUseCase(self.repo)
+
+    def test_returns_the_ranked_registrations(self):
+        # Act
+        response = asyncio.run(self.use_case.execute_async(build_props("  ada   lovlace ")))
+
+        # Assert
+        assert response.is_success
+        assert response.data["registrations"] == self.records
+        assert self.repo.searches == [("ada lovlace", 20)]
+
+    def test_uses_the_requested_limit(self):
+        # Act
+        response = self.use_case.execute(build_props("lovelace", "2"))
+
+        # Assert
+        assert response.is_success
+        assert len(response.data["registrations"]) == 2
+        assert self.repo.searches == [("lovelace", 2)]
+
+    def test_rejects_a_query_too_short_for_trigrams(self):
+        # Act
+        response = self.use_case.execute(build_props(" ab "))
+
+        # Assert
+        assert response.code == 400
+        assert not response.is_success
+        assert self.repo.searches == []
+
+    def test_rejects_a_missing_or_too_long_query(self):
+        # Act
+        missing = self.use_case.execute(build_props())
+        too_long = self.use_case.execute(build_props("a" * 101))
+
+        # Assert
+        assert missing.code == 400
+        assert too_long.code == 400
+        assert self.repo.searches == []
+
+    def test_rejects_an_invalid_limit(self):
+        # Act
+        responses = [self.use_case.execute(build_props("lovelace", limit)) for limit in ("0", "101", "ten")]
+
+        # Assert
+        assert [response.code for response in responses] == [400, 400, 400]
+        assert self.repo.searches == []
@@ -0,0 +1,90 @@
+"""
+Unit tests for CachedCountPatientRepo
+"""
+
+import asyncio
+
+from src.app.create_patient_register.domain.repos.count_patient_repo import CountPatientRepo, PatientRegisterCount
+from src.app.get_patient_registation.infra.cache.cached_count_patient_repo import CachedCountPatientRepo
+from src.app.shared.domain.criteria.criteria import CriteriaParser
+from src.app.shared.infra.cache.query_cache import InMemoryQueryCacheBackend
+
+
+class CountingCountPatientRepo(CountPatientRepo):
+    """Repository returning a fixed count and counting the queries."""
+
+    def __init__(self, patient_register_count=PatientRegisterCount(42, False)):
+        self.patient_register_count = patient_register_count
+        self.queries = 0
+
+    def count(self, criteria):
+        self.queries += 1
+        return self.patient_register_count
+
+
+def build_criteria(**query_params):
+    return CriteriaParser().dict_to_criteria(query_params)
+
+
+class TestCachedCountPatientRepo:
+    """Instance variables will be initialized in setup_method"""
+
+    def setup_method(self, method):
+        """Setup code before each test."""
+        self.count_patient_repo = CountingCountPatientRepo()
+        self.cached_repo = CachedCountPatientRepo(self.count_patient_repo, InMemoryQueryCacheBackend(), ttl=60)
+
+    def test_pages_and_orders_of_a_search_share_the_count(self):
+        """Test that only the filters make the cache key."""
+
+        # Arrange
+        filters = {"0_field": "last_name", "0_operator": "EQUAL", "0_value": "Lee"}
+
+        # Act
+        first = self.cached_repo.count(build_criteria(**filters, page="1", per_page="10"))
+        second = asyncio.run(self.cached_repo.count_async(
+            build_criteria(**filters, page="7", per_page="10", orderBy="first_name", order="DESC")))
+
+        # Assert
+        assert first == second == PatientRegisterCount(42, False)
+        assert self.count_patient_repo.queries == 1
+
+    def test_other_filters_are_counted_again(self):
+        """Test that a different filter value misses the cache."""
+
+        # Act
+        self.cached_repo.count(build_criteria(**{"0_field": "last_name", "0_operator": "EQUAL", "0_value": "Lee"}))
+        self.cached_repo.count(build_criteria(**{"0_field": "last_name", "0_operator": "EQUAL", "0_value": "Torres"}))
+
+        # Assert
+        assert self.count_patient_repo.queries == 2
+
+    def test_async_counts_are_cached(self):
+        """Test that a count made on the async path is stored for the next one."""
+
+        # Arrange
+        criteria = build_criteria(**{"0_field": "last_name", "0_operator": "EQUAL", "0_value": "Lee"})
+
+        async def count_twice():
+            await self.cached_repo.count_async(criteria)
+            return await self.cached_repo.count_async(criteria)
+
+        # Act
+        patient_register_count = asyncio.run(count_twice())
+
+        # Assert
+        assert patient_register_count == PatientRegisterCount(42, False)
+        assert self.count_patient_repo.queries == 1
+
+    def test_failed_counts_are_not_cached(self):
+        """Test that None (a failed count) is queried again next time."""
+
+        # Arrange
+        self.count_patient_repo.patient_register_count = None
+
+        # Act
+        self.cached_repo.count(build_criteria())
+        self.cached_repo.count(build_criteria())
+
+        # Assert
+        assert self.count_patient_repo.queries == 2
@@ -0,0 +1,184 @@
+"""
+Unit tests for CachedGetPatientRepo and the in-memory query cache backend
+"""
+
+import asyncio
+import json
+import threading
+import time
+
+from src.app.create_patient_register.domain.models.patient_register_read_model import PatientRegisterReadModel
+from src.app.create_patient_register.domain.repos.get_patient_repo import GetPatientRepo
+from src.app.get_patient_registation.infra.cache.cached_get_patient_repo import (
+    CachedGetPatientRepo,
+    criteria_to_cache_key
+)
+from src.app.shared.domain.criteria.criteria import CriteriaParser
+from src.app.shared.infra.cache.query_cache import (
+    InMemoryQueryCacheBackend,
+    QueryCacheBackend,
+    approximate_size
+)
+
+
+class CountingGetPatientRepo(GetPatientRepo):
+    """Repository returning a fixed result and counting the queries."""
+
+    def __init__(self):
+        self.queries = 0
+
+    def get(self, criteria) -> list:
+        self.queries += 1
+        return [PatientRegisterReadModel({"first_name": "Ada"})]
+
+
+class ThreadRecordingBackend(QueryCacheBackend):
+    """Blocking backend (like Redis) recording the thread of every call."""
+
+    def __init__(self):
+        self._backend = InMemoryQueryCacheBackend()
+        self.threads: list[int] = []
+
+    def get(self, key):
+        self.threads.append(threading.get_ident())
+        return self._backend.get(key)
+
+    def set(self, key, value, ttl):
+        self.threads.append(threading.get_ident())
+        self._backend.set(key, value, ttl)
+
+    def delete(self, keys):
+        self._backend.delete(keys)
+
+    def get_counter(self, name):
+        self.threads.append(threading.get_ident())
+        return self._backend.get_counter(name)
+
+    def increment(self, name):
+        return self._backend.increment(name)
+
+    def clear(self):
+        self._backend.clear()
+
+
+def build_criteria(*filters: tuple[str, str, str], **query_params):
+    for index, (field, operator, value) in enumerate(filters):
+        query_params.update({f"{index}_field": field, f"{index}_operator": operator, f"{index}_value": value})
+    return CriteriaParser().dict_to_criteria(query_params)
+
+
+class TestCachedGetPatientRepo:
+    """Instance variables will be initialized in setup_method"""
+
+    def setup_method(self, method):
+        """Setup code before each test."""
+        self.get_patient_repo = CountingGetPatientRepo()
+        self.backend = InMemoryQueryCacheBackend()
+        self.cached_repo = CachedGetPatientRepo(self.get_patient_repo, self.backend, ttl=60)
+
+    def test_repeated_criteria_hit_the_cache(self):
+        criteria = build_criteria(("first_name", "EQUAL", "Ada"))
+
+        self.cached_repo.get(criteria)
+        self.cached_repo.get(criteria)
+
+        assert self.get_patient_repo.queries == 1
+        assert self.cached_repo.stats() == {"hits": 1, "misses": 1}
+
+    def test_filter_order_does_not_change_the_key(self):
+        first = build_criteria(("first_name", "EQUAL", "Ada"), ("last_name", "EQUAL", "Lovelace"))
+        second = build_criteria(("last_name", "EQUAL", "Lovelace"), ("first_name", "EQUAL", "Ada"))
+
+        assert criteria_to_cache_key(first) == criteria_to_cache_key(second)
+
+    def test_invalidate_makes_every_cached_query_a_miss(self):
+        criteria = build_criteria(("first_name", "EQUAL", "Ada"))
+        self.cached_repo.get(criteria)
+
+        self.cached_repo.invalidate()
+        self.cached_repo.get(criteria)
+
+        assert self.get_patient_repo.queries == 2
+        assert self.cached_repo.stats() == {"hits": 0, "misses": 2}
+
+    def test_result_read_before_an_invalidation_is_not_served_after_it(self):
+        criteria = build_criteria(("first_name", "EQUAL", "Ada"))
+        stale_query = self.get_patient_repo.get
+
+        def query_racing_with_a_create(criteria):
+            # the create commits and invalidates while this query reads the replica
+            self.cached_repo.invalidate()
+            return stale_query(criteria)
+
+        self.get_patient_repo.get = query_racing_with_a_create
+        self.cached_repo.get(criteria)
+        self.get_patient_repo.get = stale_query
+        self.cached_repo.get(criteria)
+
+        assert self.get_patient_repo.queries == 2
+
+    def test_hits_are_read_models_rebuilt_from_primitives(self):
+        criteria = build_criteria(("first_name", "EQUAL", "Ada"))
+        self.cached_repo.get(criteria)
+
+        cached = self.cached_repo.get(criteria)
+
+        assert [patient_register.to_primitives() for patient_register in cached] == [{"first_name": "Ada"}]
+
+    def test_async_reads_do_not_call_a_blocking_backend_on_the_event_loop(self):
+        backend = ThreadRecordingBackend()
+        cached_repo = CachedGetPatientRepo(self.get_patient_repo, backend, ttl=60)
+        criteria = build_criteria(("first_name", "EQUAL", "Ada"))
+
+        async def read_twice():
+            loop_thread = threading.get_ident()
+            await cached_repo.get_async(criteria)
+            return loop_thread, await cached_repo.get_async(criteria)
+
+        loop_thread, cached = asyncio.run(read_twice())
+
+        assert self.get_patient_repo.queries == 1
+        assert [patient_register.to_primitives() for patient_register in cached] == [{"first_name": "Ada"}]
+        assert len(backend.threads) == 5
+        assert loop_thread not in backend.threads
+
+    def test_empty_results_are_not_cached(self):
+        self.get_patient_repo.get = lambda criteria: []
+
+        self.cached_repo.get(build_criteria(("first_name", "EQUAL", "Ada")))
+
+        assert self.backend.keys() == []
+
+
+class TestInMemoryQueryCacheBackend:
+
+    def test_expired_entries_are_misses(self):
+        backend = InMemoryQueryCacheBackend()
+        backend.set("key", [1], ttl=0.01)
+
+        time.sleep(0.02)
+
+        assert backend.get("key") is None
+
+    def test_evicts_least_recently_used_entry(self):
+        backend = InMemoryQueryCacheBackend(max_entries=2)
+        backend.set("first", [1], ttl=60)
+        backend.set("second", [2], ttl=60)
+        backend.get("first")
+
+        backend.set("third", [3], ttl=60)
+
+        assert backend.keys() == ["first", "third"]
+
+    def test_evicts_to_stay_within_the_byte_budget(self):
+        backend = InMemoryQueryCacheBackend(max_bytes=300)
+        backend.set("first", "x" * 200, ttl=60)
+        backend.set("second", "x" * 200, ttl=60)
+
+        assert backend.keys() == ["second"]
+        assert backend.size_bytes <= 300
+
+    def test_page_size_is_estimated_from_its_first_row(self):
+        page = [{"uuid": str(index), "first_name": "Ada"} for index in range(10, 60)]
+
+        assert approximate_size(page) == len(json.dumps(page, separators=(",", ":")))
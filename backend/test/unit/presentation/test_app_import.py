@@ -0,0 +1,57 @@
+"""
+Unit tests for importing the app without side effects
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+
+BACKEND_DIR = Path(__file__).resolve().parents[3]
+
+# generous, importing fastapi, pydantic and sqlalchemy takes about 1 s;
+# building engines or loading drivers at import time shows up in the probe first
+IMPORT_TIME_BUDGET_SECONDS = 5.0
+
+PROBE = """
+import gc, json, os, sys
+import main
+from sqlalchemy import Engine
+print(json.dumps({
+    "engines": sum(isinstance(obj, Engine) for obj in gc.get_objects()),
+    "drivers": [name for name in ("psycopg2", "asyncpg") if name in sys.modules],
+    "container": hasattr(main.app.state, "container"),
+}))
+"""
+
+
+def import_main() -> tuple[dict, float]:
+    """Import main in a fresh interpreter and get the probe result and its cumulative import seconds."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROBE],
+        cwd=BACKEND_DIR, capture_output=True, text=True, check=True,
+    )
+    main_line = next(line for line in result.stderr.splitlines() if line.endswith("| main"))
+    cumulative_us = int(main_line.split("|")[1])
+    return json.loads(result.stdout.splitlines()[-1]), cumulative_us / 1_000_000
+
+
+class TestAppImport:
+    """Instance variables will be initialized in setup_method"""
+
+    def setup_method(self, method):
+        """Setup code before each test."""
+        self.probe, self.import_seconds = import_main()
+
+    def test_import_builds_no_engine(self):
+        """Test that engines and drivers are left to the lifespan of each worker."""
+
+        # Assert
+        assert self.probe == {"engines": 0, "drivers": [], "container": False}
+
+    def test_import_time_within_budget(self):
+        """Test that importing the app stays within the budget (see benchmarks/bench_import_time.py)."""
+
+        # Assert
+        assert self.import_seconds < IMPORT_TIME_BUDGET_SECONDS
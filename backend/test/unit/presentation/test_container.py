@@ -0,0 +1,146 @@
+
+"""
+Unit tests for the application container
+"""
+
+import asyncio
+
+import pytest
+
+from src.app.create_patient_register.domain.events.async_event_bus import AsyncEventBus
+from src.app.create_patient_register.domain.events.patient_register_created_event import PatientRegisterCreatedEvent
+from src.app.create_patient_register.application.patient_register_outbox_relay import PatientRegisterOutboxRelayConfig
+from src.app.create_patient_register.infra.persistence.main_db.coalescing_create_patient_repo import WriteCoalescingConfig
+from src.app.shared.infra.persistence.engine_registry import REPLICA, EngineRegistryConfig, parse_endpoints
+from src.app.shared.infra.persistence.read_router import ReadRouterConfig
+from src.presentation.container import Container
+
+
+class TestContainer:
+    """Instance variables will be initialized in setup_method"""
+
+    def setup_method(self, method):
+        """Setup code before each test."""
+        self.container = Container()
+
+    def teardown_method(self, method):
+        """Teardown code after each test."""
+        asyncio.run(self.container.shutdown())
+
+    def test_event_bus_subscriptions_wired_once(self):
+        """Test that the handlers are subscribed a single time on the shared bus."""
+
+        # Act
+        handlers = self.container.event_bus._subscribers[PatientRegisterCreatedEvent.event_name()]
+
+        # Assert
+        assert isinstance(self.container.event_bus, AsyncEventBus)
+        assert [type(handler).__name__ for handler in handlers] == [
+            "LogginHandler",
+            "PersistOnDbMasterHandler",
+            "InvalidateQueryCacheHandler",
+        ]
+        assert self.container.create_patient_register_use_case._event_bus is self.container.event_bus
+
+    def test_repositories_share_the_container_engines(self):
+        """Test that repositories use the engines owned by the container."""
+
+        # Assert
+        assert self.container.create_patient_repo._engine is self.container.engine
+        assert self.container.get_patient_repo._get_patient_repo._async_engine is self.container.async_slave_engine
+        assert self.container.patient_register_outbox_relay is None
+        assert self.container.count_patient_repo._count_patient_repo._async_engine is self.container.async_slave_engine
+        assert self.container.get_patient_registation_use_case.count_patient_repo is self.container.count_patient_repo
+
+    def test_read_router_builds_one_target_per_replica(self):
+        """Test that enabling the read router wires it into the search repository."""
+
+        # Arrange
+        read_router_config = ReadRouterConfig()
+        read_router_config.enabled = True
+        engine_registry_config = EngineRegistryConfig()
+        engine_registry_config.endpoints = parse_endpoints(
+            "primary=primary@db-main:5432,replica-01=replica@db-slave-01:5432,replica-02=replica@db-slave-02")
+        container = Container(read_router_config=read_router_config, engine_registry_config=engine_registry_config)
+
+        # Assert
+        try:
+            replicas = container.read_router.replicas
+            assert [replica.name for replica in replicas] == ["replica-01", "replica-02"]
+            assert [replica.engine.url.host for replica in replicas] == ["db-slave-01", "db-slave-02"]
+            assert [endpoint.name for endpoint in container.engine_registry.endpoints(REPLICA)] == [
+                "replica-01", "replica-02"]
+            assert container.get_patient_repo._get_patient_repo._read_router is container.read_router
+        finally:
+            asyncio.run(container.shutdown())
+
+    def test_engine_registry_endpoints(self):
+        """Test that the configured endpoints replace the primary and the replica load balancer."""
+
+        # Arrange
+        engine_registry_config = EngineRegistryConfig()
+        engine_registry_config.endpoints = parse_endpoints(
+            "primary=primary@db-main:5432,replica-01=replica@db-slave-01:5432,replica-02=replica@db-slave-02:5432")
+        container = Container(engine_registry_config=engine_registry_config)
+
+        # Act
+        search_repo = container.search_patient_repo
+        hosts = [search_repo._get_engine().url.host for _ in range(2)]
+
+        # Assert
+        try:
+            assert container.engine.url.host == "db-main"
+            assert container.slave_engine.url.host == "db-slave-01"
+            assert sorted(hosts) == ["db-slave-01", "db-slave-02"]
+            assert {pool.logging_name for pool in container._pools()} >= {"primary", "replica-01", "replica-02"}
+        finally:
+            asyncio.run(container.shutdown())
+
+    def test_outbox_relay_writes_to_the_dr_endpoints(self):
+        """Test that outbox rows are only written with the relay on, which delivers to the writable dr endpoint."""
+
+        # Arrange
+        outbox_relay_config = PatientRegisterOutboxRelayConfig()
+        outbox_relay_config.enabled = True
+        engine_registry_config = EngineRegistryConfig()
+        engine_registry_config.endpoints = parse_endpoints(
+            "primary=primary@db-main:5432,replica=replica@db-load-balancer:5432,dr=dr@db-dr:5432")
+        container = Container(outbox_relay_config=outbox_relay_config, engine_registry_config=engine_registry_config)
+
+        # Assert
+        try:
+            assert self.container.create_patient_repo._outbox is False
+            assert container.create_patient_repo._outbox is True
+            assert container.create_patient_repo_async._outbox is True
+            assert [repo._engine.url.host for repo in container.patient_register_outbox_relay._targets] == ["db-dr"]
+        finally:
+            asyncio.run(container.shutdown())
+
+    def test_outbox_relay_needs_a_dr_endpoint(self):
+        """Test that the relay is not pointed at the read-only replicas."""
+
+        # Arrange
+        outbox_relay_config = PatientRegisterOutboxRelayConfig()
+        outbox_relay_config.enabled = True
+
+        # Act / Assert
+        with pytest.raises(ValueError):
+            Container(outbox_relay_config=outbox_relay_config)
+
+    def test_write_coalescing_wraps_the_master_insert(self):
+        """Test that enabling write coalescing puts the coalescing writer behind the master insert handler."""
+
+        # Arrange
+        write_coalescing_config = WriteCoalescingConfig()
+        write_coalescing_config.enabled = True
+        container = Container(write_coalescing_config=write_coalescing_config)
+
+        # Act
+        handlers = container.event_bus._subscribers[PatientRegisterCreatedEvent.event_name()]
+        persist_handler = next(handler for handler in handlers if type(handler).__name__ == "PersistOnDbMasterHandler")
+
+        # Assert
+        try:
+            assert persist_handler._create_patient_repo is container.coalescing_create_patient_repo
+        finally:
+            asyncio.run(container.shutdown())
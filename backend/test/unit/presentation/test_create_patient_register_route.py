@@ -0,0 +1,115 @@
+"""
+Unit tests for the create patient register route
+"""
+
+import asyncio
+
+import httpx
+from fastapi import FastAPI
+
+from src.app.create_patient_register.application.create_patient_register import CreatePatientRegisterUseCase
+from src.app.create_patient_register.application.domain_handlers.persist_on_db_master import PersistOnDbMasterHandler
+from src.app.create_patient_register.domain.events.event_bus import EventBus
+from src.app.create_patient_register.domain.events.patient_register_created_event import PatientRegisterCreatedEvent
+from src.app.shared.infra.cache.idempotency_store import IdempotencyStore
+from src.presentation.dependencies import (
+    get_create_patient_register_use_case,
+    get_idempotency_store,
+    get_read_router
+)
+from src.presentation.routes.create_patient_register import create_patient_register_route
+from test.unit.conftest import InMemoryCreatePatientRepo, build_patient_register_body
+
+
+class TestCreatePatientRegisterRoute:
+    """Instance variables will be initialized in setup_method"""
+
+    def setup_method(self, method):
+        """Setup code before each test."""
+        self.create_patient_repo = InMemoryCreatePatientRepo()
+        event_bus = EventBus()
+        event_bus.subscribe(PersistOnDbMasterHandler(
+            susbscribed_to=PatientRegisterCreatedEvent.event_name(),
+            create_patient_repo=self.create_patient_repo
+        ))
+        use_case = CreatePatientRegisterUseCase(event_bus)
+        idempotency_store = IdempotencyStore(max_keys=10, ttl=60)
+
+        app = FastAPI()
+        app.include_router(create_patient_register_route)
+        app.dependency_overrides[get_create_patient_register_use_case] = lambda: use_case
+        app.dependency_overrides[get_read_router] = lambda: None
+        app.dependency_overrides[get_idempotency_store] = lambda: idempotency_store
+        self.app = app
+
+    def post(self, body: dict, headers: dict = None) -> httpx.Response:
+        """Send a create request through the app."""
+
+        async def send():
+            transport = httpx.ASGITransport(app=self.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                return await client.post("/patient-register", json=body, headers=headers)
+        return asyncio.run(send())
+
+    def test_retry_with_idempotency_key_is_replayed_without_a_write(self):
+        """Test that the second request with the same key gets the first response and no insert."""
+
+        # Arrange
+        body = build_patient_register_body()
+        headers = {"Idempotency-Key": "retry-1"}
+
+        # Act
+        first = self.post(body, headers=headers)
+        second = self.post(body, headers=headers)
+
+        # Assert
+        assert first.status_code == second.status_code == 200
+        assert first.headers["Idempotent-Replayed"] == "false"
+        assert second.headers["Idempotent-Replayed"] == "true"
+        assert second.json() == first.json()
+        assert len(self.create_patient_repo.calls) == 1
+
+    def test_retry_without_key_is_reported_as_already_created(self):
+        """Test that a re-sent uuid is not inserted twice and is told apart from a new insert."""
+
+        # Arrange
+        body = build_patient_register_body()
+
+        # Act
+        self.post(body)
+        retry = self.post(body)
+
+        # Assert
+        assert retry.status_code == 200
+        assert retry.headers["Idempotent-Replayed"] == "true"
+        assert retry.json()["message"] == "Patient register already created"
+        assert len(self.create_patient_repo.created) == 1
+
+    def test_uuid_reused_with_another_body_is_a_conflict(self):
+        """Test that another record under a stored uuid is rejected instead of echoed as created."""
+
+        # Arrange
+        body = build_patient_register_body()
+        self.post(body)
+
+        # Act
+        response = self.post({**body, "first_name": "Mallory"})
+
+        # Assert
+        assert response.status_code == 409
+        assert response.json()["data"] == {"uuid": body["uuid"]}
+        assert self.create_patient_repo.created[body["uuid"]]["first_name"] == "Jane"
+
+    def test_idempotency_key_reused_with_another_body_is_rejected(self):
+        """Test that a key cannot replay the response of a different request."""
+
+        # Arrange
+        headers = {"Idempotency-Key": "retry-1"}
+        self.post(build_patient_register_body(), headers=headers)
+
+        # Act
+        response = self.post(build_patient_register_body(), headers=headers)
+
+        # Assert
+        assert response.status_code == 400
+        assert len(self.create_patient_repo.created) == 1
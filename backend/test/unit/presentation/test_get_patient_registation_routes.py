@@ -0,0 +1,141 @@
+"""
+Unit tests for the get patient registration routes
+"""
+
+import asyncio
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from src.app.create_patient_register.domain.repos.export_patient_repo import ExportPatientRepo
+from src.app.create_patient_register.domain.repos.get_patient_repo import GetPatientRepo
+from src.app.get_patient_registation.application.export_patient_registers_use_case import ExportPatientRegistersUseCase
+from src.app.get_patient_registation.application.get_patient_registation_use_case import GetPatientRegistationUseCase
+from src.app.shared.domain.criteria.criteria import CriteriaParser
+from src.presentation.dependencies import (
+    get_criteria_parser,
+    get_export_patient_registers_use_case,
+    get_get_patient_registation_use_case
+)
+from src.presentation.routes.get_patient_registation_routes import get_patient_registation_route
+
+
+class RecordingGetPatientRepo(GetPatientRepo):
+    """Repository returning no rows and recording the criteria it was called with."""
+
+    def __init__(self):
+        self.calls = []
+
+    def get(self, criteria):
+        self.calls.append(criteria)
+        return []
+
+
+class FailingExportPatientRepo(ExportPatientRepo):
+    """Repository yielding some rows, then losing the connection."""
+
+    def __init__(self, records: list[dict], fail_after: int):
+        self.records = records
+        self.fail_after = fail_after
+        self.calls = 0
+
+    def stream(self, criteria):
+        self.calls += 1
+        for index, record in enumerate(self.records):
+            if index == self.fail_after:
+                raise RuntimeError("connection lost")
+            yield record
+
+
+class TestGetPatientRegistationRoutes:
+    """Instance variables will be initialized in setup_method"""
+
+    def setup_method(self, method):
+        """Setup code before each test."""
+        self.get_patient_repo = RecordingGetPatientRepo()
+        use_case = GetPatientRegistationUseCase(self.get_patient_repo)
+        self.export_patient_repo = FailingExportPatientRepo([{"uuid": str(index)} for index in range(3)], fail_after=2)
+        export_use_case = ExportPatientRegistersUseCase(self.export_patient_repo, chunk_size=1)
+
+        app = FastAPI()
+        app.include_router(get_patient_registation_route)
+        app.dependency_overrides[get_criteria_parser] = CriteriaParser
+        app.dependency_overrides[get_get_patient_registation_use_case] = lambda: use_case
+        app.dependency_overrides[get_export_patient_registers_use_case] = lambda: export_use_case
+        self.app = app
+
+    def get(self, path: str, params: dict) -> httpx.Response:
+        """Send a GET request through the app."""
+
+        async def send():
+            transport = httpx.ASGITransport(app=self.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                return await client.get(path, params=params)
+        return asyncio.run(send())
+
+    def test_between_with_one_bound_is_a_bad_request(self):
+        """Test that a wrong operand count is rejected before the repository is queried."""
+
+        # Act
+        response = self.get("/patient-register", {
+            "0_field": "date_of_birth", "0_operator": "BETWEEN", "0_value": "1980-01-01",
+        })
+
+        # Assert
+        assert response.status_code == 400
+        assert "BETWEEN" in response.json()["message"]
+        assert self.get_patient_repo.calls == []
+
+    def test_unknown_operator_is_a_bad_request(self):
+        """Test that an operator the SQL does not know is not read as EQUAL."""
+
+        # Act
+        response = self.get("/patient-register", {
+            "0_field": "first_name", "0_operator": "LIKE", "0_value": "Ada",
+        })
+
+        # Assert
+        assert response.status_code == 400
+        assert self.get_patient_repo.calls == []
+
+    def test_array_operator_on_a_text_column_is_a_bad_request(self):
+        """Test that a filter the column type does not support is a 400, not an empty page."""
+
+        # Act
+        response = self.get("/patient-register", {
+            "0_field": "first_name", "0_operator": "CONTAINS_ALL", "0_value": "Ada",
+        })
+
+        # Assert
+        assert response.status_code == 400
+        assert self.get_patient_repo.calls == []
+
+    def test_page_which_is_not_a_number_is_a_bad_request(self):
+        """Test that a malformed page is a 400 instead of an unhandled ValueError."""
+
+        # Act
+        response = self.get("/patient-register", {"page": "abc"})
+
+        # Assert
+        assert response.status_code == 400
+        assert self.get_patient_repo.calls == []
+
+    def test_export_with_an_unknown_field_is_a_bad_request(self):
+        """Test that invalid filters get a 400 before the stream starts."""
+
+        # Act
+        response = self.get("/patient-register/export", {
+            "0_field": "password", "0_operator": "EQUAL", "0_value": "x",
+        })
+
+        # Assert
+        assert response.status_code == 400
+        assert self.export_patient_repo.calls == 0
+
+    def test_export_failing_mid_stream_does_not_end_cleanly(self):
+        """Test that a repository error aborts the response instead of ending it as complete."""
+
+        # Act / Assert
+        with pytest.raises(RuntimeError):
+            self.get("/patient-register/export", {})
@@ -0,0 +1,66 @@
+"""
+Unit tests for FastJSONResponse
+"""
+
+import json
+
+from src.app.shared.domain.models.custom_response import CustomResponse
+from src.presentation import responses
+from src.presentation.responses import FastJSONResponse
+
+
+PAGE = [
+    {
+        "uuid": "dbd13f36-c8a6-4398-8056-9560dbe0a917",
+        "first_name": "José",
+        "last_name": "Núñez",
+        "date_of_birth": "1990-05-15",
+        "allergies": ["penicillin"],
+        "medical_history": [],
+    }
+]
+
+
+class TestFastJSONResponse:
+    """Tests for the response rendered by the native encoder"""
+
+    def test_from_custom_response_keeps_status_and_content(self):
+        """Test that the body decodes to the same content the stock JSONResponse sends."""
+
+        # Arrange
+        response = CustomResponse.error(msg="Data validation error", data={"first_name": "required"})
+
+        # Act
+        http_response = FastJSONResponse.from_custom_response(response, headers={"X-Session-LSN": "0/1"})
+
+        # Assert
+        assert http_response.status_code == 400
+        assert http_response.media_type == "application/json"
+        assert http_response.headers["X-Session-LSN"] == "0/1"
+        assert json.loads(http_response.body) == {
+            "message": "Data validation error",
+            "is_success": False,
+            "data": {"first_name": "required"},
+        }
+
+    def test_render_is_compact_utf8(self):
+        """Test that non-ASCII values are sent as UTF-8 without separators padding."""
+
+        # Act
+        body = FastJSONResponse(content={"data": PAGE}).body
+
+        # Assert
+        assert body == json.dumps({"data": PAGE}, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    def test_render_without_orjson(self, monkeypatch):
+        """Test that pydantic-core encodes the same bytes when orjson is missing."""
+
+        # Arrange
+        expected = FastJSONResponse(content={"data": PAGE}).body
+        monkeypatch.setattr(responses, "orjson", None)
+
+        # Act
+        body = FastJSONResponse(content={"data": PAGE}).body
+
+        # Assert
+        assert body == expected
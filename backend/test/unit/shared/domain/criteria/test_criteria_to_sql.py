@@ -0,0 +1,381 @@
+
+"""
+Unit tests for CriteriaParser and CriteriaToSQL
+"""
+
+import pytest
+
+from src.app.shared.domain.criteria.criteria import (
+    MAX_PER_PAGE,
+    Criteria,
+    CriteriaError,
+    CriteriaParser,
+    Cursor,
+    CursorPagination,
+    Filter,
+    Order
+)
+from src.app.shared.domain.criteria.criteria_to_sql import CriteriaToSQL
+
+
+def build_select_query(query_params: dict) -> tuple[str, dict]:
+    """Parse the query params and build the parametrized SELECT."""
+    criteria = CriteriaParser().dict_to_criteria(query_params)
+    criteria_to_sql = CriteriaToSQL()
+    criteria_to_sql.set_table_name("patientregister")
+    criteria_to_sql.set_where_by_criteria(criteria)
+    criteria_to_sql.set_order_by_criteria(criteria)
+    criteria_to_sql.set_pagination_by_criteria(criteria)
+    return criteria_to_sql.get_select_query_parametrized()
+
+
+class TestCriteriaToSQL:
+    """Tests for the SQL built from criteria"""
+
+    def test_offset_pagination(self):
+        """Test that page/per_page keep the LIMIT/OFFSET pagination."""
+
+        # Act
+        sql_query, params = build_select_query({"page": "3", "per_page": "20"})
+
+        # Assert
+        assert sql_query == "SELECT * FROM patientregister LIMIT 20 OFFSET 40"
+        assert params == {}
+
+    def test_cursor_pagination_first_page(self):
+        """Test that an empty cursor starts keyset pagination without a seek predicate."""
+
+        # Act
+        sql_query, params = build_select_query({"cursor": "", "per_page": "20", "orderBy": "last_name", "order": "ASC"})
+
+        # Assert
+        assert sql_query == "SELECT * FROM patientregister ORDER BY last_name ASC, uuid ASC LIMIT 20"
+        assert params == {}
+
+    def test_cursor_pagination_seek(self):
+        """Test that a cursor becomes a row comparison after the filters and no OFFSET."""
+
+        # Arrange
+        cursor = Cursor.encode(["Lee"], "dbd13f36-c8a6-4398-8056-9560dbe0a917")
+
+        # Act
+        sql_query, params = build_select_query({
+            "cursor": cursor,
+            "per_page": "20",
+            "orderBy": "last_name",
+            "order": "DESC",
+            "0_field": "first_name",
+            "0_operator": "EQUAL",
+            "0_value": "Paula",
+        })
+
+        # Assert
+        assert sql_query == (
+            "SELECT * FROM patientregister"
+            " WHERE first_name = :where_param_1"
+            " AND (last_name, uuid) < (:cursor_param_1, CAST(:cursor_param_2 AS UUID))"
+            " ORDER BY last_name DESC, uuid DESC LIMIT 20"
+        )
+        assert params == {
+            "where_param_1": "Paula",
+            "cursor_param_1": "Lee",
+            "cursor_param_2": "dbd13f36-c8a6-4398-8056-9560dbe0a917",
+        }
+        assert "OFFSET" not in sql_query
+
+    def test_malformed_cursor_starts_from_first_page(self):
+        """Test that a tampered cursor is ignored instead of failing the query."""
+
+        # Act
+        sql_query, params = build_select_query({"cursor": "not-a-cursor", "per_page": "5"})
+
+        # Assert
+        assert sql_query == "SELECT * FROM patientregister ORDER BY uuid ASC LIMIT 5"
+        assert params == {}
+
+    def test_contains_binds_an_escaped_substring_pattern(self):
+        """Test that CONTAINS becomes ILIKE on the value with its wildcards escaped."""
+
+        # Act
+        sql_query, params = build_select_query({"0_field": "email", "0_operator": "CONTAINS", "0_value": "a_b%c"})
+
+        # Assert
+        assert sql_query == "SELECT * FROM patientregister WHERE email ILIKE :where_param_1 LIMIT 10 OFFSET 0"
+        assert params == {"where_param_1": "%a\\_b\\%c%"}
+
+    def test_ilike_and_similar_bind_the_value_as_is(self):
+        """Test that ILIKE keeps the client's pattern and SIMILAR uses the pg_trgm operator."""
+
+        # Act
+        sql_query, params = build_select_query({
+            "0_field": "last_name", "0_operator": "ILIKE", "0_value": "lo%",
+            "1_field": "first_name", "1_operator": "SIMILAR", "1_value": "Adda",
+        })
+
+        # Assert
+        assert sql_query == (
+            "SELECT * FROM patientregister"
+            " WHERE last_name ILIKE :where_param_1 AND first_name % :where_param_2 LIMIT 10 OFFSET 0"
+        )
+        assert params == {"where_param_1": "lo%", "where_param_2": "Adda"}
+
+    def test_in_binds_one_parameter_per_value(self):
+        """Test that IN splits the comma separated value into one typed parameter each."""
+
+        # Act
+        sql_query, params = build_select_query({"0_field": "last_name", "0_operator": "IN", "0_value": "Lee, Torres"})
+
+        # Assert
+        assert sql_query == (
+            "SELECT * FROM patientregister"
+            " WHERE last_name IN (:where_param_1_1, :where_param_1_2) LIMIT 10 OFFSET 0"
+        )
+        assert params == {"where_param_1_1": "Lee", "where_param_1_2": "Torres"}
+
+    def test_between_binds_both_bounds(self):
+        """Test that BETWEEN binds the two comma separated bounds."""
+
+        # Act
+        sql_query, params = build_select_query({
+            "0_field": "date_of_birth", "0_operator": "BETWEEN", "0_value": "1980-01-01,1989-12-31",
+        })
+
+        # Assert
+        assert sql_query == (
+            "SELECT * FROM patientregister"
+            " WHERE date_of_birth BETWEEN :where_param_1_1 AND :where_param_1_2 LIMIT 10 OFFSET 0"
+        )
+        assert params == {"where_param_1_1": "1980-01-01", "where_param_1_2": "1989-12-31"}
+
+    def test_between_requires_two_bounds(self):
+        """Test that BETWEEN with a single bound is rejected."""
+
+        # Act / Assert
+        with pytest.raises(CriteriaError):
+            build_select_query({"0_field": "date_of_birth", "0_operator": "BETWEEN", "0_value": "1980-01-01"})
+
+    @pytest.mark.parametrize("field, operator", [
+        ("last_name", "IN"),
+        ("allergies", "CONTAINS_ANY"),
+        ("allergies", "CONTAINS_ALL"),
+    ])
+    def test_list_operators_require_a_value(self, field, operator):
+        """Test that a list operator with no value is rejected instead of matching nothing."""
+
+        # Act / Assert
+        with pytest.raises(CriteriaError):
+            build_select_query({"0_field": field, "0_operator": operator, "0_value": " , "})
+
+    @pytest.mark.parametrize("field, operator, value", [
+        ("first_name", "CONTAINS_ALL", "Ada"),
+        ("date_of_birth", "CONTAINS_ANY", "1990-05-15"),
+        ("uuid", "CONTAINS_ANY", "dbd13f36-c8a6-4398-8056-9560dbe0a917"),
+        ("allergies", "IN", "penicillin,latex"),
+        ("medical_history", "BETWEEN", "asthma,hypertension"),
+        ("current_medications", "EQUAL", "warfarin"),
+        ("allergies", "LESS_THAN", "penicillin"),
+    ])
+    def test_operators_not_applying_to_the_column_type_are_rejected(self, field, operator, value):
+        """Test that array operators only apply to the TEXT[] columns and only they apply there."""
+
+        # Act / Assert
+        with pytest.raises(CriteriaError):
+            build_select_query({"0_field": field, "0_operator": operator, "0_value": value})
+
+    @pytest.mark.parametrize("field, operator", [
+        ("allergies", "CONTAINS"),
+        ("date_of_birth", "SIMILAR"),
+        ("uuid", "ILIKE"),
+        ("address", "CONTAINS"),
+        ("emergency_contact", "SIMILAR"),
+    ])
+    def test_text_operators_only_apply_to_the_trigram_indexed_columns(self, field, operator):
+        """Test that CONTAINS / ILIKE / SIMILAR are rejected outside first_name, last_name, email and phone_number."""
+
+        # Act / Assert
+        with pytest.raises(CriteriaError):
+            build_select_query({"0_field": field, "0_operator": operator, "0_value": "x"})
+
+    @pytest.mark.parametrize("field", ["allergies", "address", "email"])
+    def test_order_by_a_column_without_keyset_index_is_rejected(self, field):
+        """Test that only uuid, first_name, last_name and date_of_birth can be ordered by."""
+
+        # Act / Assert
+        with pytest.raises(CriteriaError):
+            build_select_query({"orderBy": field, "order": "ASC", "cursor": ""})
+
+    @pytest.mark.parametrize("query_params", [{"page": "abc"}, {"per_page": "1.5"}, {"per_page": "ten", "cursor": ""}])
+    def test_non_integer_pages_are_rejected(self, query_params):
+        """Test that page and per_page which are not integers are a CriteriaError, not a ValueError."""
+
+        # Act / Assert
+        with pytest.raises(CriteriaError):
+            build_select_query(query_params)
+
+    def test_per_page_is_bounded(self):
+        """Test that a page larger than MAX_PER_PAGE is rejected instead of becoming an unbounded LIMIT."""
+
+        # Act
+        sql_query, _ = build_select_query({"cursor": "", "per_page": str(MAX_PER_PAGE)})
+
+        # Assert
+        assert sql_query.endswith(f"LIMIT {MAX_PER_PAGE}")
+        with pytest.raises(CriteriaError):
+            build_select_query({"cursor": "", "per_page": "100000000"})
+
+    def test_sql_builder_rejects_operators_not_applying_to_the_column_type(self):
+        """Test that criteria built without the parser cannot compare a text column with an array."""
+
+        # Arrange
+        criteria = Criteria()
+        criteria.add_filter(Filter(field="first_name", operator="CONTAINS_ALL", value="Ada"))
+
+        # Act / Assert
+        with pytest.raises(ValueError):
+            CriteriaToSQL().set_where_by_criteria(criteria)
+
+    @pytest.mark.parametrize("query_params", [
+        {"orderBy": "last_name; DROP TABLE patientregister", "order": "ASC"},
+        {"orderBy": "last_name", "order": "ASC, (SELECT 1)"},
+        {"0_field": "1=1 OR last_name", "0_operator": "EQUAL", "0_value": "x"},
+    ])
+    def test_unknown_fields_and_directions_are_rejected(self, query_params):
+        """Test that order and filter fields and the direction, written into the SQL, are whitelisted."""
+
+        # Act / Assert
+        with pytest.raises(CriteriaError):
+            build_select_query({"cursor": "", **query_params})
+
+    def test_order_direction_is_case_insensitive(self):
+        """Test that a lowercase direction is normalised."""
+
+        # Act
+        sql_query, _ = build_select_query({"orderBy": "last_name", "order": "desc"})
+
+        # Assert
+        assert sql_query == "SELECT * FROM patientregister ORDER BY last_name DESC LIMIT 10 OFFSET 0"
+
+    def test_sql_builder_rejects_unknown_fields(self):
+        """Test that criteria built without the parser cannot put a raw field into the SQL."""
+
+        # Arrange
+        criteria = Criteria()
+        criteria.set_orders(Order(field="(SELECT 1)", direction="ASC"))
+        criteria.set_pagination(CursorPagination(per_page=10))
+
+        # Act / Assert
+        with pytest.raises(ValueError):
+            CriteriaToSQL().set_order_by_criteria(criteria)
+
+    def test_unknown_operator_is_rejected(self):
+        """Test that an unknown operator is not read as EQUAL."""
+
+        # Act / Assert
+        with pytest.raises(CriteriaError):
+            build_select_query({"0_field": "first_name", "0_operator": "LIKE", "0_value": "Ada"})
+
+    def test_array_operators_bind_a_text_array(self):
+        """Test that CONTAINS_ANY / CONTAINS_ALL compare the array column with one TEXT[] parameter."""
+
+        # Act
+        sql_query, params = build_select_query({
+            "0_field": "allergies", "0_operator": "CONTAINS_ANY", "0_value": "penicillin",
+            "1_field": "current_medications", "1_operator": "CONTAINS_ALL", "1_value": "warfarin,aspirin",
+        })
+
+        # Assert
+        assert sql_query == (
+            "SELECT * FROM patientregister"
+            " WHERE allergies && CAST(:where_param_1 AS TEXT[])"
+            " AND current_medications @> CAST(:where_param_2 AS TEXT[]) LIMIT 10 OFFSET 0"
+        )
+        assert params == {"where_param_1": ["penicillin"], "where_param_2": ["warfarin", "aspirin"]}
+
+    def test_lookahead_fetches_one_row_past_the_page(self):
+        """Test that the lookahead row is added to the LIMIT but not to the OFFSET."""
+
+        # Arrange
+        criteria = CriteriaParser().dict_to_criteria({"page": "3", "per_page": "20"})
+        criteria_to_sql = CriteriaToSQL()
+        criteria_to_sql.set_table_name("patientregister")
+
+        # Act
+        criteria_to_sql.set_pagination_by_criteria(criteria, lookahead=1)
+        sql_query, _ = criteria_to_sql.get_select_query_parametrized()
+
+        # Assert
+        assert sql_query == "SELECT * FROM patientregister LIMIT 21 OFFSET 40"
+
+    def test_count_query_ignores_order_and_pagination(self):
+        """Test that the count keeps the filters only, bounded when max_rows is given."""
+
+        # Arrange
+        criteria = CriteriaParser().dict_to_criteria({
+            "0_field": "last_name", "0_operator": "EQUAL", "0_value": "Lee",
+            "orderBy": "first_name", "order": "ASC", "page": "2", "per_page": "20",
+        })
+        criteria_to_sql = CriteriaToSQL()
+        criteria_to_sql.set_table_name("patientregister")
+        criteria_to_sql.set_where_by_criteria(criteria)
+
+        # Act
+        count_query, params = criteria_to_sql.get_count_query_parametrized()
+        bounded_query, _ = criteria_to_sql.get_count_query_parametrized(max_rows=1001)
+
+        # Assert
+        assert count_query == "SELECT count(*) FROM patientregister WHERE last_name = :where_param_1"
+        assert bounded_query == (
+            "SELECT count(*) FROM (SELECT 1 FROM patientregister WHERE last_name = :where_param_1 LIMIT 1001) AS bounded"
+        )
+        assert params == {"where_param_1": "Lee"}
+
+    def test_fields_select_whitelisted_columns_only(self):
+        """Test that fields= selects the known columns in table order, with uuid and without unknown names."""
+
+        # Arrange
+        criteria = CriteriaParser().dict_to_criteria({"fields": "last_name, date_of_birth,first_name,password"})
+        criteria_to_sql = CriteriaToSQL()
+        criteria_to_sql.set_table_name("patientregister")
+
+        # Act
+        criteria_to_sql.set_fields_by_criteria(criteria)
+        sql_query, _ = criteria_to_sql.get_select_query_parametrized()
+
+        # Assert
+        assert criteria.fields == ["uuid", "first_name", "last_name", "date_of_birth"]
+        assert sql_query == "SELECT uuid, first_name, last_name, date_of_birth FROM patientregister"
+
+    def test_fields_keep_the_cursor_sort_column(self):
+        """Test that keyset pagination selects the sort column the next cursor is encoded from."""
+
+        # Arrange
+        criteria = CriteriaParser().dict_to_criteria({
+            "fields": "first_name", "orderBy": "date_of_birth", "order": "ASC", "cursor": "",
+        })
+        criteria_to_sql = CriteriaToSQL()
+        criteria_to_sql.set_table_name("patientregister")
+
+        # Act
+        criteria_to_sql.set_fields_by_criteria(criteria)
+        sql_query, _ = criteria_to_sql.get_select_query_parametrized()
+
+        # Assert
+        assert sql_query == "SELECT uuid, first_name, date_of_birth FROM patientregister"
+
+    def test_partition_key_values_are_typed_as_uuid(self):
+        """Test that uuid comparisons cast the parameter, so the hash partitions are pruned."""
+
+        # Act
+        sql_query, params = build_select_query({
+            "0_field": "uuid", "0_operator": "EQUAL", "0_value": "dbd13f36-c8a6-4398-8056-9560dbe0a917",
+            "1_field": "uuid", "1_operator": "IN",
+            "1_value": "dbd13f36-c8a6-4398-8056-9560dbe0a917,0b6a3f0e-9a8e-4d8b-8f1e-2d4f3c1b5a6e",
+        })
+
+        # Assert
+        assert sql_query == (
+            "SELECT * FROM patientregister"
+            " WHERE uuid = CAST(:where_param_1 AS UUID)"
+            " AND uuid IN (CAST(:where_param_2_1 AS UUID), CAST(:where_param_2_2 AS UUID)) LIMIT 10 OFFSET 0"
+        )
+        assert params["where_param_1"] == "dbd13f36-c8a6-4398-8056-9560dbe0a917"
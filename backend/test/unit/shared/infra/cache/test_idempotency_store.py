@@ -0,0 +1,58 @@
+"""
+Unit tests for IdempotencyStore
+"""
+
+import time
+
+from src.app.shared.infra.cache.idempotency_store import IdempotencyStore, StoredResponse
+
+
+def build_stored_response(fingerprint: str = "body-hash") -> StoredResponse:
+    """Build a stored create response."""
+    return StoredResponse(fingerprint=fingerprint, status_code=200, content={"is_success": True}, headers={})
+
+
+class TestIdempotencyStore:
+    """Tests for the bounded recent keys store"""
+
+    def test_get_returns_the_stored_response(self):
+        """Test that a stored key is found and an unknown one is not."""
+
+        # Arrange
+        store = IdempotencyStore(max_keys=10, ttl=60)
+        store.put("key-1", build_stored_response())
+
+        # Act / Assert
+        assert store.get("key-1") == build_stored_response()
+        assert store.get("key-2") is None
+
+    def test_least_recently_used_keys_are_evicted(self):
+        """Test that the store never holds more than max_keys keys."""
+
+        # Arrange
+        store = IdempotencyStore(max_keys=2, ttl=60)
+        store.put("key-1", build_stored_response())
+        store.put("key-2", build_stored_response())
+
+        # Act -> key-1 is used again, key-2 becomes the oldest
+        store.get("key-1")
+        store.put("key-3", build_stored_response())
+
+        # Assert
+        assert len(store) == 2
+        assert store.get("key-2") is None
+        assert store.get("key-1") is not None
+
+    def test_expired_keys_are_forgotten(self):
+        """Test that a key is not replayed after its ttl."""
+
+        # Arrange
+        store = IdempotencyStore(max_keys=10, ttl=0.01)
+        store.put("key-1", build_stored_response())
+
+        # Act
+        time.sleep(0.02)
+
+        # Assert
+        assert store.get("key-1") is None
+        assert len(store) == 0
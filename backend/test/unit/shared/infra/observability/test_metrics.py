@@ -0,0 +1,96 @@
+"""
+Unit tests for the metrics registry and instrumentation
+"""
+
+import asyncio
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from src.app.create_patient_register.domain.events.event_bus import EventBus
+from src.app.shared.domain.criteria.criteria import CriteriaParser
+from src.app.shared.domain.events.domain_event_handler import DomainEventHandler
+from src.app.shared.infra.observability.metrics import MetricsRegistry, criteria_shape, http_request_duration_seconds
+from src.presentation.metrics_middleware import MetricsMiddleware
+
+
+class FailingHandler(DomainEventHandler):
+
+    def handle(self, event) -> None:
+        raise RuntimeError("boom")
+
+
+class FakeEvent:
+    domain_name = "fake.event"
+
+
+class TestMetricsRegistry:
+
+    def test_histogram_renders_cumulative_buckets(self):
+        registry = MetricsRegistry()
+        histogram = registry.histogram("latency_seconds", "Latency.", ("route",), buckets=(0.1, 1.0))
+
+        histogram.observe(0.05, "/a")
+        histogram.observe(0.5, "/a")
+        histogram.observe(5, "/a")
+
+        rendered = registry.render()
+        assert 'latency_seconds_bucket{route="/a",le="0.1"} 1' in rendered
+        assert 'latency_seconds_bucket{route="/a",le="1.0"} 2' in rendered
+        assert 'latency_seconds_bucket{route="/a",le="+Inf"} 3' in rendered
+        assert 'latency_seconds_count{route="/a"} 3' in rendered
+
+    def test_failing_callback_does_not_hide_other_metrics(self):
+        registry = MetricsRegistry()
+        registry.counter("requests_total", "Requests.").inc()
+        registry.callback("broken", "Broken.", (), lambda: 1 / 0)
+
+        rendered = registry.render()
+
+        assert "requests_total 1" in rendered
+        assert "# broken unavailable" in rendered
+
+    def test_criteria_shape_has_no_values_and_bounded_fields(self):
+        criteria = CriteriaParser().dict_to_criteria({
+            "0_field": "last_name", "0_operator": "EQUAL", "0_value": "Lovelace",
+            "1_field": "first_name", "1_operator": "EQUAL", "1_value": "Ada",
+        })
+
+        shape = criteria_shape(criteria, {"last_name"})
+
+        assert shape == "filters=last_name:EQUAL,other:EQUAL;order=-;pagination=offset"
+
+    def test_event_bus_reports_handler_failures_to_observers(self):
+        observed = []
+        event_bus = EventBus()
+        event_bus.subscribe(FailingHandler("fake.event"))
+        event_bus.observe_handlers(lambda handler, duration, failed: observed.append((type(handler).__name__, failed)))
+
+        with pytest.raises(RuntimeError):
+            event_bus.publish("fake.event", FakeEvent())
+
+        assert observed == [("FailingHandler", True)]
+
+
+class TestMetricsMiddleware:
+
+    def test_latency_is_labelled_by_route_template(self):
+        app = FastAPI()
+
+        @app.get("/items/{item_id}")
+        def get_item(item_id: str):
+            return {"item_id": item_id}
+
+        app.add_middleware(MetricsMiddleware)
+
+        async def call():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                await client.get("/items/secret-id")
+
+        asyncio.run(call())
+
+        rendered = "\n".join(http_request_duration_seconds.render())
+        assert 'route="/items/{item_id}",method="GET",status="200"' in rendered
+        assert "secret-id" not in rendered
@@ -0,0 +1,59 @@
+"""
+Unit tests for the structured logging pipeline
+"""
+
+import io
+import json
+import logging
+import queue
+
+from src.app.shared.infra.observability.structured_logging import (
+    DebugSamplingFilter,
+    LoggingConfig,
+    NonBlockingQueueHandler,
+    configure_logging
+)
+
+
+def build_record(level: int = logging.INFO) -> logging.LogRecord:
+    return logging.LogRecord("test", level, __file__, 1, "message %s", ("arg",), None)
+
+
+class TestStructuredLogging:
+
+    def teardown_method(self, method):
+        """Teardown code after each test."""
+        root_logger = logging.getLogger()
+        for handler in list(root_logger.handlers):
+            if isinstance(handler, NonBlockingQueueHandler):
+                root_logger.removeHandler(handler)
+        root_logger.setLevel(logging.WARNING)
+
+    def test_records_are_written_as_json_lines_with_extra_fields(self):
+        stream = io.StringIO()
+        config = LoggingConfig()
+        config.level = "INFO"
+        config.format = "json"
+        listener = configure_logging(config, stream=stream)
+
+        logging.getLogger("test.structured").info("created %s", "record", extra={"aggregate_uuid": "1234"})
+        listener.stop()
+
+        document = json.loads(stream.getvalue().splitlines()[-1])
+        assert document["msg"] == "created record"
+        assert document["level"] == "INFO"
+        assert document["aggregate_uuid"] == "1234"
+
+    def test_full_queue_drops_records_without_blocking(self):
+        handler = NonBlockingQueueHandler(queue.Queue(maxsize=1))
+
+        handler.emit(build_record())
+        handler.emit(build_record())
+
+        assert handler.dropped == 1
+
+    def test_sampling_only_applies_to_debug_records(self):
+        sampling_filter = DebugSamplingFilter(rate=0)
+
+        assert sampling_filter.filter(build_record(logging.DEBUG)) is False
+        assert sampling_filter.filter(build_record(logging.INFO)) is True
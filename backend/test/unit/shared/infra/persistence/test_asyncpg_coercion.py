@@ -0,0 +1,28 @@
+"""
+Unit tests for the asyncpg parameter coercion
+"""
+
+import uuid
+from datetime import date
+
+from src.app.shared.infra.persistence.asyncpg_coercion import coerce_value
+from src.app.shared.infra.persistence.slave_postgres_sql.utils.patient_register_model import PatientRegisterModel
+
+COLUMNS = PatientRegisterModel.__table__.columns
+
+
+class TestCoerceValue:
+
+    def test_coerces_scalars_to_the_column_type(self):
+        # Act / Assert
+        assert coerce_value(COLUMNS["date_of_birth"], "1990-05-15") == date(1990, 5, 15)
+        assert coerce_value(COLUMNS["uuid"], "dbd13f36-c8a6-4398-8056-9560dbe0a917") == uuid.UUID(
+            "dbd13f36-c8a6-4398-8056-9560dbe0a917")
+        assert coerce_value(COLUMNS["last_name"], "Lee") == "Lee"
+
+    def test_keeps_array_parameters_as_lists_of_text(self):
+        # Act
+        value = coerce_value(COLUMNS["allergies"], ["penicillin", "latex"])
+
+        # Assert
+        assert value == ["penicillin", "latex"]
@@ -0,0 +1,136 @@
+"""
+Unit tests for EngineRegistry
+"""
+
+import asyncio
+
+import pytest
+
+from src.app.shared.infra.persistence.engine_registry import (
+    DR,
+    PRIMARY,
+    REPLICA,
+    DatabaseEndpoint,
+    EngineRegistry,
+    _reset_after_fork,
+    parse_endpoints
+)
+
+
+class TestDatabaseEndpoint:
+    """Endpoint settings read from the environment."""
+
+    def test_parse_endpoints(self):
+        endpoints = parse_endpoints("primary=primary@db-main:5432, replica-02=replica@db-slave-02,")
+
+        assert [(endpoint.name, endpoint.role) for endpoint in endpoints] == [
+            ("primary", PRIMARY), ("replica-02", REPLICA)]
+        assert (endpoints[0].host, endpoints[0].port) == ("db-main", "5432")
+        assert (endpoints[1].host, endpoints[1].port) == ("db-slave-02", "5433")
+
+    def test_parse_endpoints_rejects_unknown_roles(self):
+        with pytest.raises(ValueError):
+            parse_endpoints("archive=archive@db-archive:5432")
+
+    def test_pool_settings_per_endpoint(self, monkeypatch):
+        # Arrange
+        monkeypatch.setenv("DB_POOL_SIZE", "5")
+        monkeypatch.setenv("DB_REPLICA_02_POOL_SIZE", "20")
+        monkeypatch.setenv("SLAVE_POSTGRES_USER", "reader")
+
+        # Act
+        replica_01 = DatabaseEndpoint("replica-01", REPLICA)
+        replica_02 = DatabaseEndpoint("replica-02", REPLICA)
+        primary = DatabaseEndpoint("primary", PRIMARY)
+
+        # Assert
+        assert (replica_01.pool_size, replica_02.pool_size) == (5, 20)
+        assert (replica_01.user, replica_02.user) == ("reader", "reader")
+        assert replica_02.pool_name == "replica-02"
+        assert primary.user != "reader"
+
+
+class TestEngineRegistry:
+    """Instance variables will be initialized in setup_method"""
+
+    def setup_method(self, method):
+        """Setup code before each test."""
+        self.registry = EngineRegistry([
+            DatabaseEndpoint("primary", PRIMARY, "db-main", "5432"),
+            DatabaseEndpoint("replica-01", REPLICA, "db-slave-01", "5432"),
+            DatabaseEndpoint("replica-02", REPLICA, "db-slave-02", "5432"),
+        ])
+
+    def teardown_method(self, method):
+        """Teardown code after each test."""
+        asyncio.run(self.registry.dispose())
+
+    def test_engines_are_built_on_first_use(self):
+        # Assert
+        assert self.registry.built_engines() == []
+
+        # Act
+        engine = self.registry.engine("replica-02")
+
+        # Assert
+        assert self.registry.engine("replica-02") is engine
+        assert engine.url.host == "db-slave-02"
+        assert engine.pool.logging_name == "replica-02"
+        assert [endpoint.name for endpoint, _ in self.registry.built_engines()] == ["replica-02"]
+
+    def test_replica_endpoints_are_used_in_turn(self):
+        hosts = [self.registry.engine_for(REPLICA).url.host for _ in range(3)]
+
+        assert hosts == ["db-slave-01", "db-slave-02", "db-slave-01"]
+        assert self.registry.async_engine_for(PRIMARY).url.host == "db-main"
+
+    def test_replica_reads_fall_back_to_the_primary(self):
+        registry = EngineRegistry([DatabaseEndpoint("primary", PRIMARY, "db-main", "5432")])
+
+        assert registry.choose(REPLICA).name == "primary"
+        with pytest.raises(ValueError):
+            registry.choose(DR)
+
+    def test_duplicate_endpoint_names_are_rejected(self):
+        with pytest.raises(ValueError):
+            self.registry.add(DatabaseEndpoint("primary", DR))
+
+    def test_pool_health_reports_the_built_pools(self):
+        # Arrange
+        self.registry.engine("primary")
+        self.registry.async_engine("replica-01")
+
+        # Act
+        health = self.registry.pool_health()
+
+        # Assert
+        assert [(pool.pool, pool.role) for pool in health] == [("primary", PRIMARY), ("replica-01-async", REPLICA)]
+        assert all(pool.checked_out == 0 and not pool.saturated for pool in health)
+        assert health[0].capacity == health[0].size + self.registry.endpoint("primary").max_overflow
+
+    def test_forked_workers_get_new_pools(self):
+        # Arrange
+        engine = self.registry.engine("primary")
+        async_engine = self.registry.async_engine("primary")
+        pools = (engine.pool, async_engine.sync_engine.pool)
+
+        # Act
+        _reset_after_fork()
+
+        # Assert
+        assert engine.pool is not pools[0]
+        assert async_engine.sync_engine.pool is not pools[1]
+        assert engine.pool.logging_name == "primary"
+
+    def test_warm_up_skips_unreachable_endpoints(self):
+        # Arrange
+        registry = EngineRegistry([DatabaseEndpoint("primary", PRIMARY, "127.0.0.1", "1")])
+        registry.engine("primary")
+        registry.async_engine("primary")
+
+        # Act
+        asyncio.run(registry.warm_up())
+
+        # Assert
+        assert [pool.checked_out for pool in registry.pool_health()] == [0, 0]
+        asyncio.run(registry.dispose())
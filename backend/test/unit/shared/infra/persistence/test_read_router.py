@@ -0,0 +1,63 @@
+"""
+Unit tests for ReadRouter
+"""
+
+from src.app.shared.infra.persistence.read_router import (
+    ReadRouter,
+    ReadTarget,
+    format_lsn,
+    parse_lsn,
+    parse_session_lsn
+)
+
+
+class FakeReadTarget(ReadTarget):
+    """Read target without engines, reporting a fixed load."""
+
+    def __init__(self, name: str, lsn: int = None, load: int = 0):
+        super().__init__(name, engine=None, async_engine=None)
+        self.lsn = lsn
+        self.load = load
+
+    def in_use(self) -> int:
+        return self.load
+
+
+class TestReadRouter:
+    """Instance variables will be initialized in setup_method"""
+
+    def setup_method(self, method):
+        """Setup code before each test."""
+        self.primary = FakeReadTarget("primary", lsn=1000)
+        self.replica_01 = FakeReadTarget("replica-01", lsn=990, load=3)
+        self.replica_02 = FakeReadTarget("replica-02", lsn=900, load=1)
+        self.router = ReadRouter(self.primary, [self.replica_01, self.replica_02], max_lag_bytes=50)
+
+    def test_skips_replicas_lagging_past_the_bound(self):
+        assert self.router.choose() is self.replica_01
+
+    def test_picks_the_least_loaded_replica_within_the_bound(self):
+        self.replica_02.lsn = 980
+
+        assert self.router.choose() is self.replica_02
+
+    def test_session_lsn_requires_a_caught_up_replica(self):
+        assert self.router.choose(min_lsn=990) is self.replica_01
+        assert self.router.choose(min_lsn=1000) is self.primary
+
+    def test_unreachable_replicas_fall_back_to_the_primary(self):
+        self.replica_01.lsn = None
+        self.replica_02.lsn = None
+
+        assert self.router.choose() is self.primary
+
+
+class TestLsn:
+
+    def test_round_trip(self):
+        assert format_lsn(parse_lsn("16/B374D848")) == "16/B374D848"
+        assert parse_lsn("1/0") - parse_lsn("0/FFFFFFFF") == 1
+
+    def test_malformed_session_lsn_is_ignored(self):
+        assert parse_session_lsn("not-an-lsn") is None
+        assert parse_session_lsn(None) is None
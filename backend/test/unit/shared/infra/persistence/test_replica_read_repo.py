@@ -0,0 +1,56 @@
+"""
+Unit tests for the engine selection of the replica read repositories
+"""
+
+import asyncio
+
+from src.app.get_patient_registation.infra.persistence.slave_db.export_patient_postgress import ExportPatientPostgress
+from src.app.shared.infra.persistence.engine_registry import PRIMARY, REPLICA, DatabaseEndpoint, EngineRegistry
+from src.app.shared.infra.persistence.read_router import ReadRouter, ReadTarget, session_lsn
+from src.app.shared.infra.persistence.replica_read_repo import ReplicaReadRepo
+
+
+class TestReplicaReadRepo:
+    """Instance variables will be initialized in setup_method"""
+
+    def setup_method(self, method):
+        """Setup code before each test."""
+        self.registry = EngineRegistry([
+            DatabaseEndpoint("primary", PRIMARY, "db-main", "5432"),
+            DatabaseEndpoint("replica-01", REPLICA, "db-slave-01", "5432"),
+            DatabaseEndpoint("replica-02", REPLICA, "db-slave-02", "5432"),
+        ])
+
+    def teardown_method(self, method):
+        """Teardown code after each test."""
+        asyncio.run(self.registry.dispose())
+
+    def test_registry_replicas_are_used_in_turn(self):
+        repo = ReplicaReadRepo(engine_registry=self.registry)
+
+        hosts = [repo._get_engine().url.host for _ in range(3)]
+
+        assert hosts == ["db-slave-01", "db-slave-02", "db-slave-01"]
+        assert repo._get_async_engine().url.host == "db-slave-02"
+
+    def test_router_chooses_for_the_session_lsn(self):
+        # Arrange
+        primary = ReadTarget("primary", self.registry.engine("primary"), self.registry.async_engine("primary"))
+        replica = ReadTarget("replica-01", self.registry.engine("replica-01"), self.registry.async_engine("replica-01"))
+        router = ReadRouter(primary, [replica], max_lag_bytes=0)
+        repo = ReplicaReadRepo(read_router=router, engine_registry=self.registry)
+
+        # Act -> the replica LSN is unknown, a session that wrote must read the primary
+        token = session_lsn.set(100)
+        try:
+            engine = repo._get_engine()
+        finally:
+            session_lsn.reset(token)
+
+        # Assert
+        assert engine is primary.engine
+
+    def test_export_is_routed_like_the_other_reads(self):
+        repo = ExportPatientPostgress(engine_registry=self.registry)
+
+        assert repo._get_engine().url.host == "db-slave-01"
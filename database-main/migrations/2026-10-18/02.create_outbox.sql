@@ -0,0 +1,17 @@
+-- // ─────────────────────────────────────
+-- // ─────────────────────────────────────
+-- Transactional outbox for patient registers
+-- rows are written in the same transaction as the PatientRegister insert
+-- and deleted by the outbox relay once delivered to the replica/DR targets
+-- // ─────────────────────────────────────
+-- // ─────────────────────────────────────
+
+CREATE TABLE PatientRegisterOutbox (
+    id BIGSERIAL PRIMARY KEY,
+    aggregate_uuid UUID NOT NULL,
+    event_name VARCHAR(100) NOT NULL,
+    payload JSONB NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT
+);
@@ -0,0 +1,26 @@
+-- // ─────────────────────────────────────
+-- // ─────────────────────────────────────
+-- Trigram indexes for the fuzzy patient search
+-- GET /patient-register/search matches the full name by word similarity (<%)
+-- and email / phone number by substring (ILIKE '%q%'); both are answered by
+-- pg_trgm GIN indexes instead of a sequential scan.
+-- The full name index is on the same expression the search uses, so the
+-- query must keep (first_name || ' ' || last_name) verbatim to use it.
+-- The CONTAINS / ILIKE / SIMILAR filters of GET /patient-register use the
+-- per-column indexes.
+-- CONCURRENTLY keeps PatientRegister writable while a populated table is
+-- indexed; psql runs each statement outside a transaction, as it requires.
+-- // ─────────────────────────────────────
+-- // ─────────────────────────────────────
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_patient_full_name_trgm ON PatientRegister USING GIN ((first_name || ' ' || last_name) gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_patient_first_name_trgm ON PatientRegister USING GIN (first_name gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_patient_last_name_trgm ON PatientRegister USING GIN (last_name gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_patient_email_trgm ON PatientRegister USING GIN (email gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_patient_phone_number_trgm ON PatientRegister USING GIN (phone_number gin_trgm_ops);
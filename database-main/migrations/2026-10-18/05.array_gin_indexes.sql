@@ -0,0 +1,15 @@
+-- // ─────────────────────────────────────
+-- // ─────────────────────────────────────
+-- GIN indexes on the clinical array columns
+-- clinical safety checks filter with CONTAINS_ANY (allergies && ARRAY[...])
+-- and CONTAINS_ALL (current_medications @> ARRAY[...]);
+-- the default array_ops GIN operator class answers &&, @>, <@ and =
+-- (built CONCURRENTLY, inserts go on during the build)
+-- // ─────────────────────────────────────
+-- // ─────────────────────────────────────
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_patient_allergies_gin ON PatientRegister USING GIN (allergies);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_patient_medical_history_gin ON PatientRegister USING GIN (medical_history);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_patient_current_medications_gin ON PatientRegister USING GIN (current_medications);
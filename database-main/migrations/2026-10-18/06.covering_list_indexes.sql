@@ -0,0 +1,29 @@
+-- // ─────────────────────────────────────
+-- // ─────────────────────────────────────
+-- Keyset pagination and covering indexes for the list view
+-- the API pages with WHERE (sort_col, uuid) > (...) ORDER BY sort_col, uuid LIMIT n
+-- so every sortable column gets a composite index ending on uuid.
+-- GET /patient-register?fields=first_name,last_name,date_of_birth selects
+-- uuid plus those columns only, so the keyset indexes carry them as INCLUDE
+-- columns and a list page is an index-only scan (once VACUUM has marked the
+-- pages all-visible).
+-- Built CONCURRENTLY so a populated PatientRegister stays writable; each
+-- statement runs outside a transaction.
+-- // ─────────────────────────────────────
+-- // ─────────────────────────────────────
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_patient_first_name_uuid_list ON PatientRegister (first_name, uuid) INCLUDE (last_name, date_of_birth);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_patient_last_name_uuid_list ON PatientRegister (last_name, uuid) INCLUDE (first_name, date_of_birth);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_patient_date_of_birth_uuid_list ON PatientRegister (date_of_birth, uuid) INCLUDE (first_name, last_name);
+
+-- ordering by uuid alone (the default keyset order)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_patient_uuid_list ON PatientRegister (uuid) INCLUDE (first_name, last_name, date_of_birth);
+
+-- the plain keyset indexes an earlier version of these migrations built are covered by the ones above
+DROP INDEX CONCURRENTLY IF EXISTS idx_patient_first_name_uuid;
+
+DROP INDEX CONCURRENTLY IF EXISTS idx_patient_last_name_uuid;
+
+DROP INDEX CONCURRENTLY IF EXISTS idx_patient_date_of_birth_uuid;
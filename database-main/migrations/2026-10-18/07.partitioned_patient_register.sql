@@ -0,0 +1,119 @@
+-- // ─────────────────────────────────────
+-- // ─────────────────────────────────────
+-- Hash-partitioned PatientRegister
+-- PatientRegisterPartitioned has the same columns, split in 16 partitions
+-- by HASH (uuid): vacuum, index builds and replica catch-up work on
+-- 1/16 of the table at a time, and a lookup by uuid touches one partition.
+--
+-- Until the swap every write to PatientRegister is mirrored by a trigger.
+-- An empty PatientRegister (a new database) is swapped right away; an
+-- existing one is copied online and swapped by
+--   python -m scripts.backfill_partitioned_patient_register --swap
+-- which leaves the previous table as PatientRegisterUnpartitioned.
+-- // ─────────────────────────────────────
+-- // ─────────────────────────────────────
+
+CREATE TABLE PatientRegisterPartitioned (
+    uuid UUID NOT NULL DEFAULT uuid_generate_v4 (),
+    first_name VARCHAR(50) NOT NULL,
+    last_name VARCHAR(50) NOT NULL,
+    date_of_birth DATE NOT NULL CHECK (date_of_birth >= '1900-01-01' AND date_of_birth <= CURRENT_DATE),
+    email VARCHAR(254) NOT NULL,
+    phone_number VARCHAR(15) NOT NULL,
+    address VARCHAR(100) NOT NULL,
+    emergency_contact VARCHAR(50) NOT NULL,
+    allergies TEXT[] DEFAULT ARRAY[]::TEXT[],
+    medical_history TEXT[] DEFAULT ARRAY[]::TEXT[],
+    current_medications TEXT[] DEFAULT ARRAY[]::TEXT[],
+    PRIMARY KEY (uuid)
+) PARTITION BY HASH (uuid);
+
+DO $$
+BEGIN
+    FOR remainder IN 0..15 LOOP
+        EXECUTE format(
+            'CREATE TABLE PatientRegisterPartitioned_p%s PARTITION OF PatientRegisterPartitioned '
+            'FOR VALUES WITH (MODULUS 16, REMAINDER %s)',
+            lpad(remainder::text, 2, '0'), remainder
+        );
+    END LOOP;
+END $$;
+
+-- indexes of 04 - 06, created on every partition
+CREATE INDEX idx_patient_part_full_name_trgm ON PatientRegisterPartitioned USING GIN ((first_name || ' ' || last_name) gin_trgm_ops);
+
+CREATE INDEX idx_patient_part_first_name_trgm ON PatientRegisterPartitioned USING GIN (first_name gin_trgm_ops);
+
+CREATE INDEX idx_patient_part_last_name_trgm ON PatientRegisterPartitioned USING GIN (last_name gin_trgm_ops);
+
+CREATE INDEX idx_patient_part_email_trgm ON PatientRegisterPartitioned USING GIN (email gin_trgm_ops);
+
+CREATE INDEX idx_patient_part_phone_number_trgm ON PatientRegisterPartitioned USING GIN (phone_number gin_trgm_ops);
+
+CREATE INDEX idx_patient_part_allergies_gin ON PatientRegisterPartitioned USING GIN (allergies);
+
+CREATE INDEX idx_patient_part_medical_history_gin ON PatientRegisterPartitioned USING GIN (medical_history);
+
+CREATE INDEX idx_patient_part_current_medications_gin ON PatientRegisterPartitioned USING GIN (current_medications);
+
+CREATE INDEX idx_patient_part_first_name_uuid_list ON PatientRegisterPartitioned (first_name, uuid) INCLUDE (last_name, date_of_birth);
+
+CREATE INDEX idx_patient_part_last_name_uuid_list ON PatientRegisterPartitioned (last_name, uuid) INCLUDE (first_name, date_of_birth);
+
+CREATE INDEX idx_patient_part_date_of_birth_uuid_list ON PatientRegisterPartitioned (date_of_birth, uuid) INCLUDE (first_name, last_name);
+
+CREATE INDEX idx_patient_part_uuid_list ON PatientRegisterPartitioned (uuid) INCLUDE (first_name, last_name, date_of_birth);
+
+-- mirror the writes made during the backfill
+CREATE FUNCTION mirror_patient_register() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        DELETE FROM PatientRegisterPartitioned WHERE uuid = OLD.uuid;
+        RETURN OLD;
+    END IF;
+    IF TG_OP = 'UPDATE' AND NEW.uuid <> OLD.uuid THEN
+        DELETE FROM PatientRegisterPartitioned WHERE uuid = OLD.uuid;
+    END IF;
+    INSERT INTO PatientRegisterPartitioned (
+        uuid, first_name, last_name, date_of_birth, email, phone_number, address,
+        emergency_contact, allergies, medical_history, current_medications
+    ) VALUES (
+        NEW.uuid, NEW.first_name, NEW.last_name, NEW.date_of_birth, NEW.email, NEW.phone_number, NEW.address,
+        NEW.emergency_contact, NEW.allergies, NEW.medical_history, NEW.current_medications
+    )
+    ON CONFLICT (uuid) DO UPDATE SET
+        first_name = EXCLUDED.first_name,
+        last_name = EXCLUDED.last_name,
+        date_of_birth = EXCLUDED.date_of_birth,
+        email = EXCLUDED.email,
+        phone_number = EXCLUDED.phone_number,
+        address = EXCLUDED.address,
+        emergency_contact = EXCLUDED.emergency_contact,
+        allergies = EXCLUDED.allergies,
+        medical_history = EXCLUDED.medical_history,
+        current_medications = EXCLUDED.current_medications;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER mirror_patient_register
+    AFTER INSERT OR UPDATE OR DELETE ON PatientRegister
+    FOR EACH ROW EXECUTE FUNCTION mirror_patient_register();
+
+-- swap: PatientRegisterPartitioned becomes PatientRegister
+CREATE PROCEDURE swap_partitioned_patient_register() AS $$
+BEGIN
+    LOCK TABLE PatientRegister IN ACCESS EXCLUSIVE MODE;
+    DROP TRIGGER mirror_patient_register ON PatientRegister;
+    ALTER TABLE PatientRegister RENAME TO PatientRegisterUnpartitioned;
+    ALTER TABLE PatientRegisterPartitioned RENAME TO PatientRegister;
+END;
+$$ LANGUAGE plpgsql;
+
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM PatientRegister) THEN
+        CALL swap_partitioned_patient_register();
+        DROP TABLE PatientRegisterUnpartitioned;
+    END IF;
+END $$;
@@ -1,14 +1,39 @@
+"""Load generator for the patient register API.
 
-import time
-import requests
+Reuses the synthetic patient generators to drive a mixed create/search workload
+against a running server:
+
+- open loop (--rps > 0): requests start on a Poisson arrival schedule whatever
+  the server's speed, and latency is measured from the scheduled start so
+  queueing delay is not hidden (coordinated omission)
+- closed loop (--rps 0): --concurrency workers send back to back
+
+Searches pick a weighted Criteria template filled with the generator values.
+The report gives p50/p95/p99/max latency and throughput per operation, and
+--output saves it as JSON to --compare against later runs. --seed fixes the
+arrival schedule, the operation mix and the generated data (uuids stay random so
+runs can be repeated against the same database).
+
+    python create_patients_registration.py --rps 200 --duration 30 --mix create=1,search=4 --output run.json
+    python create_patients_registration.py --rps 200 --duration 30 --compare run.json
+    python create_patients_registration.py batch --requests 1000 --batch-size 500
+"""
+
+import argparse
+import asyncio
+import json
 import random
+import time
 import uuid
+from datetime import datetime, timezone
 
-# from concurrent.futures import ThreadPoolExecutor
+import httpx
 
-url = "http://localhost:8000/patient-register"
+base_url = "http://localhost:8000"
+url = "/patient-register"
+batch_url = "/patient-register/batch"
 total_requests = 1000
-# concurrency = 10000  # How many at once
+batch_size = 500
 
 first_name_list = [
     "Alice", "Bob", "Charlie", "Diana", "Ethan", "Fiona", "George", "Hannah",
@@ -142,32 +167,264 @@ def get_random_current_medications() -> list:
     return random.sample(current_medications, k=random.randint(0, 3))
 
 
-def register_patient(i):
-    for intent in range(i):
-        uuid_value = uuid.uuid4()
-        first_name = random.choice(first_name_list)
-        last_name = random.choice(last_name_list)
-        data = {
-            "uuid": str(uuid_value),
-            "first_name": first_name,
-            "last_name": last_name,
-            "date_of_birth": get_date_of_birth_random(),
-            "email": get_random_email(first_name, last_name),
-            "phone_number": get_random_phone_number(),
-            "address": random.choice(address_list),
-            "emergency_contact": get_random_emergency_contact(),
-            "allergies": get_random_allergies(),
-            "medical_history": get_random_medical_history(),
-            "current_medications": get_random_current_medications()
-        }
-        response = requests.post(url, json=data)
-        if response.status_code == 200:
-            print(f"Patient {intent} registered successfully.")
+def get_random_patient_data() -> dict:
+    uuid_value = uuid.uuid4()
+    first_name = random.choice(first_name_list)
+    last_name = random.choice(last_name_list)
+    return {
+        "uuid": str(uuid_value),
+        "first_name": first_name,
+        "last_name": last_name,
+        "date_of_birth": get_date_of_birth_random(),
+        "email": get_random_email(first_name, last_name),
+        "phone_number": get_random_phone_number(),
+        "address": random.choice(address_list),
+        "emergency_contact": get_random_emergency_contact(),
+        "allergies": get_random_allergies(),
+        "medical_history": get_random_medical_history(),
+        "current_medications": get_random_current_medications()
+    }
+
+
+def get_random_search_params(template: str) -> dict:
+    """Build the query string of a search Criteria template with generated values."""
+    if template == "last_name":
+        return {"0_field": "last_name", "0_operator": "EQUAL", "0_value": random.choice(last_name_list),
+                "page": 1, "per_page": 10}
+    if template == "full_name":
+        return {"0_field": "last_name", "0_operator": "EQUAL", "0_value": random.choice(last_name_list),
+                "1_field": "first_name", "1_operator": "EQUAL", "1_value": random.choice(first_name_list),
+                "page": 1, "per_page": 10}
+    if template == "range_ordered":
+        return {"0_field": "last_name", "0_operator": "LESS_THAN", "0_value": random.choice("BDHLMRTW"),
+                "orderBy": "last_name", "order": random.choice(["ASC", "DESC"]), "page": 1, "per_page": 20}
+    if template == "cursor":
+        return {"orderBy": "last_name", "order": "ASC", "per_page": 20, "cursor": ""}
+    raise ValueError(f"Unknown search template: {template}")
+
+
+# template -> weight, the share of searches using each Criteria shape
+search_templates = {"last_name": 5, "full_name": 3, "range_ordered": 1, "cursor": 1}
+
+
+def parse_weights(value: str) -> dict:
+    """Parse 'name=weight,...' into a dict of positive weights."""
+    weights = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        weights[name.strip()] = float(weight or 1)
+    if not weights or any(weight < 0 for weight in weights.values()) or sum(weights.values()) <= 0:
+        raise argparse.ArgumentTypeError(f"Invalid weights: {value}")
+    return weights
+
+
+def percentile(sorted_values: list, fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(fraction * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[rank]
+
+
+def build_schedule(args) -> list:
+    """Plan (start offset, operation label, request payload) for every request.
+
+    Payloads are generated here, in schedule order, so the seed decides them
+    rather than the order in which responses come back.
+    """
+    operations = list(args.mix)
+    operation_weights = [args.mix[name] for name in operations]
+    templates = list(args.search_mix)
+    template_weights = [args.search_mix[name] for name in templates]
+
+    schedule = []
+    offset = 0.0
+    while True:
+        if args.rps > 0:
+            # exponential inter-arrival times -> Poisson arrivals at the target rate
+            offset += random.expovariate(args.rps)
+            if offset > args.duration:
+                break
+        elif len(schedule) >= args.requests:
+            break
+        operation = random.choices(operations, operation_weights)[0]
+        if operation == "create":
+            schedule.append((offset, "create", get_random_patient_data()))
+        elif operation == "search":
+            template = random.choices(templates, template_weights)[0]
+            schedule.append((offset, f"search:{template}", get_random_search_params(template)))
+        else:
+            raise ValueError(f"Unknown operation: {operation}")
+    return schedule
+
+
+async def send(client: httpx.AsyncClient, operation: str, payload: dict) -> int:
+    """Send one request, returning its status code."""
+    if operation == "create":
+        response = await client.post(url, json=payload)
+    else:
+        response = await client.get(url, params=payload)
+    return response.status_code
+
+
+async def run_load(args) -> dict:
+    """Run the schedule and collect one sample per request."""
+    schedule = build_schedule(args)
+    samples = []
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=args.timeout) as client:
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+
+        async def one(scheduled: float, operation: str, payload: dict) -> None:
+            async with semaphore:
+                sent = loop.time()
+                try:
+                    status = await send(client, operation, payload)
+                    ok = 200 <= status < 300
+                except httpx.HTTPError as e:
+                    status, ok = type(e).__name__, False
+                done = loop.time()
+            samples.append({
+                "operation": operation,
+                # open loop -> from the scheduled start, queueing in the client included
+                "latency": done - (started + scheduled if args.rps > 0 else sent),
+                "service_time": done - sent,
+                "status": status,
+                "ok": ok,
+            })
+
+        tasks = []
+        if args.rps > 0:
+            for scheduled, operation, payload in schedule:
+                delay = started + scheduled - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                tasks.append(asyncio.create_task(one(scheduled, operation, payload)))
         else:
-            print(
-                f"Failed to register patient {intent}. Status code: {response.status_code}")
-        # time.sleep(4)
+            queue = list(reversed(schedule))
+
+            async def worker() -> None:
+                while queue:
+                    scheduled, operation, payload = queue.pop()
+                    await one(scheduled, operation, payload)
+
+            tasks = [asyncio.create_task(worker()) for _ in range(args.concurrency)]
+        await asyncio.gather(*tasks)
+        elapsed = loop.time() - started
+
+    return summarize(samples, elapsed)
+
+
+def summarize(samples: list, elapsed: float) -> dict:
+    """Aggregate the samples per operation and overall."""
+    groups = {"all": samples}
+    for sample in samples:
+        groups.setdefault(sample["operation"].split(":")[0], []).append(sample)
+        if ":" in sample["operation"]:
+            groups.setdefault(sample["operation"], []).append(sample)
+
+    summary = {}
+    for name, group in sorted(groups.items()):
+        latencies = sorted(sample["latency"] for sample in group)
+        service_times = sorted(sample["service_time"] for sample in group)
+        errors = {}
+        for sample in group:
+            if not sample["ok"]:
+                errors[str(sample["status"])] = errors.get(str(sample["status"]), 0) + 1
+        summary[name] = {
+            "count": len(group),
+            "errors": errors,
+            "throughput_rps": len(group) / elapsed if elapsed else 0.0,
+            "latency_ms": {
+                "p50": percentile(latencies, 0.50) * 1000,
+                "p95": percentile(latencies, 0.95) * 1000,
+                "p99": percentile(latencies, 0.99) * 1000,
+                "max": (latencies[-1] if latencies else 0.0) * 1000,
+            },
+            "service_time_p99_ms": percentile(service_times, 0.99) * 1000,
+        }
+    return {"elapsed_seconds": elapsed, "operations": summary}
+
+
+def print_report(result: dict, baseline: dict = None) -> None:
+    """Print one line per operation, with the change against a baseline run when given."""
+    print(f"{'operation':<28}{'count':>8}{'errors':>8}{'rps':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}  (ms)")
+    for name, stats in result["operations"].items():
+        latency = stats["latency_ms"]
+        print(f"{name:<28}{stats['count']:>8}{sum(stats['errors'].values()):>8}{stats['throughput_rps']:>9.1f}"
+              f"{latency['p50']:>9.2f}{latency['p95']:>9.2f}{latency['p99']:>9.2f}{latency['max']:>9.2f}")
+        previous = (baseline or {}).get("operations", {}).get(name)
+        if previous:
+            deltas = [
+                f"{key} {(latency[key] - previous['latency_ms'][key]) / previous['latency_ms'][key] * 100:+.1f}%"
+                for key in ("p50", "p95", "p99") if previous["latency_ms"][key]
+            ]
+            print(f"{'':<28}vs baseline: {', '.join(deltas)}")
+
+
+def register_patient_batch(i, size, base=base_url):
+    start = time.perf_counter()
+    with httpx.Client(base_url=base, timeout=60) as client:
+        for offset in range(0, i, size):
+            batch = [get_random_patient_data() for _ in range(min(size, i - offset))]
+            response = client.post(batch_url, json=batch)
+            if response.status_code == 200:
+                errors = response.json()["data"]["errors"]
+                print(f"Batch {offset // size} registered ({len(batch) - len(errors)} ok, {len(errors)} rejected).")
+            else:
+                print(
+                    f"Failed to register batch {offset // size}. Status code: {response.status_code}")
+    elapsed = time.perf_counter() - start
+    print(f"Batch of {size}: {i} rows in {elapsed:.2f}s ({i / elapsed:.1f} rows/s)")
     return
 
 
-register_patient(total_requests)
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("mode", nargs="?", choices=["load", "batch"], default="load")
+    parser.add_argument("--base-url", default=base_url)
+    parser.add_argument("--rps", type=float, default=100.0, help="target arrival rate, 0 for closed loop")
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds of arrivals (open loop)")
+    parser.add_argument("--requests", type=int, default=total_requests, help="requests (closed loop and batch)")
+    parser.add_argument("--concurrency", type=int, default=64, help="max requests in flight")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--mix", type=parse_weights, default=parse_weights("create=1,search=4"))
+    parser.add_argument("--search-mix", type=parse_weights, default=dict(search_templates))
+    parser.add_argument("--batch-size", type=int, default=batch_size)
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--output", help="save the results as JSON")
+    parser.add_argument("--compare", help="JSON results of a previous run to compare against")
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    if args.mode == "batch":
+        register_patient_batch(args.requests, args.batch_size, args.base_url)
+        return
+
+    started_at = datetime.now(timezone.utc).isoformat()
+    result = asyncio.run(run_load(args))
+    result = {
+        "started_at": started_at,
+        "config": {
+            "base_url": args.base_url, "rps": args.rps, "duration": args.duration, "requests": args.requests,
+            "concurrency": args.concurrency, "mix": args.mix, "search_mix": args.search_mix, "seed": args.seed,
+        },
+        **result,
+    }
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+    print_report(result, baseline)
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(result, file, indent=2)
+        print(f"Results saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()